@@ -10,6 +10,18 @@ which has 4 primary responsibilities:
   wrapped object through a pass through ``__getattr__``
 * Implements a ``__repr__()`` for consistent object representation
 
+Wrappers whose detailed ``__repr__`` queries the Revit API (:any:`View`,
+:any:`FamilyInstance`, :any:`Collector` and :any:`ParameterSet`) use a
+lightweight repr by default, with only the class, id and name, so printing
+a list with thousands of them stays fast. The detailed repr is opt-in:
+
+>>> wrapped_view
+<rpw:ViewPlan [name:Level 1] [id:312]>
+>>> wrapped_view.full_repr()
+<rpw:ViewPlan [view_name:Level 1] [view_type:FloorPlan] ...>
+>>> wrapped_view.rich_repr = True  # This instance only
+>>> BaseObjectWrapper.rich_repr = True  # All instances
+
 Because access to original methods and properties is maintained, you can keep
 the elements wrapped throughout your code. You would only need to unwrap when
 when passing the element into function where the original Type is expected.
@@ -115,6 +127,29 @@ class BaseObjectWrapper(BaseObject):
         """ Returns the Original Wrapped Element """
         return self._revit_object
 
+    #: If ``False``, wrappers with an expensive ``__repr__`` use a
+    #: lightweight repr. Can be set on an instance or on the class.
+    rich_repr = False
+
+    def full_repr(self):
+        """
+        Returns the detailed repr of wrappers that use a lightweight
+        ``__repr__``. It is only built once per instance.
+        """
+        try:
+            return self.__dict__['_full_repr']
+        except KeyError:
+            full_repr = self._build_full_repr()
+            if full_repr is None:
+                return self.__repr__()
+            object.__setattr__(self, '_full_repr', full_repr)
+            return full_repr
+
+    def _build_full_repr(self):
+        """ Returns the detailed repr of wrappers that use a lightweight
+        ``__repr__``, or ``None`` if ``__repr__`` is already detailed """
+        return None
+
     def __repr__(self, data={}, to_string=None):
         """ ToString can be overriden for objects in which the method is
         not consistent - ie. XYZ.ToString returns pt tuple not Class Name """
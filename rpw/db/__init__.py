@@ -18,25 +18,35 @@ from rpw.db.spatial_element import Room, Area, AreaScheme
 
 from rpw.db.view import View, ViewPlan, ViewSheet, ViewSection
 from rpw.db.view import ViewSchedule, View3D
-from rpw.db.view import ViewFamilyType
+from rpw.db.view import ViewFamilyType, ViewIndex
 from rpw.db.view import ViewFamily, ViewType, ViewPlanType  # Enums
 
 from rpw.db.pattern import LinePatternElement, FillPatternElement
 
 from rpw.db.parameter import Parameter, ParameterSet
+from rpw.db.units import UnitConverter
 from rpw.db.builtins import BicEnum, BipEnum
 
-from rpw.db.xyz import XYZ
+from rpw.db.xyz import XYZ, Vec3
 from rpw.db.curve import Curve, Line, Ellipse, Circle, Arc
-from rpw.db.transform import Transform
+from rpw.db.transform import Transform, TransformMatrix
 from rpw.db.bounding_box import BoundingBox
 
 from rpw.db.reference import Reference
 
 from rpw.db.collection import ElementSet, ElementCollection
-from rpw.db.collection import XyzCollection
+from rpw.db.collection import XyzCollection, IdBitmap
 
 from rpw.db.collector import Collector, ParameterFilter
-from rpw.db.transaction import Transaction, TransactionGroup
+from rpw.db.spatial_index import SpatialIndex
+from rpw.db.clashes import clash, Clash
+from rpw.db.transaction import Transaction, TransactionGroup, BatchedTransaction
+from rpw.db.failures import FailureReport
+from rpw.db.write_queue import WriteQueue
+from rpw.db import bulk
+from rpw.db.bulk import change_types
+
+from rpw.db import export
+from rpw.db import metrics
 
 __all__ = [cls for cls in locals().values() if isinstance(cls, type)]
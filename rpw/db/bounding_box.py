@@ -1,45 +1,77 @@
+""" BoundingBox Wrapper """
+
 import rpw
 from rpw import revit, DB
 from rpw.base import BaseObjectWrapper
+from rpw.exceptions import RpwCoerceError
 
 
 class BoundingBox(BaseObjectWrapper):
+    """
+    `DB.BoundingBoxXYZ` Wrapper
+
+    >>> bbox = BoundingBox(some_element)
+    >>> bbox.min
+    <rpw:XYZ % DB.XYZ: 0,0,0>
+    >>> bbox.average
+    <rpw:XYZ % DB.XYZ: 5,5,5>
+    >>> bbox.as_tuple
+    (0.0, 0.0, 0.0, 10.0, 10.0, 10.0)
+
+    Note:
+        Transforms of the wrapped ``DB.BoundingBoxXYZ`` are ignored.
+        Element bounding boxes are in model coordinates.
+
+    Attributes:
+        _revit_object (DB.BoundingBoxXYZ): Wrapped ``DB.BoundingBoxXYZ``
+    """
+
+    _revit_object_class = DB.BoundingBoxXYZ
+
+    def __init__(self, bbox_or_element, view=None):
+        """
+        Args:
+            bbox_or_element (``DB.BoundingBoxXYZ``, ``DB.Element``): Bounding
+                Box, or Element to get Bounding Box from
+            view (``DB.View``, optional): View used to get the Bounding Box
+                of an Element [default: None, model bounding box]
+        """
+        bbox_or_element = getattr(bbox_or_element, '_revit_object',
+                                  bbox_or_element)
+        if isinstance(bbox_or_element, DB.Element):
+            view = getattr(view, '_revit_object', view)
+            bbox = bbox_or_element.get_BoundingBox(view)
+            if bbox is None:
+                raise RpwCoerceError(bbox_or_element, 'element with bounding box')
+        else:
+            bbox = bbox_or_element
+        super(BoundingBox, self).__init__(bbox)
+
+    @property
+    def min(self):
+        """ Min point (:any:`XYZ`) """
+        return rpw.db.XYZ(self._revit_object.Min)
+
+    @property
+    def max(self):
+        """ Max point (:any:`XYZ`) """
+        return rpw.db.XYZ(self._revit_object.Max)
+
+    @property
+    def average(self):
+        """ Center point (:any:`XYZ`) """
+        return rpw.db.XYZ((self._revit_object.Min + self._revit_object.Max) / 2)
+
+    @property
+    def as_tuple(self):
+        """
+        Returns:
+            (``tuple``): (min_x, min_y, min_z, max_x, max_y, max_z)
+        """
+        bbox_min, bbox_max = self._revit_object.Min, self._revit_object.Max
+        return (bbox_min.X, bbox_min.Y, bbox_min.Z,
+                bbox_max.X, bbox_max.Y, bbox_max.Z)
 
-#     """ BoundingBoxElement receives a Revit Object for access to properties.
-#     Usage:
-#     bbox = BoundingBoxElement(element)
-#     bbox.element: element
-#     Properties:
-#     bbox.min: min coordinate of bounding box
-#     bbox.max: min coordinate of bounding box
-#     bbox.average: min coordinate of bounding box
-#     """
-#
-    def __init__(self, element):
-        raise NotImplemented
-#         self.element = element
-#         self.bbox = element.get_BoundingBox(revit.doc.ActiveView)
-#
-#     @property
-#     def min(self):
-#         x, y, z = self.bbox.Min.X, self.bbox.Min.Y, self.bbox.Min.Z
-#         return PointElement(x, y, z)
-#
-#     @property
-#     def max(self):
-#         x, y, z = self.bbox.Max.X, self.bbox.Max.Y, self.bbox.Max.Z
-#         return PointElement(x, y, z)
-#
-#     @property
-#     def average(self):
-#         return PointCollection(self.min, self.max).average
-#
-#     def __repr__(self):
-#         return '<BB: MIN{} MAX={} CENTER={}>'.format(self.min, self.max,
-#                                                      self.center)
-#
-#     def __str__(self):
-#         return repr(self)
-#
-# class Curve():
-#     pass
+    def __repr__(self):
+        return super(BoundingBox, self).__repr__(data={'min': self.min.as_tuple,
+                                                       'max': self.max.as_tuple})
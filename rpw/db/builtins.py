@@ -4,6 +4,10 @@
 Revit.DB.BuiltInParameter.WALL_LOCATION_LINE
 >>> BipEnum.get_id('WALL_LOCATION_LINE')
 Revit.DB.ElementId
+>>> BipEnum.get_name(-1001002)
+'WALL_LOCATION_LINE'
+>>> BipEnum.get_label('WALL_LOCATION_LINE')
+'Location Line'
 
 Note:
     These classes were created to be used internally,
@@ -13,13 +17,172 @@ Note:
 ----------------------------------------------------------------
 """ ###
 
-import re
+import os
+import json
+import tempfile
+
 from rpw import revit, DB
 from rpw.base import BaseObject, BaseObjectWrapper
 from rpw.utils.dotnet import Enum
+from rpw.utils.logger import logger
 from rpw.exceptions import RpwCoerceError
 
 
+class EnumTable(BaseObject):
+    """
+    Table of all members of a Built In enumeration, with their name,
+    integer value, localized label and storage type.
+
+    The table is generated the first time it is used and saved to a cache
+    file for the running Revit version and language, so later sessions
+    load it with a single file read.
+    Storage types of ``BuiltInParameter`` members can only be read with a
+    document open. Tables generated without a document are not saved, and
+    are generated again once a document is open.
+
+    >>> table = EnumTable(DB.BuiltInParameter)
+    >>> table.get_name(-1001002)
+    'WALL_LOCATION_LINE'
+    >>> table.get_value('WALL_LOCATION_LINE')
+    -1001002
+    >>> table.get_label('WALL_LOCATION_LINE')
+    'Location Line'
+
+    Args:
+        enum_type (``DB.BuiltInParameter``, ``DB.BuiltInCategory``): Enumeration
+    """
+
+    # Bump if the format of cache files changes
+    CACHE_FORMAT = 1
+
+    def __init__(self, enum_type):
+        self.enum_type = enum_type
+        self.enum_name = enum_type.__name__
+        self._rows = None
+        self._by_name = None
+        self._by_value = None
+
+    @property
+    def path(self):
+        """ Path of the cache file for the running Revit version """
+        app = revit.app
+        filename = 'rpw_{}_{}_{}_{}.json'.format(self.enum_name,
+                                                 app.VersionNumber,
+                                                 app.VersionBuild,
+                                                 app.Language)
+        cache_dir = os.getenv('APPDATA') or tempfile.gettempdir()
+        return os.path.join(cache_dir, 'rpw', filename)
+
+    @property
+    def rows(self):
+        """ List of [name, value, label, storage_type] rows """
+        if self._rows is None:
+            self._load()
+        return self._rows
+
+    def _load(self):
+        rows = self._read()
+        if rows is None:
+            rows = self._generate()
+            if self._is_complete(rows):
+                self._write(rows)
+        self._rows = rows
+        # Some members share values. Reverse lookups use the first name.
+        self._by_value = {}
+        self._by_name = {}
+        for row in rows:
+            self._by_name[row[0]] = row
+            self._by_value.setdefault(row[1], row)
+
+    def _read(self):
+        try:
+            with open(self.path) as fp:
+                data = json.load(fp)
+        except (IOError, OSError, ValueError):
+            return None
+        if data.get('format') != EnumTable.CACHE_FORMAT:
+            return None
+        if not self._is_complete(data['rows']):
+            return None
+        return data['rows']
+
+    def _is_complete(self, rows):
+        """ False if rows of BuiltInParameter have no storage types,
+        ie. table was generated without a document open """
+        if self.enum_type is not DB.BuiltInParameter:
+            return True
+        return any([row[3] for row in rows])
+
+    def _write(self, rows):
+        path = self.path
+        try:
+            if not os.path.isdir(os.path.dirname(path)):
+                os.makedirs(os.path.dirname(path))
+            with open(path, 'w') as fp:
+                json.dump({'format': EnumTable.CACHE_FORMAT, 'rows': rows}, fp)
+        except (IOError, OSError) as errmsg:
+            logger.warning('Could not save enum cache: {}'.format(errmsg))
+
+    def _generate(self):
+        logger.debug('Generating enum table: {}'.format(self.enum_name))
+        is_parameter = self.enum_type is DB.BuiltInParameter
+        doc = revit.doc
+        rows = []
+        for name in Enum.GetNames(self.enum_type):
+            member = getattr(self.enum_type, name)
+            value = int(member)
+            try:
+                label = DB.LabelUtils.GetLabelFor(member)
+            except Exception:
+                label = None
+            storage_type = None
+            if is_parameter and doc:
+                try:
+                    storage_type = doc.get_TypeOfStorage(member).ToString()
+                except Exception:
+                    pass
+            rows.append([name, value, label, storage_type])
+        return rows
+
+    def _get_row(self, name_or_value):
+        if self._rows is None:
+            self._load()
+        if hasattr(name_or_value, 'IntegerValue'):
+            name_or_value = name_or_value.IntegerValue
+        if isinstance(name_or_value, int):
+            return self._by_value.get(name_or_value)
+        return self._by_name.get(str(name_or_value))
+
+    def get_name(self, value):
+        """ Returns name of member from its value or ElementId, or None """
+        row = self._get_row(value)
+        return row[0] if row else None
+
+    def get_value(self, name):
+        """ Returns integer value of member from its name, or None """
+        row = self._get_row(name)
+        return row[1] if row else None
+
+    def get_label(self, name_or_value):
+        """ Returns localized label of member, or None """
+        row = self._get_row(name_or_value)
+        return row[2] if row else None
+
+    def get_storage_type(self, name_or_value):
+        """ Returns name of storage type (BuiltInParameter only), or None """
+        if self._rows is not None and revit.doc and \
+                not self._is_complete(self._rows):
+            self._rows = None
+        row = self._get_row(name_or_value)
+        return row[3] if row else None
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __repr__(self):
+        return super(EnumTable, self).__repr__(data={'enum': self.enum_name})
+
+
 class _BiParameter(BaseObjectWrapper):
     """
     BuiltInParameter Wrapper
@@ -69,6 +232,35 @@ class _BiParameter(BaseObjectWrapper):
         enum = self.get(parameter_name)
         return DB.ElementId(enum)
 
+    def from_id(self, parameter_id):
+        """
+        Gets Built In Parameter from its ElementId or integer value
+
+        Args:
+            parameter_id(``DB.ElementId``, ``int``): Id of Built In Parameter
+
+        Returns:
+            ``DB.BuiltInParameter``: BuiltInParameter Enumeration Member
+        """
+        parameter_name = bip_table.get_name(parameter_id)
+        if parameter_name is None:
+            raise RpwCoerceError(parameter_id, DB.BuiltInParameter)
+        return self.get(parameter_name)
+
+    def get_name(self, parameter_id):
+        """ Gets name of Built In Parameter from its ElementId or value.
+        See :any:`EnumTable` """
+        return bip_table.get_name(parameter_id)
+
+    def get_label(self, parameter_name):
+        """ Gets localized label of Built In Parameter. See :any:`EnumTable` """
+        return bip_table.get_label(parameter_name)
+
+    def get_storage_type(self, parameter_name):
+        """ Gets name of StorageType of Built In Parameter.
+        See :any:`EnumTable` """
+        return bip_table.get_storage_type(parameter_name)
+
     def __repr__(self):
         return super(_BiParameter, self).__repr__(to_string='Autodesk.Revit.DB.BuiltInParameter')
 
@@ -90,6 +282,7 @@ class _BiCategory(BaseObjectWrapper):
     def __init__(self):
         super(_BiCategory, self).__init__(DB.BuiltInCategory,
                                           enforce_type=False)
+        self._fuzzy_index = None
 
     def get(self, category_name):
         """ Gets Built In Category by Name
@@ -118,20 +311,74 @@ class _BiCategory(BaseObjectWrapper):
         >>> BiCategory.fuzzy_get('rooms')
         < BuiltInCategory >
 
+        Names are looked up on an index of normalized names (see
+        :func:`fuzzy_index`), which is only built once.
+
         Args:
             ``str``: Name of Category
 
         Returns:
             ``DB.BuiltInCategory``: BuiltInCategory Enumeration Member
         """
-        loose_category_name = loose_category_name.replace(' ', '').lower()
-        loose_category_name = loose_category_name.replace('ost_', '')
-        for category_name in dir(DB.BuiltInCategory):
-            exp = '(OST_)({})$'.format(loose_category_name)
-            if re.search(exp, category_name, re.IGNORECASE):
-                return self.get(category_name)
+        category_name = self.fuzzy_index.get(_normalize(loose_category_name))
+        if category_name:
+            return self.get(category_name)
         # If not Found Try regular method, handle error
-        return self.get(loose_category_name)
+        try:
+            return self.get(loose_category_name)
+        except RpwCoerceError:
+            suggestions = self.suggest(loose_category_name)
+            if suggestions:
+                loose_category_name = '{} (did you mean: {})'.format(
+                                loose_category_name, ', '.join(suggestions))
+            raise RpwCoerceError(loose_category_name, DB.BuiltInCategory)
+
+    @property
+    def fuzzy_index(self):
+        """ Index of normalized names of all BuiltInCategory members.
+        Names are lower case, without spaces or the OST_ prefix.
+
+        >>> BiCategory.fuzzy_index['rooms']
+        'OST_Rooms'
+
+        Returns:
+            ``dict``: {normalized_name: category_name}
+        """
+        if self._fuzzy_index is None:
+            fuzzy_index = {}
+            for category_name in Enum.GetNames(DB.BuiltInCategory):
+                if not category_name.startswith('OST_'):
+                    continue
+                fuzzy_index.setdefault(_normalize(category_name),
+                                       category_name)
+            self._fuzzy_index = fuzzy_index
+        return self._fuzzy_index
+
+    def suggest(self, loose_category_name, limit=5):
+        """ Suggests Built In Category names for a misspelled name.
+        Names that start with the normalized name are listed first,
+        followed by names that contain it.
+
+        >>> BiCategory.suggest('wal')
+        ['OST_Walls', 'OST_WallAnalytical', ...]
+
+        Args:
+            loose_category_name (``str``): Name of Category
+            limit (``int``): Max number of suggestions [default: 5]
+
+        Returns:
+            ``list``: BuiltInCategory names
+        """
+        normalized_name = _normalize(loose_category_name)
+        if not normalized_name:
+            return []
+        starts, contains = [], []
+        for key in sorted(self.fuzzy_index):
+            if key.startswith(normalized_name):
+                starts.append(self.fuzzy_index[key])
+            elif normalized_name in key:
+                contains.append(self.fuzzy_index[key])
+        return (starts + contains)[:limit]
 
     def get_id(self, category_name):
         """ Gets ElementId of Category by name
@@ -155,20 +402,40 @@ class _BiCategory(BaseObjectWrapper):
         Returns:
             ``DB.BuiltInCategory`` member
         """
-        bic = Enum.ToObject(DB.BuiltInCategory, category_id.IntegerValue)
-        if DB.ElementId(bic).IntegerValue < -1:
-            return bic
-        else:
-            # If you pass a regular element to category_id, it converts it to BIC.
-            # It should fail, because result is not a valid Category Enum
+        category_name = None
+        if category_id.IntegerValue < -1:
+            category_name = bic_table.get_name(category_id)
+        if category_name is None:
+            # If you pass a regular element to category_id, it is not a
+            # valid Category Enum
             raise RpwCoerceError('category_id: {}'.format(category_id),
                                  DB.BuiltInCategory)
+        return self.get(category_name)
         # Similar to: Category.GetCategory(doc, category.Id).Name
 
+    def get_name(self, category_id):
+        """ Gets name of Built In Category from its ElementId or value.
+        See :any:`EnumTable` """
+        return bic_table.get_name(category_id)
+
+    def get_label(self, category_name):
+        """ Gets localized label of Built In Category. See :any:`EnumTable` """
+        return bic_table.get_label(category_name)
+
     def __repr__(self):
         return super(_BiCategory, self).__repr__(to_string='Autodesk.Revit.DB.BuiltInCategory')
 
 
+def _normalize(category_name):
+    """ Normalizes names for fuzzy lookup: 'OST_Rooms' > 'rooms' """
+    category_name = category_name.replace(' ', '').lower()
+    return category_name.replace('ost_', '')
+
+
+# Tables are loaded on first use
+bip_table = EnumTable(DB.BuiltInParameter)
+bic_table = EnumTable(DB.BuiltInCategory)
+
 # Classes should already be instantiated
 BiParameter = _BiParameter()
 BiCategory = _BiCategory()
@@ -0,0 +1,303 @@
+"""
+Bulk Operations
+
+Functions that apply an edit to many elements with one Revit API call,
+using the ``ICollection<ElementId>`` overloads of the API, instead of one
+call (and one regeneration) per element.
+
+>>> from rpw import db
+>>> walls = db.Collector(of_class='Wall', is_not_type=True)
+>>> with db.Transaction('Change Wall Types'):
+...     id_map = db.change_types(walls, 'Generic - 200mm')
+...     new_ids, id_map = db.bulk.copy(walls, (0, 0, 10))
+...     db.bulk.move(walls, (10, 0, 0))
+
+The same operations are available on :any:`ElementSet` and
+:any:`Collector`:
+
+>>> db.Collector(of_class='Wall', is_not_type=True).move((10, 0, 0))
+
+Copies are returned as ``(new_ids, id_map)``. Revit does not return copies
+in the order of the source ids, so ``id_map`` is empty unless ``map_ids=True``
+is used. Elements are then copied one call per element, and each copy is
+matched to its source among the elements copied with it (ie. hosted
+elements). Sources whose copy can not be identified are left out of the
+map, and logged.
+
+Note:
+    These functions do not start a :any:`Transaction`.
+
+"""  #
+
+import math
+from collections import OrderedDict
+
+from rpw import revit, DB
+from rpw.exceptions import RpwCoerceError
+from rpw.utils.coerce import to_element_id, to_element_id_list, to_xyz_tuple
+from rpw.utils.dotnet import List
+from rpw.utils.logger import logger
+
+
+def change_types(elements, type_reference, doc=revit.doc):
+    """
+    Changes the type of many elements using
+    ``Element.ChangeTypeId(doc, ICollection<ElementId>, ElementId)``.
+    Elements are grouped by target type, so there is one API call per type.
+
+    >>> db.change_types(walls, 'Generic - 200mm')
+    {<ElementId 1234>: <ElementId 1234>, ...}
+    >>> db.change_types(walls, lambda wall: types[wall.Name])
+
+    Args:
+        elements (``[DB.Element]``, ``[DB.ElementId]``): Elements or ids
+        type_reference (``DB.ElementType``, ``DB.ElementId``, ``str``,
+            ``callable``): New type. Names are matched against the
+            element's valid types. If a callable is provided, it is called
+            with each ``DB.Element`` and should return a type reference.
+            Each distinct reference is only resolved once, names once
+            per current type of the elements, since elements of different
+            categories can have types with the same name.
+        doc (``DB.Document``, optional): Document [default: revit.doc]
+
+    Returns:
+        (``dict``): ``{old ElementId: new ElementId}`` as returned by the API.
+        Ids only change for elements that were replaced.
+    """
+    resolved = {}
+    groups = OrderedDict()
+    for element in elements:
+        element = getattr(element, '_revit_object', element)
+        if callable(type_reference):
+            if not isinstance(element, DB.Element):
+                element = doc.GetElement(to_element_id(element))
+            reference = type_reference(element)
+        else:
+            reference = type_reference
+        reference = getattr(reference, '_revit_object', reference)
+
+        if isinstance(reference, str):
+            if not isinstance(element, DB.Element):
+                element = doc.GetElement(to_element_id(element))
+            key = (reference, element.GetTypeId().IntegerValue)
+        else:
+            key = to_element_id(reference).IntegerValue
+        try:
+            type_id = resolved[key]
+        except KeyError:
+            type_id = resolved[key] = _to_type_id(reference, element, doc)
+
+        group = groups.setdefault(type_id.IntegerValue, (type_id, []))
+        group[1].append(to_element_id(element))
+
+    id_map = {}
+    for type_id, element_ids in groups.values():
+        changed = DB.Element.ChangeTypeId(doc, List[DB.ElementId](element_ids),
+                                          type_id)
+        for pair in changed:
+            id_map[pair.Key] = pair.Value
+    logger.debug('Changed types of {} elements with {} calls'.format(
+                 sum([len(ids) for _, ids in groups.values()]), len(groups)))
+    return id_map
+
+
+def _to_type_id(type_reference, element, doc):
+    """ Returns ElementId of type. Names are looked up in valid types """
+    if not isinstance(type_reference, str):
+        return to_element_id(type_reference)
+    if not isinstance(element, DB.Element):
+        element = doc.GetElement(to_element_id(element))
+    for type_id in element.GetValidTypes():
+        element_type = doc.GetElement(type_id)
+        if element_type.Name.lower() == type_reference.lower():
+            return type_id
+    raise RpwCoerceError(type_reference, 'ElementType')
+
+
+def delete(elements, doc=revit.doc):
+    """
+    Deletes elements with a single ``doc.Delete(ICollection<ElementId>)``
+
+    Args:
+        elements (``[DB.Element]``, ``[DB.ElementId]``): Elements or ids
+        doc (``DB.Document``, optional): Document [default: revit.doc]
+
+    Returns:
+        (``list``): Ids of all deleted elements, including dependent elements
+    """
+    element_ids = to_element_id_list(elements)
+    if not element_ids.Count:
+        return []
+    return list(doc.Delete(element_ids))
+
+
+def copy(elements, vector_or_transform, to_doc=None, doc=revit.doc,
+         map_ids=False):
+    """
+    Copies elements with a single ``ElementTransformUtils.CopyElements``
+
+    >>> new_ids, id_map = db.bulk.copy(walls, (0, 0, 10))
+    >>> new_ids, id_map = db.bulk.copy(walls, transform, to_doc=other_doc)
+    >>> new_ids, id_map = db.bulk.copy(walls, (0, 0, 10), map_ids=True)
+
+    Args:
+        elements (``[DB.Element]``, ``[DB.ElementId]``): Elements or ids
+        vector_or_transform (``point-like``, ``DB.Transform``, :any:`Transform`,
+            :any:`TransformMatrix`): Translation, or Transform applied to
+            the copies
+        to_doc (``DB.Document``, optional): Document to copy to
+            [default: same document]
+        doc (``DB.Document``, optional): Document [default: revit.doc]
+        map_ids (``bool``, optional): Map each source id to its copy.
+            Elements are copied one call per element. [default: False]
+
+    Returns:
+        (``tuple``): ``([new ElementId], {source ElementId: new ElementId})``.
+        The map is empty unless ``map_ids`` is ``True``.
+    """
+    element_ids = to_element_id_list(elements)
+    if not element_ids.Count:
+        return [], OrderedDict()
+    transform = _to_transform(vector_or_transform)
+    ElementTransformUtils = DB.ElementTransformUtils
+    if transform is None and to_doc is None:
+        vector = DB.XYZ(*to_xyz_tuple(vector_or_transform))
+
+        def copy_elements(ids):
+            return ElementTransformUtils.CopyElements(doc, ids, vector)
+    else:
+        if transform is None:
+            transform = DB.Transform.CreateTranslation(
+                        DB.XYZ(*to_xyz_tuple(vector_or_transform)))
+
+        def copy_elements(ids):
+            return ElementTransformUtils.CopyElements(
+                        doc, ids, to_doc or doc, transform, DB.CopyPasteOptions())
+    return _copy(element_ids, copy_elements, map_ids, doc, to_doc or doc)
+
+
+def move(elements, vector, doc=revit.doc):
+    """
+    Moves elements with a single ``ElementTransformUtils.MoveElements``
+
+    Args:
+        elements (``[DB.Element]``, ``[DB.ElementId]``): Elements or ids
+        vector (``point-like``): Translation
+        doc (``DB.Document``, optional): Document [default: revit.doc]
+    """
+    element_ids = to_element_id_list(elements)
+    if element_ids.Count:
+        DB.ElementTransformUtils.MoveElements(
+                        doc, element_ids, DB.XYZ(*to_xyz_tuple(vector)))
+
+
+def rotate(elements, axis, angle, radians=False, doc=revit.doc):
+    """
+    Rotates elements with a single ``ElementTransformUtils.RotateElements``
+
+    >>> db.bulk.rotate(columns, (0, 0, 0), 90)
+
+    Args:
+        elements (``[DB.Element]``, ``[DB.ElementId]``): Elements or ids
+        axis (``DB.Line``, :any:`Line`, ``point-like``): Axis of rotation.
+            If a point is provided, a vertical axis through the point is used.
+        angle (``float``): Rotation in degrees
+        radians (``bool``, optional): True if angle is in radians
+            [default: False]
+        doc (``DB.Document``, optional): Document [default: revit.doc]
+    """
+    element_ids = to_element_id_list(elements)
+    if not element_ids.Count:
+        return
+    axis = getattr(axis, '_revit_object', axis)
+    if not isinstance(axis, DB.Line):
+        x, y, z = to_xyz_tuple(axis)
+        axis = DB.Line.CreateBound(DB.XYZ(x, y, z), DB.XYZ(x, y, z + 1.0))
+    angle = angle if radians else math.radians(angle)
+    DB.ElementTransformUtils.RotateElements(doc, element_ids, axis, angle)
+
+
+def mirror(elements, plane, copy=True, doc=revit.doc, map_ids=False):
+    """
+    Mirrors elements with a single ``ElementTransformUtils.MirrorElements``
+
+    Args:
+        elements (``[DB.Element]``, ``[DB.ElementId]``): Elements or ids
+        plane (``DB.Plane``): Mirror Plane
+        copy (``bool``): Mirror copies of the elements, and keep the
+            original elements [default: True]
+        doc (``DB.Document``, optional): Document [default: revit.doc]
+        map_ids (``bool``, optional): Map each source id to its mirrored
+            copy. Elements are mirrored one call per element. [default: False]
+
+    Returns:
+        (``tuple``): ``([new ElementId], {source ElementId: new ElementId})``.
+        Both are empty if ``copy`` is ``False``.
+    """
+    element_ids = to_element_id_list(elements)
+    if not element_ids.Count:
+        return [], OrderedDict()
+    if not copy:
+        DB.ElementTransformUtils.MirrorElements(doc, element_ids, plane, False)
+        return [], OrderedDict()
+
+    def mirror_elements(ids):
+        return DB.ElementTransformUtils.MirrorElements(doc, ids, plane, True)
+    return _copy(element_ids, mirror_elements, map_ids, doc, doc)
+
+
+def _to_transform(reference):
+    """ Returns ``DB.Transform``, or ``None`` if reference is a vector """
+    if hasattr(reference, 'to_transform'):
+        return reference.to_transform()
+    reference = getattr(reference, '_revit_object', reference)
+    if isinstance(reference, DB.Transform):
+        return reference
+    return None
+
+
+def _copy(element_ids, copy_elements, map_ids, doc, to_doc):
+    """
+    Calls ``copy_elements(ids)`` and returns (new_ids, {source id: new id}).
+    The order of the ids returned by Revit is not guaranteed, so to map ids
+    each element is copied on its own, and matched to its copy among the
+    elements copied with it (ie. hosted elements).
+    """
+    if not map_ids:
+        return list(copy_elements(element_ids) or []), OrderedDict()
+    new_ids = []
+    id_map = OrderedDict()
+    unmatched = []
+    for element_id in element_ids:
+        copied_ids = list(copy_elements(List[DB.ElementId]([element_id])) or [])
+        new_ids.extend(copied_ids)
+        copy_id = _match_copy(element_id, copied_ids, doc, to_doc)
+        if copy_id is None:
+            unmatched.append(element_id.IntegerValue)
+        else:
+            id_map[element_id] = copy_id
+    if unmatched:
+        logger.warning('Copies of elements could not be identified: {}'.format(
+                                                                    unmatched))
+    return new_ids, id_map
+
+
+def _match_copy(source_id, copied_ids, doc, to_doc):
+    """ Returns id of the copy of an element, or ``None`` if more than one
+    copied element has the same class, category and type as the source """
+    if len(copied_ids) == 1:
+        return copied_ids[0]
+    source = doc.GetElement(source_id)
+    matches = [copied_id for copied_id in copied_ids
+               if _get_kind(to_doc.GetElement(copied_id), to_doc is doc) ==
+               _get_kind(source, to_doc is doc)]
+    return matches[0] if len(matches) == 1 else None
+
+
+def _get_kind(element, same_doc):
+    """ Returns (class, category id, type id). Type ids are only
+    compared within the same document """
+    category = element.Category
+    category_id = category.Id.IntegerValue if category else None
+    type_id = element.GetTypeId().IntegerValue if same_doc else None
+    return (type(element), category_id, type_id)
@@ -0,0 +1,233 @@
+"""
+Document Caches
+
+Lookups that are repeated many times during a script run (element types,
+resolved elements, etc) can be stored on a per-document cache so the Revit
+API is only queried once.
+
+>>> from rpw.db.cache import DocumentCache
+>>> type_cache = DocumentCache('element_types')
+>>> cache = type_cache.get(revit.doc)
+>>> cache[type_id.IntegerValue] = element_type
+
+Caches are cleared for a document every time an rpw
+:any:`Transaction` ends on that document, since values read
+before or during the transaction might no longer be valid.
+They are also cleared when the document's ``DocumentChanged`` event is
+raised, so changes made by the UI or by other tools are seen.
+Changes made with the Revit API inside an open transaction are only seen
+once it ends, unless they are made through rpw wrappers that update the
+caches, ie. :any:`Parameter.value`.
+Caches of a document are dropped when it is closed.
+The events are only subscribed while caches of the document hold entries,
+and are unsubscribed once they are all cleared.
+They can also be cleared manually:
+
+>>> from rpw.db import cache
+>>> cache.clear_all(revit.doc)
+
+"""  #
+
+from rpw import revit, DB
+from rpw.base import BaseObject
+from rpw.utils.logger import logger
+
+# Watchers subscribed to application events: {doc: _DocumentWatcher}
+_watchers = {}
+
+
+class DocumentCache(BaseObject):
+    """
+    Stores one dictionary per document.
+
+    Args:
+        name (``str``): Name of the cache, used in ``__repr__``
+        clear_on_transaction (``bool``): Clear cache when an rpw Transaction
+            is committed or rolled back [default: True]
+        clear_on_change (``bool``, ``callable``): Clear cache of a document
+            when its ``DocumentChanged`` event is raised. If a callable is
+            provided, it is called with the ``DocumentChangedEventArgs`` and
+            the cache dictionary of the document, and the cache is only
+            cleared if it returns ``True``. The callable can also update
+            the cached values in place [default: True]
+        max_size (``int``, optional): Maximum number of values stored per
+            document by :any:`update`. The document's cache is cleared
+            before it grows larger [default: None]
+    """
+
+    _registry = []
+
+    def __init__(self, name, clear_on_transaction=True, clear_on_change=True,
+                 max_size=None):
+        self.name = name
+        self.clear_on_transaction = clear_on_transaction
+        self.clear_on_change = clear_on_change
+        self.max_size = max_size
+        self._caches = {}
+        DocumentCache._registry.append(self)
+
+    def get(self, doc=None):
+        """
+        Returns the cache dictionary of a document. A new dictionary is
+        created the first time a document is used.
+
+        Args:
+            doc (``DB.Document``, optional): Document [default: revit.doc]
+
+        Returns:
+            (``dict``): Cache dictionary
+        """
+        doc = doc or revit.doc
+        try:
+            return self._caches[doc]
+        except KeyError:
+            if self.clear_on_change:
+                _watch(doc)
+            cache = self._caches[doc] = {}
+            return cache
+
+    def update(self, values, doc=None):
+        """
+        Stores values in the cache of a document, respecting ``max_size``.
+        Values are not stored if there are more than ``max_size`` of them.
+
+        Args:
+            values (``dict``): Values to store
+            doc (``DB.Document``, optional): Document [default: revit.doc]
+        """
+        cache = self.get(doc)
+        if self.max_size is not None:
+            if len(values) > self.max_size:
+                return
+            if len(cache) + len(values) > self.max_size:
+                cache.clear()
+        cache.update(values)
+
+    def clear(self, doc=None):
+        """
+        Clears the cache of a document. If no document is provided,
+        caches for all documents are cleared.
+        """
+        if doc is None:
+            self._caches.clear()
+        else:
+            self._caches.pop(doc, None)
+        _release(doc)
+
+    def __len__(self):
+        return sum([len(cache) for cache in self._caches.values()])
+
+    def __repr__(self):
+        return super(DocumentCache, self).__repr__(data={'name': self.name,
+                                                         'count': len(self)})
+
+
+def clear_all(doc=None, transaction=False):
+    """
+    Clears all registered caches for a document.
+
+    Args:
+        doc (``DB.Document``, optional): Document. If ``None`` caches of all
+            documents are cleared.
+        transaction (``bool``): If ``True``, only caches created with
+            ``clear_on_transaction`` are cleared. Used by :any:`Transaction`.
+    """
+    for cache in DocumentCache._registry:
+        if transaction and not cache.clear_on_transaction:
+            continue
+        cache.clear(doc)
+
+
+class _DocumentWatcher(object):
+    """ Subscribes to DocumentChanged and DocumentClosing for a document """
+
+    def __init__(self, doc):
+        self.doc = doc
+        self.app = doc.Application
+        # Same handler instances are needed to unsubscribe
+        self._changed_handler = self._on_document_changed
+        self._closing_handler = self._on_document_closing
+
+    def start(self):
+        self.app.DocumentChanged += self._changed_handler
+        self.app.DocumentClosing += self._closing_handler
+
+    def stop(self):
+        self.app.DocumentChanged -= self._changed_handler
+        self.app.DocumentClosing -= self._closing_handler
+
+    def _on_document_changed(self, sender, args):
+        if args.GetDocument().Equals(self.doc):
+            _on_document_changed(self.doc, args)
+
+    def _on_document_closing(self, sender, args):
+        if args.Document.Equals(self.doc):
+            clear_all(self.doc)
+
+
+def _watch(doc):
+    """ Subscribes to events of a document, once """
+    if doc not in _watchers:
+        watcher = _watchers[doc] = _DocumentWatcher(doc)
+        watcher.start()
+
+
+def _release(doc=None):
+    """ Unsubscribes from events of documents that no cache uses anymore.
+    If no document is provided, all documents are checked """
+    for watched_doc in list(_watchers):
+        if doc is not None and watched_doc != doc:
+            continue
+        in_use = any([document_cache.clear_on_change and
+                      watched_doc in document_cache._caches
+                      for document_cache in DocumentCache._registry])
+        if not in_use:
+            _watchers.pop(watched_doc).stop()
+
+
+def _on_document_changed(doc, args):
+    """ Clears caches of the changed document """
+    for document_cache in DocumentCache._registry:
+        cache = document_cache._caches.get(doc)
+        clear_on_change = document_cache.clear_on_change
+        if cache is None or not clear_on_change:
+            continue
+        try:
+            if clear_on_change is True or clear_on_change(args, cache):
+                document_cache.clear(doc)
+        except Exception as errmsg:
+            logger.error('Could not update cache {}: {}'.format(
+                                                document_cache.name, errmsg))
+            document_cache.clear(doc)
+
+
+element_type_cache = DocumentCache('element_types')
+element_cache = DocumentCache('elements', max_size=10000)
+
+
+def get_element_type(element):
+    """
+    Returns the ``DB.ElementType`` of an element.
+    Types are cached by id, so elements that share a type only look it up once.
+
+    >>> from rpw.db.cache import get_element_type
+    >>> get_element_type(some_wall)
+    <Autodesk.Revit.DB.WallType>
+
+    Args:
+        element (``DB.Element``): Element
+
+    Returns:
+        (``DB.ElementType``): Element Type, or ``None`` if element has no type
+    """
+    type_id = element.GetTypeId()
+    if type_id == DB.ElementId.InvalidElementId:
+        return None
+    doc = element.Document
+    cache = element_type_cache.get(doc)
+    type_id_int = type_id.IntegerValue
+    try:
+        return cache[type_id_int]
+    except KeyError:
+        element_type = cache[type_id_int] = doc.GetElement(type_id)
+        return element_type
@@ -0,0 +1,187 @@
+"""
+Clash Detection
+
+Finds intersecting elements between two sets of elements:
+
+* Bounding boxes of all elements are read in a single pass.
+* A sweep-and-prune broad phase finds pairs of overlapping boxes in python.
+* Only candidate pairs are checked with ``ElementIntersectsElementFilter``,
+  using one collector per element of the first set.
+
+>>> from rpw import db
+>>> ducts = db.Collector(of_category='OST_DuctCurves', is_not_type=True)
+>>> beams = db.Collector(of_category='OST_StructuralFraming', is_not_type=True)
+>>> clashes = db.clash(ducts, beams)
+>>> for duct, beam in clashes:
+...     print(duct.Id, beam.Id)
+>>> clashes.timings
+{'extract': 0.41, 'broad_phase': 0.02, 'narrow_phase': 1.3}
+
+Results are yielded as they are found. If ``set_b`` is not provided,
+elements of ``set_a`` are checked against each other.
+
+"""  #
+
+import time
+from collections import OrderedDict
+
+from rpw import revit, DB
+from rpw.base import BaseObject
+from rpw.utils.coerce import resolve_elements
+from rpw.utils.dotnet import List
+from rpw.utils.logger import logger
+
+
+def clash(set_a, set_b=None, tolerance=0.0, exact=True, view=None, doc=None):
+    """
+    Finds clashes between two sets of elements. See :any:`Clash`
+
+    Args:
+        set_a (``Collector``, ``ElementSet``, ``[DB.Element]``): Elements
+        set_b (``Collector``, ``ElementSet``, ``[DB.Element]``, optional):
+            Elements to check against. If not provided, ``set_a`` is
+            checked against itself.
+        tolerance (``float``): Distance bounding boxes are expanded by in the
+            broad phase [default: 0]
+        exact (``bool``): Check candidate pairs with
+            ``ElementIntersectsElementFilter``. If ``False``, pairs with
+            overlapping bounding boxes are returned. [default: True]
+        view (``DB.View``, optional): View used to read bounding boxes
+            [default: None, model bounding boxes]
+        doc (``DB.Document``, optional): Document [default: revit.doc]
+
+    Returns:
+        (:any:`Clash`): Iterable of ``(DB.Element, DB.Element)`` pairs
+    """
+    return Clash(set_a, set_b, tolerance=tolerance, exact=exact,
+                 view=view, doc=doc)
+
+
+class Clash(BaseObject):
+    """
+    Iterable of clashing ``(DB.Element, DB.Element)`` pairs.
+    Created by :func:`clash`.
+
+    Clash detection runs while the object is iterated.
+    After each phase, its duration in seconds is stored in ``timings``.
+    Elements of the first set that cannot be checked by
+    ``ElementIntersectsElementFilter`` are stored in ``failed_ids``.
+
+    Note:
+        ``tolerance`` only applies to the broad phase. The exact check
+        only reports elements that intersect.
+    """
+
+    def __init__(self, set_a, set_b=None, tolerance=0.0, exact=True,
+                 view=None, doc=None):
+        self.doc = doc or revit.doc
+        self.set_a = set_a
+        self.set_b = set_b
+        self.tolerance = tolerance
+        self.exact = exact
+        self.view = getattr(view, '_revit_object', view)
+        self.timings = OrderedDict()
+        self.failed_ids = []
+
+    def __iter__(self):
+        self.timings.clear()
+        self.failed_ids = []
+
+        start = time.time()
+        elements = {}
+        boxes = self._read_boxes(self.set_a, 0, elements)
+        if self.set_b is not None:
+            boxes.extend(self._read_boxes(self.set_b, 1, elements))
+        self.timings['extract'] = time.time() - start
+
+        start = time.time()
+        candidates = _sweep_and_prune(boxes, self.set_b is not None)
+        self.timings['broad_phase'] = time.time() - start
+        logger.debug('Clash: {} boxes, {} candidate pairs'.format(
+                     len(boxes), sum([len(ids) for ids in candidates.values()])))
+
+        start = time.time()
+        narrow_phase_time = 0.0
+        for id_a, ids_b in candidates.items():
+            element_a = elements[id_a]
+            if self.exact:
+                ids_b = self._get_intersecting(element_a, ids_b)
+            narrow_phase_time += time.time() - start
+            for id_b in ids_b:
+                yield (element_a, elements[id_b])
+            start = time.time()
+        self.timings['narrow_phase'] = narrow_phase_time + time.time() - start
+        logger.info('Clash timings: {}'.format(
+                    ', '.join(['{} {:.2f}s'.format(phase, seconds)
+                               for phase, seconds in self.timings.items()])))
+
+    def _read_boxes(self, element_references, group, elements):
+        """ Returns (min_x, max_x, min_y, max_y, min_z, max_z, id, group)
+        tuples, and stores resolved elements by id """
+        tolerance = self.tolerance
+        resolved, missing_ids = resolve_elements(element_references,
+                                                 doc=self.doc)
+        boxes = []
+        for element in resolved:
+            bbox = element.get_BoundingBox(self.view)
+            if bbox is None:
+                continue
+            id_int = element.Id.IntegerValue
+            elements[id_int] = element
+            bbox_min, bbox_max = bbox.Min, bbox.Max
+            boxes.append((bbox_min.X - tolerance, bbox_max.X + tolerance,
+                          bbox_min.Y - tolerance, bbox_max.Y + tolerance,
+                          bbox_min.Z - tolerance, bbox_max.Z + tolerance,
+                          id_int, group))
+        return boxes
+
+    def _get_intersecting(self, element_a, ids_b):
+        """ Returns ids in ids_b that intersect element_a """
+        try:
+            intersects_filter = DB.ElementIntersectsElementFilter(element_a)
+            element_ids = List[DB.ElementId]([DB.ElementId(id_b)
+                                              for id_b in ids_b])
+            collector = DB.FilteredElementCollector(self.doc, element_ids)
+            collector = collector.WherePasses(intersects_filter)
+            return [id_.IntegerValue for id_ in collector.ToElementIds()]
+        except Exception as errmsg:
+            logger.debug('Clash: cannot check {}: {}'.format(
+                         element_a.Id.IntegerValue, errmsg))
+            self.failed_ids.append(element_a.Id)
+            return []
+
+    def __repr__(self):
+        return super(Clash, self).__repr__(data={'tolerance': self.tolerance,
+                                                 'exact': self.exact})
+
+
+def _sweep_and_prune(boxes, two_sets):
+    """
+    Finds overlapping boxes by sorting on min X and keeping a list of boxes
+    whose X range is still open.
+
+    Returns:
+        (``OrderedDict``): {id_a: [id_b, ...]}
+    """
+    candidates = OrderedDict()
+    active = []
+    for box in sorted(boxes):
+        min_x = box[0]
+        active = [other for other in active if other[1] >= min_x]
+        for other in active:
+            if two_sets and other[7] == box[7]:
+                continue
+            if (box[2] <= other[3] and other[2] <= box[3] and
+                    box[4] <= other[5] and other[4] <= box[5]):
+                if two_sets and box[7] == 0:
+                    pair = (box[6], other[6])
+                else:
+                    pair = (other[6], box[6])
+                if pair[0] == pair[1]:
+                    continue
+                if pair[0] in candidates:
+                    candidates[pair[0]].append(pair[1])
+                else:
+                    candidates[pair[0]] = [pair[1]]
+        active.append(box)
+    return candidates
@@ -1,6 +1,10 @@
 """ API Related Sets and Collections """
 
-
+import struct
+import zlib
+from array import array
+from bisect import bisect_left
+from math import sqrt
 from collections import OrderedDict
 
 import rpw
@@ -9,14 +13,24 @@ from rpw.db.xyz import XYZ
 from rpw.db.element import Element
 from rpw.base import BaseObject
 from rpw.utils.coerce import to_elements, to_element_ids, to_element_id
+from rpw.utils.coerce import resolve_elements, as_element_ids, to_iterable
+from rpw.utils.coerce import to_xyz_tuple
+from rpw.exceptions import RpwException, RpwValueError
 from rpw.utils.dotnet import List
 from rpw.utils.logger import deprecate_warning
+from rpw.utils.mixins import BulkEditMixin
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
-class ElementSet(BaseObject):
+class ElementSet(BaseObject, BulkEditMixin):
     """
     Provides helpful methods for managing a set of unique of ``DB.ElementId``
-    Sets are unordered.
+    Ids are indexed by their integer value and keep their insertion order,
+    so ``add``, ``remove`` and ``in`` do not depend on the size of the set.
 
     >>> element_set = ElementSet([element, element])
     >>> element_set = ElementSet()
@@ -25,6 +39,20 @@ class ElementSet(BaseObject):
     True
     >>> element_set.clear()
 
+    Sets support set operations. Operations compare integer ids only,
+    and do not access the document:
+
+    >>> walls | doors           # Union
+    >>> walls & selection       # Intersection
+    >>> walls - selection       # Difference
+    >>> walls ^ selection       # Symmetric Difference
+
+    Elements in the set can be edited in bulk, with one API call:
+
+    >>> walls.move((0, 10, 0))
+    >>> new_ids, id_map = walls.copy((0, 0, 10))
+    >>> walls.delete()
+
     NOTE:
         Similar to DB.ElementSet, doesnt wrap since there is no advantage
 
@@ -35,7 +63,8 @@ class ElementSet(BaseObject):
 
     def __init__(self, elements_or_ids=None, doc=revit.doc):
         self.doc = doc
-        self._element_id_set = []
+        # {id.IntegerValue: DB.ElementId}
+        self._element_id_set = OrderedDict()
         if elements_or_ids:
             self.add(elements_or_ids)
 
@@ -47,10 +76,47 @@ class ElementSet(BaseObject):
             element_reference (`DB.Element`, DB.Element_ids): Iterable Optional
 
         """
-        element_ids = to_element_ids(elements_or_ids)
-        for id_ in element_ids:
-            if id_ not in self._element_id_set:
-                self._element_id_set.append(id_)
+        # Selection overrides update()
+        ElementSet.update(self, elements_or_ids)
+
+    def update(self, elements_or_ids):
+        """
+        Adds many elements or element_ids to set.
+        Ids already in the set are ignored.
+
+        Args:
+            elements_or_ids (`DB.Element`, `DB.ElementId`, :any:`ElementSet`):
+                Iterable of element references, or another set
+        """
+        if isinstance(elements_or_ids, ElementSet):
+            id_items = elements_or_ids._element_id_set.items()
+        else:
+            id_items = [(id_.IntegerValue, id_) for id_
+                        in to_element_ids(elements_or_ids)]
+        element_id_set = self._element_id_set
+        for key, id_ in id_items:
+            if key not in element_id_set:
+                element_id_set[key] = id_
+
+    def remove(self, element_reference):
+        """
+        Removes element from set. Raises ``KeyError`` if not in set.
+
+        Args:
+            element_reference (DB.ElementId, DB.Element)
+        """
+        element_id = to_element_id(element_reference)
+        del self._element_id_set[element_id.IntegerValue]
+
+    def discard(self, element_reference):
+        """
+        Removes element from set if present.
+
+        Args:
+            element_reference (DB.ElementId, DB.Element)
+        """
+        element_id = to_element_id(element_reference)
+        self._element_id_set.pop(element_id.IntegerValue, None)
 
     def pop(self, element_reference, wrapped=True):
         """
@@ -65,20 +131,25 @@ class ElementSet(BaseObject):
         """
         element_id = to_element_id(element_reference)
         element = self.__getitem__(element_id)
-        self._element_id_set.remove(element_id)
+        del self._element_id_set[element_id.IntegerValue]
         return element if wrapped else element.unwrap()
 
     def clear(self):
         """ Clears Set """
-        self._element_id_set = []
+        self._element_id_set = OrderedDict()
+
+    @property
+    def _element_ids(self):
+        return list(self._element_id_set.values())
 
     @property
     def _elements(self):
-        return [self.doc.GetElement(e) for e in self._element_id_set]
+        elements, _ = resolve_elements(self._element_ids, doc=self.doc)
+        return elements
 
     @property
     def _wrapped_elements(self):
-        return Element.from_list(self._element_id_set)
+        return Element.from_list(self._element_ids, doc=self.doc)
 
     def get_elements(self, wrapped=True, as_list=False):
         """
@@ -132,9 +203,9 @@ class ElementSet(BaseObject):
 
         """
         if as_list:
-            return List[DB.ElementId](self._element_id_set)
+            return List[DB.ElementId](self._element_ids)
         else:
-            return list(self._element_id_set)
+            return self._element_ids
 
     @property
     def element_ids(self):
@@ -150,15 +221,24 @@ class ElementSet(BaseObject):
 
     def select(self):
         """ Selects Set in UI """
-        return rpw.ui.Selection(self._element_id_set)
+        return rpw.ui.Selection(self._element_ids)
+
+    def delete(self):
+        """
+        Deletes all elements in a single call, and clears the set.
+        Returns ids of deleted elements.
+        """
+        deleted_ids = super(ElementSet, self).delete()
+        self.clear()
+        return deleted_ids
 
     def __len__(self):
         return len(self._element_id_set)
 
     def __iter__(self):
         """ Iterator: Wrapped """
-        for element in self._element_id_set:
-            yield Element.from_id(element)
+        for element_id in self._element_ids:
+            yield Element.from_id(element_id, doc=self.doc)
 
     def __getitem__(self, element_reference):
         """
@@ -171,10 +251,9 @@ class ElementSet(BaseObject):
             (wrapped_element): Wrapped Element. Raises Key Error if not found.
         """
         eid_key = to_element_id(element_reference)
-        for element in self.__iter__():
-            if element.Id == eid_key:
-                return element
-        raise KeyError(eid_key)
+        if eid_key.IntegerValue not in self._element_id_set:
+            raise KeyError(eid_key)
+        return Element.from_id(eid_key, doc=self.doc)
 
     def __contains__(self, element_or_id):
         """
@@ -186,17 +265,273 @@ class ElementSet(BaseObject):
         Returns:
             bool: ``True`` or ``False``
         """
-        # TODO Write Tests
         element_id = to_element_id(element_or_id)
-        return bool(element_id in self._element_id_set)
+        return element_id.IntegerValue in self._element_id_set
 
     def __bool__(self):
         return bool(self._element_id_set)
 
+    def _from_id_items(self, id_items):
+        """ Returns new ElementSet from (int, ElementId) pairs """
+        element_set = ElementSet(doc=self.doc)
+        element_set._element_id_set = OrderedDict(id_items)
+        return element_set
+
+    @staticmethod
+    def _get_id_set(other):
+        """ Returns {int: ElementId} of other set or element references """
+        if isinstance(other, ElementSet):
+            return other._element_id_set
+        return OrderedDict([(id_.IntegerValue, id_) for id_
+                            in to_element_ids(other)])
+
+    def __or__(self, other):
+        """ Union: Elements in either set """
+        element_set = self._from_id_items(self._element_id_set.items())
+        element_set.update(other)
+        return element_set
+
+    def __and__(self, other):
+        """ Intersection: Elements in both sets """
+        other_ids = self._get_id_set(other)
+        return self._from_id_items([(key, id_) for key, id_
+                                    in self._element_id_set.items()
+                                    if key in other_ids])
+
+    def __sub__(self, other):
+        """ Difference: Elements not in other set """
+        other_ids = self._get_id_set(other)
+        return self._from_id_items([(key, id_) for key, id_
+                                    in self._element_id_set.items()
+                                    if key not in other_ids])
+
+    def __xor__(self, other):
+        """ Symmetric Difference: Elements in only one of the sets """
+        other_ids = self._get_id_set(other)
+        id_items = [(key, id_) for key, id_ in self._element_id_set.items()
+                    if key not in other_ids]
+        id_items.extend([(key, id_) for key, id_ in other_ids.items()
+                         if key not in self._element_id_set])
+        return self._from_id_items(id_items)
+
     def __repr__(self, data=None):
         return super(ElementSet, self).__repr__(data={'count': len(self)})
 
 
+class IdBitmap(BaseObject):
+    """
+    Compact set of element ids stored as a sorted ``array('l')`` of integer
+    id values. Uses a fraction of the memory of an :any:`ElementSet` and is
+    meant for very large sets of ids, ie. cross-model audits.
+
+    ``DB.ElementId`` instances are only created when the ids are requested,
+    so it can be used wherever an :any:`ElementSet` is accepted, including
+    ``Collector(element_ids=...)`` and ``Collector(exclude=...)``.
+
+    >>> bitmap = IdBitmap(Collector(of_class='Wall'))
+    >>> bitmap |= IdBitmap(Collector(of_class='Floor'))
+    >>> 20001 in bitmap
+    True
+    >>> Collector(of_class='FamilyInstance', exclude=bitmap)
+
+    Set operations merge the sorted arrays in a single linear pass.
+    Bitmaps can be saved and loaded between sessions, and machines:
+
+    >>> data = bitmap.to_bytes()
+    >>> IdBitmap.from_bytes(data)
+    <rpw:IdBitmap count:15201>
+
+    Args:
+        (`DB.Element`, `DB.ElementID`, `int`, optional): Element references
+    """
+
+    _TYPECODE = 'l'
+    # Bump if the format of to_bytes changes
+    _BYTES_FORMAT = 2
+
+    def __init__(self, elements_or_ids=None):
+        self._ids = array(IdBitmap._TYPECODE)
+        if elements_or_ids is not None:
+            self.update(elements_or_ids)
+
+    @staticmethod
+    def _to_ints(elements_or_ids):
+        """ Returns iterable of integer id values from element references """
+        if isinstance(elements_or_ids, IdBitmap):
+            return elements_or_ids._ids
+        element_ids = as_element_ids(elements_or_ids)
+        if element_ids is not None:
+            return [id_.IntegerValue for id_ in element_ids]
+        ints = []
+        for element_reference in to_iterable(elements_or_ids):
+            if isinstance(element_reference, int):
+                ints.append(element_reference)
+            else:
+                ints.append(to_element_id(element_reference).IntegerValue)
+        return ints
+
+    @classmethod
+    def _from_ints(cls, sorted_ints):
+        bitmap = cls()
+        bitmap._ids = array(IdBitmap._TYPECODE, sorted_ints)
+        return bitmap
+
+    def add(self, element_reference):
+        """ Adds a single element reference """
+        value = self._to_ints(element_reference)[0]
+        index = bisect_left(self._ids, value)
+        if index == len(self._ids) or self._ids[index] != value:
+            self._ids.insert(index, value)
+
+    def update(self, elements_or_ids):
+        """ Adds many element references, or another :any:`IdBitmap` """
+        self._ids = _merge_sorted(self._ids, self._sorted_ints(elements_or_ids),
+                                  left_only=True, both=True, right_only=True)
+
+    def discard(self, element_reference):
+        """ Removes element reference if present """
+        value = self._to_ints(element_reference)[0]
+        index = bisect_left(self._ids, value)
+        if index < len(self._ids) and self._ids[index] == value:
+            self._ids.pop(index)
+
+    def clear(self):
+        self._ids = array(IdBitmap._TYPECODE)
+
+    def iter_element_ids(self):
+        """ Yields a ``DB.ElementId`` for each id """
+        ElementId = DB.ElementId
+        for value in self._ids:
+            yield ElementId(value)
+
+    def get_element_ids(self, as_list=True):
+        """
+        ElementIds in bitmap, in ascending order
+
+        Args:
+            as_list(bool): True if you want list as List[DB.ElementId], False
+                for regular python list. Default is True
+
+        Returns:
+            ElementIds (List, List[DB.ElementId]): List of ElementIds Objects
+        """
+        element_ids = list(self.iter_element_ids())
+        return List[DB.ElementId](element_ids) if as_list else element_ids
+
+    def to_bytes(self):
+        """
+        Returns compressed bytes. Ids are stored as little-endian 64-bit
+        integers, so bytes can be loaded on any machine.
+        See :func:`from_bytes`
+        """
+        header = struct.pack('<B', IdBitmap._BYTES_FORMAT)
+        data = struct.pack('<{}q'.format(len(self._ids)), *self._ids)
+        return header + zlib.compress(data)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """ Creates bitmap from bytes created by :func:`to_bytes` """
+        bytes_format = struct.unpack('<B', data[:1])[0]
+        if bytes_format != IdBitmap._BYTES_FORMAT:
+            raise RpwValueError('IdBitmap format {}'.format(
+                                IdBitmap._BYTES_FORMAT), bytes_format)
+        data = zlib.decompress(data[1:])
+        count = len(data) // 8
+        return cls._from_ints(struct.unpack('<{}q'.format(count), data))
+
+    def _sorted_ints(self, other):
+        """ Returns ascending integer ids. Bitmaps are used as they are """
+        if isinstance(other, IdBitmap):
+            return other._ids
+        return sorted(self._to_ints(other))
+
+    def __or__(self, other):
+        """ Union: Ids in either bitmap """
+        ids = _merge_sorted(self._ids, self._sorted_ints(other),
+                            left_only=True, both=True, right_only=True)
+        return self._from_ints(ids)
+
+    def __and__(self, other):
+        """ Intersection: Ids in both bitmaps """
+        ids = _merge_sorted(self._ids, self._sorted_ints(other),
+                            left_only=False, both=True, right_only=False)
+        return self._from_ints(ids)
+
+    def __sub__(self, other):
+        """ Difference: Ids not in other bitmap """
+        ids = _merge_sorted(self._ids, self._sorted_ints(other),
+                            left_only=True, both=False, right_only=False)
+        return self._from_ints(ids)
+
+    def __xor__(self, other):
+        """ Symmetric Difference: Ids in only one of the bitmaps """
+        ids = _merge_sorted(self._ids, self._sorted_ints(other),
+                            left_only=True, both=False, right_only=True)
+        return self._from_ints(ids)
+
+    def __contains__(self, element_reference):
+        value = self._to_ints(element_reference)[0]
+        index = bisect_left(self._ids, value)
+        return index < len(self._ids) and self._ids[index] == value
+
+    def __iter__(self):
+        """ Iterator: Integer id values """
+        return iter(self._ids)
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __bool__(self):
+        return bool(self._ids)
+
+    def __eq__(self, other):
+        return isinstance(other, IdBitmap) and self._ids == other._ids
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __repr__(self, data=None):
+        return super(IdBitmap, self).__repr__(data={'count': len(self)})
+
+
+def _merge_sorted(left, right, left_only, both, right_only):
+    """
+    Merges two ascending sequences of ints in one pass, and returns the
+    selected ints as a new ``array``: ints only in ``left``, in ``both``,
+    or only in ``right``. ``left`` must not have duplicates.
+    """
+    result = array(IdBitmap._TYPECODE)
+    append = result.append
+    i = j = 0
+    left_count, right_count = len(left), len(right)
+    while i < left_count and j < right_count:
+        if j and right[j] == right[j - 1]:
+            j += 1
+            continue
+        left_value, right_value = left[i], right[j]
+        if left_value < right_value:
+            if left_only:
+                append(left_value)
+            i += 1
+        elif right_value < left_value:
+            if right_only:
+                append(right_value)
+            j += 1
+        else:
+            if both:
+                append(left_value)
+            i += 1
+            j += 1
+    if left_only:
+        result.extend(left[i:])
+    if right_only:
+        while j < right_count:
+            if not j or right[j] != right[j - 1]:
+                append(right[j])
+            j += 1
+    return result
+
+
 class ElementCollection(BaseObject):
     """
     List Collection for managing a list of ``DB.Element``.
@@ -373,23 +708,81 @@ class XyzCollection(BaseObject):
     Provides helpful methods for managing a
     collection(list) of :any:`XYZ` instances.
 
+    Coordinates are copied once into a flat ``array('d')``
+    (``[x0, y0, z0, x1, y1, z1, ...]``), and all statistics are computed
+    on that array, or with numpy when it is available.
+    ``DB.XYZ`` objects are only created for returned points.
+
     >>> points = [p1,p2,p3,p4, ...]
     >>> point_collection = XyzCollection(points)
+    >>> point_collection.average
+    >>> point_collection.nearest(XYZ(0, 0, 0))
+    >>> point_collection.distances_to(XYZ(0, 0, 0))
+    array('d', [3.0, 5.2, ...])
 
     Attributes:
         point_collection.average
         point_collection.min
         point_collection.max
     """
-    # TODO: Implement unwrapped return.
-    # TODO: Implement Collection methods (Add, pop, as list, etc)
 
     def __init__(self, points):
-        self.points = points if points is not None else []
+        """
+        Args:
+            points (``[DB.XYZ]``, ``[XYZ]``, ``[tuple]``): Points
+        """
+        points = list(points) if points is not None else []
+        self._points = points
+        coords = array('d')
+        for point in points:
+            coords.extend(to_xyz_tuple(point))
+        self._coords = coords
 
-    def __iter__(self):
-        for point in self.points:
-            yield point
+    @classmethod
+    def from_coords(cls, coords):
+        """
+        Creates a collection from flat coordinates, without creating
+        any point objects.
+
+        >>> XyzCollection.from_coords([0, 0, 0, 10, 10, 0])
+
+        Args:
+            coords (``iterable``): Flat ``[x0, y0, z0, x1, ...]`` values
+        """
+        collection = cls(None)
+        collection._points = None
+        collection._coords = array('d', coords)
+        return collection
+
+    @property
+    def points(self):
+        """ Points of collection. Created from coordinates if needed """
+        if self._points is None:
+            self._points = [XYZ(*self._get_coords(n)) for n in range(len(self))]
+        return self._points
+
+    @property
+    def coords(self):
+        """ Flat ``array('d')`` of coordinates: ``[x0, y0, z0, x1, ...]`` """
+        return self._coords
+
+    def as_numpy(self):
+        """ Returns coordinates as (n, 3) numpy array. Requires numpy """
+        if np is None:
+            raise RpwException('numpy is not available')
+        return np.frombuffer(self._coords, dtype=np.float64).reshape(-1, 3)
+
+    def to_xyz_list(self):
+        """ Returns points as list of ``DB.XYZ`` for API calls """
+        return [DB.XYZ(*self._get_coords(n)) for n in range(len(self))]
+
+    def _get_coords(self, index):
+        start = index * 3
+        return tuple(self._coords[start:start + 3])
+
+    def _axis_values(self, axis):
+        """ Returns array of values of one axis: 0, 1 or 2 """
+        return self._coords[axis::3]
 
     @property
     def average(self):
@@ -402,14 +795,12 @@ class XyzCollection(BaseObject):
             XYZ (`DB.XYZ`): Average of point collection.
 
         """
-        x_values = [point.X for point in self.points]
-        y_values = [point.Y for point in self.points]
-        z_values = [point.Z for point in self.points]
-        x_avg = sum(x_values) / len(x_values)
-        y_avg = sum(y_values) / len(y_values)
-        z_avg = sum(z_values) / len(z_values)
+        if np is not None:
+            return XYZ(*self.as_numpy().mean(axis=0).tolist())
+        count = float(len(self))
+        return XYZ(*[sum(self._axis_values(axis)) / count for axis in range(3)])
 
-        return XYZ(x_avg, y_avg, z_avg)
+    centroid = average
 
     @property
     def max(self):
@@ -422,13 +813,9 @@ class XyzCollection(BaseObject):
             XYZ (`DB.XYZ`): Max of point collection.
 
         """
-        x_values = [point.X for point in self.points]
-        y_values = [point.Y for point in self.points]
-        z_values = [point.Z for point in self.points]
-        x_max = max(x_values)
-        y_max = max(y_values)
-        z_max = max(z_values)
-        return XYZ(x_max, y_max, z_max)
+        if np is not None:
+            return XYZ(*self.as_numpy().max(axis=0).tolist())
+        return XYZ(*[max(self._axis_values(axis)) for axis in range(3)])
 
     @property
     def min(self):
@@ -440,13 +827,17 @@ class XyzCollection(BaseObject):
             XYZ (`DB.XYZ`): Min of point collection.
 
         """
-        x_values = [point.X for point in self.points]
-        y_values = [point.Y for point in self.points]
-        z_values = [point.Z for point in self.points]
-        x_min = min(x_values)
-        y_min = min(y_values)
-        z_min = min(z_values)
-        return XYZ(x_min, y_min, z_min)
+        if np is not None:
+            return XYZ(*self.as_numpy().min(axis=0).tolist())
+        return XYZ(*[min(self._axis_values(axis)) for axis in range(3)])
+
+    @property
+    def bounds(self):
+        """
+        Returns:
+            (``tuple``): (:any:`XYZ`, :any:`XYZ`) Min and Max of point collection
+        """
+        return (self.min, self.max)
 
     def sorted_by(self, x_y_z):
         """ Sorts Point Collection by axis.
@@ -458,12 +849,60 @@ class XyzCollection(BaseObject):
         Args:
             axis (`str`): Axist to sort by.
         """
-        sorted_points = self.points[:]
-        sorted_points.sort(key=lambda p: getattr(p, x_y_z.upper()))
-        return sorted_points
+        values = self._axis_values('xyz'.index(x_y_z.lower()))
+        indexes = sorted(range(len(values)), key=values.__getitem__)
+        points = self.points
+        return [points[n] for n in indexes]
+
+    def distances_to(self, point):
+        """
+        Distances from every point in collection to a point.
+
+        Args:
+            point (``DB.XYZ``, :any:`XYZ`, ``tuple``): Point
+
+        Returns:
+            (``array``, ``numpy.ndarray``): Distances, in collection order.
+            numpy array if numpy is available.
+        """
+        px, py, pz = to_xyz_tuple(point)
+        if np is not None:
+            deltas = self.as_numpy() - (px, py, pz)
+            return np.sqrt((deltas * deltas).sum(axis=1))
+        coords = self._coords
+        return array('d', [sqrt((coords[i] - px) ** 2 +
+                                (coords[i + 1] - py) ** 2 +
+                                (coords[i + 2] - pz) ** 2)
+                           for i in range(0, len(coords), 3)])
+
+    def nearest_index(self, point):
+        """ Index of point in collection nearest to a point, or ``None`` """
+        if not len(self):
+            return None
+        distances = self.distances_to(point)
+        if np is not None:
+            return int(distances.argmin())
+        return min(range(len(distances)), key=distances.__getitem__)
+
+    def nearest(self, point):
+        """
+        Point in collection nearest to a point.
+
+        Args:
+            point (``DB.XYZ``, :any:`XYZ`, ``tuple``): Point
+
+        Returns:
+            Point of collection, or ``None`` if collection is empty
+        """
+        index = self.nearest_index(point)
+        return None if index is None else self.points[index]
+
+    def __iter__(self):
+        for point in self.points:
+            yield point
 
     def __len__(self):
-        return len(self.points)
+        return len(self._coords) // 3
 
     def __repr__(self):
-        return super(PointCollection, self).__repr__(data=len(self))
+        return super(XyzCollection, self).__repr__(data={'count': len(self)})
@@ -33,11 +33,11 @@ from rpw.exceptions import RpwException, RpwTypeError, RpwCoerceError
 from rpw.db.element import Element
 from rpw.db.builtins import BicEnum, BipEnum
 from rpw.ui.selection import Selection
-from rpw.db.collection import ElementSet
-from rpw.utils.coerce import to_element_id, to_element_ids
+from rpw.utils.coerce import to_element_id, to_element_id_list
 from rpw.utils.coerce import to_category, to_class
 from rpw.utils.logger import logger
 from rpw.utils.logger import deprecate_warning
+from rpw.utils.mixins import BulkEditMixin
 
 # More Info on Performance and ElementFilters:
 # http://thebuildingcoder.typepad.com/blog/2015/12/quick-slow-and-linq-element-filtering.html
@@ -311,8 +311,7 @@ class FilterClasses():
 
         @classmethod
         def process_value(cls, element_references):
-            element_set = ElementSet(element_references)
-            return DB.ExclusionFilter(element_set.as_element_id_list)
+            return DB.ExclusionFilter(to_element_id_list(element_references))
 
     class InteresectFilter(LogicalFilter):
         keyword = 'and_collector'
@@ -337,7 +336,7 @@ class FilterClasses():
             return collector.UnionWith(new_collector)
 
 
-class Collector(BaseObjectWrapper):
+class Collector(BaseObjectWrapper, BulkEditMixin):
     """
     Revit FilteredElement Collector Wrapper
 
@@ -371,6 +370,10 @@ class Collector(BaseObjectWrapper):
         >>> Collector(owner_view=SomeView)
         >>> Collector(owner_view=None)
 
+        Edit collected elements in bulk. See :doc:`bulk`
+
+        >>> Collector(of_class='Wall', is_not_type=True).move((0, 10, 0))
+
     Attributes:
         collector.get_elements(): Returns list of all `collected` elements
         collector.get_first(): Returns first found element, or ``None``
@@ -394,7 +397,7 @@ class Collector(BaseObjectWrapper):
 
         Scope Options:
             * ``view`` `(DB.View)`: View Scope (Optional)
-            * ``element_ids`` `([ElementId])`: List of Element Ids to limit Collector Scope
+            * ``element_ids`` `([ElementId])`: List of Element Ids, :any:`ElementSet` or :any:`IdBitmap` to limit Collector Scope
             * ``elements`` `([Element])`: List of Elements to limit Collector Scope
 
         Warning:
@@ -413,7 +416,7 @@ class Collector(BaseObjectWrapper):
             * level (``DB.Level``, ``DB.ElementId``, ``Level Name``): Level, ElementId of Level, or Level Name
             * not_level (``DB.Level``, ``DB.ElementId``, ``Level Name``): Level, ElementId of Level, or Level Name
             * parameter_filter (:any:`ParameterFilter`): Applies ``ElementParameterFilter``
-            * exclude (`element_references`): Element(s) or ElementId(s) to exlude from result
+            * exclude (`element_references`): Element(s), ElementId(s) or :any:`IdBitmap` to exlude from result
             * and_collector (``collector``): Collector to intersect with. Elements must be present in both
             * or_collector (``collector``): Collector to Union with. Elements must be present on of the two.
             * where (`function`): function to test your elements against
@@ -428,15 +431,16 @@ class Collector(BaseObjectWrapper):
             collector = DB.FilteredElementCollector(collector_doc, view_id)
         elif 'elements' in filters:
             elements = filters.pop('elements')
-            element_ids = to_element_ids(elements)
-            collector = DB.FilteredElementCollector(collector_doc, List[DB.ElementId](element_ids))
+            element_ids = to_element_id_list(elements)
+            collector = DB.FilteredElementCollector(collector_doc, element_ids)
         elif 'element_ids' in filters:
-            element_ids = filters.pop('element_ids')
-            collector = DB.FilteredElementCollector(collector_doc, List[DB.ElementId](element_ids))
+            element_ids = to_element_id_list(filters.pop('element_ids'))
+            collector = DB.FilteredElementCollector(collector_doc, element_ids)
         else:
             collector = DB.FilteredElementCollector(collector_doc)
 
         super(Collector, self).__init__(collector)
+        self.doc = collector_doc
 
         for key in filters.keys():
             if key not in [f.keyword for f in FilterClasses.get_sorted()]:
@@ -550,6 +554,12 @@ class Collector(BaseObjectWrapper):
             return len(self.get_elements(wrapped=False))  # Revit 2015
 
     def __repr__(self):
+        # Counting elements executes the query, so it is opt-in
+        if self.rich_repr:
+            return self.full_repr()
+        return super(Collector, self).__repr__()
+
+    def _build_full_repr(self):
         return super(Collector, self).__repr__(data={'count': len(self)})
 
 
@@ -4,9 +4,15 @@ from math import pi as PI
 
 from rpw import revit, DB
 from rpw.base import BaseObjectWrapper
+from rpw.db.cache import DocumentCache
 from rpw.db.element import Element
 from rpw.db.xyz import XYZ
 from rpw.utils.mixins import ByNameCollectMixin
+from rpw.utils.logger import logger
+
+# Horizontal Sketch Planes created for model curves: {elevation: SketchPlane}
+sketch_plane_cache = DocumentCache('sketch_planes', clear_on_transaction=False,
+                                   clear_on_change=False)
 
 
 class Curve(BaseObjectWrapper):
@@ -23,16 +29,88 @@ class Curve(BaseObjectWrapper):
     def create_detail(self, view=None, doc=revit.doc):
         """
         Args:
-            view (``DB.View``): Optional View. Default: ``uidoc.ActiveView``
+            view (``DB.View``): Optional View. Default: ``doc.ActiveView``
             doc (``DB.Document``): Optional Document. Default: ``doc``
         """
         # TODO: Accept Detail Type (GraphicStyle)
-        view = view or revit.active_view.unwrap()
+        view = getattr(view, '_revit_object', view) or doc.ActiveView
         return doc.Create.NewDetailCurve(view, self._revit_object)
 
-    def create_model(self, view=None, doc=revit.doc):
+    def create_model(self, sketch_plane=None, doc=revit.doc):
+        """
+        Args:
+            sketch_plane (``DB.SketchPlane``): Optional Sketch Plane.
+                Default: horizontal plane at the curve start point. Planes
+                are reused for curves at the same elevation.
+            doc (``DB.Document``): Optional Document. Default: ``doc``
+        """
         # http://www.revitapidocs.com/2017.1/b880c4d7-9841-e44e-2a1c-36fefe274e2e.htm
-        raise NotImplemented
+        sketch_plane = sketch_plane or _get_sketch_plane(self._revit_object, doc)
+        return doc.Create.NewModelCurve(self._revit_object, sketch_plane)
+
+    @classmethod
+    def create_detail_many(cls, curves, view=None, doc=revit.doc):
+        """
+        Creates detail curves with a single API call.
+
+        Curves are validated before they are created: curves that are not
+        ``DB.Curve``, are unbound, are shorter than the document's short
+        curve tolerance, or are not parallel to the view plane are not
+        created, and are reported by index instead.
+
+        >>> lines = [Line.new([0, n], [10, n]) for n in range(20000)]
+        >>> with db.Transaction('Draw Lines'):
+        ...     detail_curves, failures = Curve.create_detail_many(lines)
+        >>> failures
+        {}
+
+        Args:
+            curves (``[DB.Curve]``): Curves or wrapped curves
+            view (``DB.View``): Optional View. Default: ``doc.ActiveView``
+            doc (``DB.Document``): Optional Document. Default: ``doc``
+
+        Returns:
+            (``tuple``): ``([DB.DetailCurve], {index: reason})``. Detail
+            curves are in input order, without the failed indexes.
+        """
+        view = getattr(view, '_revit_object', view) or doc.ActiveView
+        curve_array, failures = _to_curve_array(curves, doc, view.ViewDirection)
+        if curve_array.IsEmpty:
+            return [], failures
+        detail_curves = doc.Create.NewDetailCurveArray(view, curve_array)
+        return list(detail_curves), failures
+
+    @classmethod
+    def create_model_many(cls, curves, sketch_plane=None, doc=revit.doc):
+        """
+        Creates model curves with a single API call. Curves are validated
+        and reported the same way as in :func:`create_detail_many`, and
+        must lie on the sketch plane.
+
+        Args:
+            curves (``[DB.Curve]``): Curves or wrapped curves
+            sketch_plane (``DB.SketchPlane``): Optional Sketch Plane.
+                Default: horizontal plane at the first curve start point.
+                Planes are reused for curves at the same elevation.
+            doc (``DB.Document``): Optional Document. Default: ``doc``
+
+        Returns:
+            (``tuple``): ``([DB.ModelCurve], {index: reason})``
+        """
+        curves = [getattr(curve, '_revit_object', curve) for curve in curves]
+        if sketch_plane is None:
+            first_curve = next((c for c in curves
+                                if isinstance(c, DB.Curve) and c.IsBound), None)
+            if first_curve is None:
+                return [], _validate_curves(curves, doc)[1]
+            sketch_plane = _get_sketch_plane(first_curve, doc)
+        plane = sketch_plane.GetPlane()
+        curve_array, failures = _to_curve_array(curves, doc, plane.Normal,
+                                                plane.Origin)
+        if curve_array.IsEmpty:
+            return [], failures
+        model_curves = doc.Create.NewModelCurveArray(curve_array, sketch_plane)
+        return list(model_curves), failures
 
 
 class Line(Curve):
@@ -178,3 +256,69 @@ class Arc(Curve):
         else:
             raise NotImplemented('only arc by 3 pts available')
         return cls(arc)
+
+
+def _validate_curves(curves, doc, normal=None, origin=None):
+    """
+    Returns ``([(index, DB.Curve)], {index: reason})``. If normal is given,
+    curves must be parallel to the plane. If origin is also given, curves
+    must be on the plane. Planarity is checked on the tessellated curve,
+    with the document's vertex tolerance.
+    """
+    short_curve_tolerance = doc.Application.ShortCurveTolerance
+    tolerance = doc.Application.VertexTolerance
+    valid = []
+    failures = {}
+    for index, curve in enumerate(curves):
+        curve = getattr(curve, '_revit_object', curve)
+        if not isinstance(curve, DB.Curve):
+            failures[index] = 'not a curve: {}'.format(type(curve).__name__)
+            continue
+        if not curve.IsBound:
+            failures[index] = 'unbound curve'
+            continue
+        if curve.Length < short_curve_tolerance:
+            failures[index] = 'shorter than ShortCurveTolerance'
+            continue
+        if normal is not None:
+            points = curve.Tessellate()
+            start = points[0]
+            offsets = [(point - start).DotProduct(normal) for point in points]
+            if max([abs(offset) for offset in offsets]) > tolerance:
+                failures[index] = 'not parallel to plane'
+                continue
+            if origin is not None and \
+                    abs((start - origin).DotProduct(normal)) > tolerance:
+                failures[index] = 'not on plane'
+                continue
+        valid.append((index, curve))
+    return valid, failures
+
+
+def _to_curve_array(curves, doc, normal=None, origin=None):
+    """ Returns ``(DB.CurveArray, {index: reason})`` of valid curves """
+    valid, failures = _validate_curves(curves, doc, normal, origin)
+    if failures:
+        logger.warning('{} curve(s) not created: {}'.format(
+                       len(failures), sorted(failures.items())[:10]))
+    curve_array = DB.CurveArray()
+    for _, curve in valid:
+        curve_array.Append(curve)
+    return curve_array, failures
+
+
+def _get_sketch_plane(curve, doc):
+    """
+    Returns horizontal Sketch Plane at start point of curve.
+    Planes are cached per elevation, and created only once. Cached planes
+    that were deleted or rolled back are created again.
+    """
+    origin = curve.GetEndPoint(0)
+    tolerance = doc.Application.VertexTolerance
+    key = int(round(origin.Z / tolerance))
+    cache = sketch_plane_cache.get(doc)
+    sketch_plane = cache.get(key)
+    if sketch_plane is None or not sketch_plane.IsValidObject:
+        plane = DB.Plane.CreateByNormalAndOrigin(DB.XYZ.BasisZ, origin)
+        sketch_plane = cache[key] = DB.SketchPlane.Create(doc, plane)
+    return sketch_plane
@@ -13,7 +13,8 @@ from rpw.exceptions import RpwParameterNotFound, RpwTypeError
 from rpw.utils.logger import logger, deprecate_warning
 from rpw.utils.mixins import CategoryMixin
 from rpw.db.builtins import BicEnum, BipEnum
-from rpw.utils.coerce import to_element_ids
+from rpw.db.cache import get_element_type
+from rpw.utils.coerce import resolve_elements
 
 
 class Element(BaseObjectWrapper, CategoryMixin):
@@ -141,6 +142,8 @@ class Element(BaseObjectWrapper, CategoryMixin):
         Get's Element Type using the default GetTypeId() Method.
         For some Elements, this is the same as ``element.Symbol`` or ``wall.WallType``
 
+        Types are cached per document (see :any:`rpw.db.cache`).
+
         Args:
             doc (``DB.Document``, optional): Document of Element [default: revit.doc]
 
@@ -148,8 +151,7 @@ class Element(BaseObjectWrapper, CategoryMixin):
             (``Element``): Wrapped ``rpw.db.Element`` element type
 
         """
-        element_type_id = self._revit_object.GetTypeId()
-        element_type = self._revit_object.Document.GetElement(element_type_id)
+        element_type = get_element_type(self._revit_object)
         return Element(element_type)
 
     @property
@@ -227,27 +229,32 @@ class Element(BaseObjectWrapper, CategoryMixin):
         return Element(element)
 
     @staticmethod
-    def from_list(element_references, doc=None):
+    def from_list(element_references, doc=None, skip_missing=False):
         """
-        Instantiate Elements from a list of DB.Element instances
+        Instantiate Elements from a list of element references.
+        References are resolved in a single pass. See
+        :func:`rpw.utils.coerce.resolve_elements`
 
         Args:
             elements (``[DB.Element, DB.ElementId]``): List of element references
+            doc (``DB.Document``, optional): Document of Elements [default: revit.doc]
+            skip_missing (``bool``, optional): Skip and log ids not found in
+                the document, instead of raising [default: False]
 
         Returns:
             (``list``): List of ``rpw.db.Element`` instances
 
+        Raises:
+            RpwTypeError: If an id is not found and ``skip_missing`` is False
+
         """
-        doc = doc or revit.doc
-        try:
-            return [Element(e) for e in element_references]
-        except RpwTypeError:
-            pass
-        try:
-            element_ids = to_element_ids(element_references)
-            return [Element.from_id(id_, doc=doc) for id_ in element_ids]
-        except RpwTypeError:
-            raise
+        elements, missing_ids = resolve_elements(element_references, doc=doc)
+        if missing_ids:
+            if not skip_missing:
+                raise RpwTypeError('Element or Element Child', 'None')
+            logger.warning('Element.from_list: {} element(s) not found'.format(
+                                                            len(missing_ids)))
+        return [Element(e) for e in elements]
 
 
     @staticmethod
@@ -259,6 +266,18 @@ class Element(BaseObjectWrapper, CategoryMixin):
         """ Deletes Element from Model """
         self.doc.Delete(self._revit_object.Id)
 
+    def _lightweight_repr(self):
+        """ Repr with only class, id and name. The name is only read once """
+        try:
+            name = self.__dict__['_repr_name']
+        except KeyError:
+            try:
+                name = self.name
+            except Exception:
+                name = None
+            object.__setattr__(self, '_repr_name', name)
+        return Element.__repr__(self, data={'name': name})
+
     def __repr__(self, data=None):
         if data is None:
             data = {}
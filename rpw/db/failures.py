@@ -0,0 +1,163 @@
+"""
+Transaction Failures
+
+Warnings and errors raised while a :any:`Transaction` is committed are
+normally shown to the user in a dialog, which stalls unattended batch runs.
+A failure mode can be passed to a Transaction to handle them in code instead,
+and the failures are collected in a :any:`FailureReport`:
+
+>>> from rpw import db
+>>> with db.Transaction('Join Walls', failures='suppress_warnings') as t:
+...     join_walls(walls)
+>>> t.failure_report
+<rpw:FailureReport | warnings:12 errors:0>
+>>> t.failure_report.warnings[0]
+{'severity': 'Warning', 'description': 'Highlighted walls overlap...',
+ 'element_ids': [312, 315], 'action': 'deleted', 'transaction': 'Join Walls'}
+
+Failure Modes:
+    * ``'suppress_warnings'``: Warnings are deleted. Errors are resolved
+      with their default resolution, or the transaction is rolled back if
+      the error cannot be resolved.
+    * ``'rollback_on_error'``: Warnings are deleted. The transaction is
+      rolled back if there are any errors.
+    * ``callable``: Called with the ``DB.FailuresAccessor`` after failures
+      are added to the report. Should return a ``DB.FailureProcessingResult``.
+      If it returns ``None``, ``FailureProcessingResult.Continue`` is used.
+
+"""  #
+
+from rpw import DB
+from rpw.base import BaseObject
+from rpw.exceptions import RpwValueError
+
+FAILURE_MODES = ('suppress_warnings', 'rollback_on_error')
+
+
+class FailureReport(BaseObject):
+    """
+    Failures collected during one or more Transactions.
+
+    Each entry is a dictionary with ``severity``, ``description``,
+    ``element_ids``, ``action`` and ``transaction``.
+    ``action`` is ``'deleted'``, ``'resolved'``, ``'rolled_back'``,
+    or ``None`` if the failure was left to a callable handler.
+    """
+
+    def __init__(self):
+        self.entries = []
+
+    @property
+    def warnings(self):
+        """ Entries with Warning severity """
+        return [entry for entry in self.entries
+                if entry['severity'] == 'Warning']
+
+    @property
+    def errors(self):
+        """ Entries with Error or DocumentCorruption severity """
+        return [entry for entry in self.entries
+                if entry['severity'] != 'Warning']
+
+    def add(self, message, action, transaction=None):
+        """
+        Adds a failure to the report.
+
+        Args:
+            message (``DB.FailureMessageAccessor``): Failure Message
+            action (``str``): Action taken
+            transaction (``str``): Transaction name
+        """
+        element_ids = [element_id.IntegerValue for element_id
+                       in message.GetFailingElementIds()]
+        self.entries.append({'severity': str(message.GetSeverity()),
+                             'description': message.GetDescriptionText(),
+                             'element_ids': element_ids,
+                             'action': action,
+                             'transaction': transaction})
+
+    def extend(self, report):
+        """ Adds entries of another :any:`FailureReport` """
+        self.entries.extend(report.entries)
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __repr__(self):
+        return super(FailureReport, self).__repr__(
+                                    data={'warnings': len(self.warnings),
+                                          'errors': len(self.errors)})
+
+
+class FailuresPreprocessor(DB.IFailuresPreprocessor):
+    """
+    ``IFailuresPreprocessor`` used by :any:`Transaction` to handle failures
+    without showing dialogs. See module docstring for failure modes.
+
+    Args:
+        mode (``str``, ``callable``): Failure mode
+        report (:any:`FailureReport`): Report failures are added to
+        name (``str``): Transaction name, stored in report entries
+    """
+
+    def __init__(self, mode, report, name=None):
+        if not callable(mode) and mode not in FAILURE_MODES:
+            raise RpwValueError(' or '.join(FAILURE_MODES), mode)
+        self.mode = mode
+        self.report = report
+        self.name = name
+        # Failures already reported, in case Revit calls the preprocessor
+        # again for the same Transaction: {(definition guid, element ids)}
+        self._reported = set()
+
+    def PreprocessFailures(self, failures_accessor):
+        Result = DB.FailureProcessingResult
+        result = Result.Continue
+        rollback = False
+        for message in failures_accessor.GetFailureMessages():
+            action = self._get_action(message)
+            # Message is read before it is deleted or resolved
+            key = (str(message.GetFailureDefinitionId().Guid),
+                   tuple(sorted([element_id.IntegerValue for element_id
+                                 in message.GetFailingElementIds()])))
+            if key not in self._reported:
+                self._reported.add(key)
+                self.report.add(message, action, transaction=self.name)
+            if action == 'deleted':
+                failures_accessor.DeleteWarning(message)
+            elif action == 'resolved':
+                failures_accessor.ResolveFailure(message)
+                result = Result.ProceedWithCommit
+            elif action == 'rolled_back':
+                rollback = True
+
+        if callable(self.mode):
+            return self.mode(failures_accessor) or Result.Continue
+        if rollback:
+            return Result.ProceedWithRollBack
+        return result
+
+    def _get_action(self, message):
+        """ Returns the action taken for a failure message """
+        if callable(self.mode):
+            return None
+        if message.GetSeverity() == DB.FailureSeverity.Warning:
+            return 'deleted'
+        if self.mode == 'suppress_warnings' and message.HasResolutions():
+            return 'resolved'
+        return 'rolled_back'
+
+    def install(self, transaction):
+        """
+        Sets this preprocessor in the failure handling options of a
+        ``DB.Transaction``. Rollbacks caused by failures are cleared,
+        so no dialog is shown.
+        """
+        options = transaction.GetFailureHandlingOptions()
+        options.SetFailuresPreprocessor(self)
+        options.SetClearAfterRollback(True)
+        transaction.SetFailureHandlingOptions(options)
+
@@ -113,6 +113,11 @@ class FamilyInstance(Element, CategoryMixin):
             return None
 
     def __repr__(self):
+        if self.rich_repr:
+            return self.full_repr()
+        return self._lightweight_repr()
+
+    def _build_full_repr(self):
         symbol_name = self.get_symbol(wrapped=True).name
         return super(FamilyInstance, self).__repr__(data={'symbol': symbol_name})
 
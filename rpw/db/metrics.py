@@ -0,0 +1,264 @@
+"""
+Transaction Metrics
+
+:any:`Transaction` and :any:`TransactionGroup` can record how long a
+context takes, split between the code inside the block and the commit
+(which includes regeneration), and how many elements were changed:
+
+>>> from rpw import db
+>>> from rpw.db import metrics
+>>> buffer = metrics.RingBufferSink(size=100)
+>>> with db.Transaction('Renumber', metrics=buffer) as t:
+...     renumber(doors)
+>>> t.metrics
+<rpw:TransactionMetrics | name:Renumber status:Committed block:2.10s commit:0.85s>
+>>> t.metrics.to_dict()
+OrderedDict([('name', 'Renumber'), ('kind', 'Transaction'), ...])
+
+Changed element counts are read from the ``DocumentChanged`` event,
+which is only subscribed to while metrics are being recorded.
+
+Records are sent to the sink passed to the Transaction, and to all sinks
+registered with :func:`add_sink`. Once a sink is registered, all
+Transactions record metrics, unless created with ``metrics=False``:
+
+>>> metrics.add_sink(metrics.CsvSink('C:/logs/transactions.csv'))
+>>> metrics.add_sink(metrics.LoggerSink())
+
+A sink is any callable that receives a :any:`TransactionMetrics` record.
+
+"""  #
+
+import csv
+import os
+import time
+from collections import OrderedDict, deque
+
+from rpw.base import BaseObject
+from rpw.utils.logger import logger
+
+# Sinks that receive records of all Transactions
+sinks = []
+
+
+class TransactionMetrics(BaseObject):
+    """
+    Metrics of one Transaction or TransactionGroup
+
+    Attributes:
+        name (``str``): Transaction Name
+        kind (``str``): ``'Transaction'`` or ``'TransactionGroup'``
+        status (``str``): Final ``DB.TransactionStatus``, ie. ``'Committed'``
+        block_seconds (``float``): Time spent inside the context
+        commit_seconds (``float``): Time spent in ``Commit`` or ``Assimilate``
+        added (``int``): Number of added elements
+        modified (``int``): Number of modified elements
+        deleted (``int``): Number of deleted elements
+        warnings (``int``): Number of warnings. See :doc:`failures`
+        errors (``int``): Number of errors. See :doc:`failures`
+        timestamp (``float``): Time the context ended, as ``time.time()``
+    """
+
+    FIELDS = ('name', 'kind', 'status', 'block_seconds', 'commit_seconds',
+              'added', 'modified', 'deleted', 'warnings', 'errors',
+              'timestamp')
+
+    def __init__(self, name, kind):
+        self.name = name
+        self.kind = kind
+        self.status = None
+        self.block_seconds = 0.0
+        self.commit_seconds = 0.0
+        self.added = 0
+        self.modified = 0
+        self.deleted = 0
+        self.warnings = 0
+        self.errors = 0
+        self.timestamp = None
+
+    def to_dict(self):
+        """ Returns record as an ``OrderedDict`` """
+        return OrderedDict([(field, getattr(self, field))
+                            for field in self.FIELDS])
+
+    def __repr__(self):
+        return super(TransactionMetrics, self).__repr__(data={
+                            'name': self.name,
+                            'status': self.status,
+                            'block': '{:.2f}s'.format(self.block_seconds),
+                            'commit': '{:.2f}s'.format(self.commit_seconds)})
+
+
+class LoggerSink(object):
+    """ Logs each record using the rpw logger """
+
+    def __call__(self, record):
+        logger.info('{kind} "{name}" {status}: block {block_seconds:.3f}s, '
+                    'commit {commit_seconds:.3f}s, added {added}, '
+                    'modified {modified}, deleted {deleted}, '
+                    'warnings {warnings}, errors {errors}'.format(
+                                                    **record.to_dict()))
+
+
+class CsvSink(object):
+    """
+    Appends each record as a row to a CSV file.
+    A header is written if the file is new.
+
+    Args:
+        path (``str``): CSV file path
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def __call__(self, record):
+        write_header = not os.path.exists(self.path) or \
+            not os.path.getsize(self.path)
+        with open(self.path, 'ab') as csv_file:
+            writer = csv.writer(csv_file)
+            if write_header:
+                writer.writerow(TransactionMetrics.FIELDS)
+            writer.writerow(record.to_dict().values())
+
+
+class RingBufferSink(object):
+    """
+    Keeps the last records in memory
+
+    Args:
+        size (``int``): Maximum number of records kept [default: 100]
+    """
+
+    def __init__(self, size=100):
+        self.records = deque(maxlen=size)
+
+    def __call__(self, record):
+        self.records.append(record)
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def __len__(self):
+        return len(self.records)
+
+
+def add_sink(sink):
+    """ Registers a sink that receives records of all Transactions """
+    if sink not in sinks:
+        sinks.append(sink)
+
+
+def remove_sink(sink):
+    """ Removes a sink registered with :func:`add_sink` """
+    if sink in sinks:
+        sinks.remove(sink)
+
+
+def emit(record, sink=None):
+    """
+    Sends record to sink and all registered sinks.
+    Errors raised by sinks are logged, so they do not affect Transactions.
+    """
+    record_sinks = list(sinks)
+    if sink is not None and sink not in sinks:
+        record_sinks.append(sink)
+    for record_sink in record_sinks:
+        try:
+            record_sink(record)
+        except Exception as exc:
+            logger.error('Metrics sink {} failed: {}'.format(record_sink, exc))
+
+
+def create_recorder(metrics, name, kind, doc):
+    """
+    Returns a :any:`MetricsRecorder`, or ``None`` if metrics are disabled.
+
+    Args:
+        metrics (``bool``, ``callable``, ``None``): ``True`` to record,
+            ``False`` to disable, a sink to record and send records to it,
+            or ``None`` to record only if sinks are registered.
+    """
+    if metrics is False or (metrics is None and not sinks):
+        return None
+    sink = metrics if callable(metrics) else None
+    return MetricsRecorder(name, kind, doc, sink=sink)
+
+
+class MetricsRecorder(object):
+    """
+    Used by :any:`Transaction` and :any:`TransactionGroup`
+    to build a :any:`TransactionMetrics` record.
+    """
+
+    def __init__(self, name, kind, doc, sink=None):
+        self.record = TransactionMetrics(name, kind)
+        self.sink = sink
+        self._counter = _ChangeCounter(doc)
+        self._block_start = None
+        self._commit_start = None
+
+    def block_started(self, count_changes=False):
+        self._block_start = time.time()
+        if count_changes:
+            self._counter.start()
+
+    def block_ended(self):
+        self.record.block_seconds = time.time() - self._block_start
+
+    def commit_started(self):
+        self._counter.start()
+        self._commit_start = time.time()
+
+    def commit_ended(self):
+        if self._commit_start is not None:
+            self.record.commit_seconds = time.time() - self._commit_start
+            self._commit_start = None
+
+    def finish(self, status, failure_report=None):
+        """ Completes record, sends it to sinks and returns it """
+        self.commit_ended()
+        self._counter.stop()
+        record = self.record
+        record.status = str(status)
+        record.added = len(self._counter.added)
+        record.modified = len(self._counter.modified)
+        record.deleted = len(self._counter.deleted)
+        if failure_report is not None:
+            record.warnings = len(failure_report.warnings)
+            record.errors = len(failure_report.errors)
+        record.timestamp = time.time()
+        emit(record, self.sink)
+        return record
+
+
+class _ChangeCounter(object):
+    """ Collects ids changed in a document while subscribed to DocumentChanged """
+
+    def __init__(self, doc):
+        self.doc = doc
+        self.added = set()
+        self.modified = set()
+        self.deleted = set()
+        self._active = False
+        # Same handler instance is needed to unsubscribe
+        self._handler = self._on_document_changed
+
+    def start(self):
+        if not self._active:
+            self.doc.Application.DocumentChanged += self._handler
+            self._active = True
+
+    def stop(self):
+        if self._active:
+            self.doc.Application.DocumentChanged -= self._handler
+            self._active = False
+
+    def _on_document_changed(self, sender, args):
+        if not args.GetDocument().Equals(self.doc):
+            return
+        self.added.update([i.IntegerValue for i in args.GetAddedElementIds()])
+        self.modified.update([i.IntegerValue for i
+                              in args.GetModifiedElementIds()])
+        self.deleted.update([i.IntegerValue for i
+                             in args.GetDeletedElementIds()])
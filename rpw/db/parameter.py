@@ -9,11 +9,16 @@ Parameter Wrapper
 """  #
 from rpw import revit, DB
 from rpw.db.builtins import BipEnum
+from rpw.db.cache import DocumentCache, get_element_type
 from rpw.base import BaseObjectWrapper
 from rpw.exceptions import RpwException, RpwWrongStorageType
 from rpw.exceptions import RpwParameterNotFound, RpwTypeError
 from rpw.utils.logger import logger
 
+# Values of type parameters: {(type_id_int, param_name): value}
+type_parameter_cache = DocumentCache('type_parameter_values')
+_NOT_FOUND = object()
+
 
 class ParameterSet(BaseObjectWrapper):
     """
@@ -47,11 +52,51 @@ class ParameterSet(BaseObjectWrapper):
         super(ParameterSet, self).__init__(element)
         self.builtins = _BuiltInParameterSet(self._revit_object)
 
-    def get_value(self, param_name, default_value=None):
+    def get_value(self, param_name, default_value=None, include_type=False):
+        """ Get's the value of a parameter by name.
+
+        >>> element.parameters.get_value('Comments')
+        'Some Comment'
+        >>> element.parameters.get_value('Width', include_type=True)
+        3.0
+
+        Args:
+            param_name (``str``): Name of Parameter
+            default_value (``any``): Value returned if parameter is not found
+            include_type (``bool``): If the element does not have the
+                parameter, look it up on the element's type.
+                Types and their values are cached per document,
+                so elements that share a type only read it once.
+                Values set with :any:`Parameter.value` are updated in the
+                cache, other changes are seen once the transaction ends.
+                See :doc:`cache`
+
+        Returns:
+            (``type``): parameter value in python type, or ``default_value``
+        """
+        parameter = self._revit_object.LookupParameter(param_name)
+        if parameter:
+            return Parameter(parameter).value
+        if include_type:
+            value = self._get_type_value(param_name)
+            if value is not _NOT_FOUND:
+                return value
+        return default_value
+
+    def _get_type_value(self, param_name):
+        """ Returns cached value of the type parameter, or ``_NOT_FOUND`` """
+        element_type = get_element_type(self._revit_object)
+        if element_type is None:
+            return _NOT_FOUND
+        cache = type_parameter_cache.get(element_type.Document)
+        key = (element_type.Id.IntegerValue, param_name)
         try:
-            return self.__getitem__(param_name).value
-        except RpwParameterNotFound:
-            return default_value
+            return cache[key]
+        except KeyError:
+            parameter = element_type.LookupParameter(param_name)
+            value = Parameter(parameter).value if parameter else _NOT_FOUND
+            cache[key] = value
+            return value
 
     def __getitem__(self, param_name):
         """ Get's parameter by name.
@@ -86,15 +131,25 @@ class ParameterSet(BaseObjectWrapper):
         return [Parameter(parameter) for parameter in self._revit_object.Parameters]
 
     def to_dict(self):
-        """ WIP: Returns a Serializable Dictionary """
+        """ Returns a list of Serializable Dictionaries, one per parameter.
+        To export parameters of many elements use :any:`rpw.db.export.stream`
+        """
         return [p.to_dict() for p in self.all]
 
     def __len__(self):
-        return len(self.all)
+        return self._revit_object.Parameters.Size
 
     def __repr__(self):
         """ Adds data to Base __repr__ to add Parameter List Name """
-        return super(ParameterSet, self).__repr__(data={'count': len(self)})
+        if self.rich_repr:
+            return self.full_repr()
+        return super(ParameterSet, self).__repr__(
+                                    data={'element_id': self._revit_object.Id})
+
+    def _build_full_repr(self):
+        return super(ParameterSet, self).__repr__(
+                                    data={'element_id': self._revit_object.Id,
+                                          'count': len(self)})
 
 
 class _BuiltInParameterSet(BaseObjectWrapper):
@@ -243,16 +298,17 @@ class Parameter(BaseObjectWrapper):
             * Storage is ``float`` and value is ``int``; value is converted to ``float``
 
         """
-        if self.type is str:
+        python_type = self.type
+        if python_type is str:
             return self._revit_object.AsString()
-        if self.type is float:
+        if python_type is float:
             return self._revit_object.AsDouble()
-        if self.type is DB.ElementId:
+        if python_type is DB.ElementId:
             return self._revit_object.AsElementId()
-        if self.type is int:
+        if python_type is int:
             return self._revit_object.AsInteger()
 
-        raise RpwException('could not get storage type: {}'.format(self.type))
+        raise RpwException('could not get storage type: {}'.format(python_type))
 
     @value.setter
     def value(self, value):
@@ -279,8 +335,18 @@ class Parameter(BaseObjectWrapper):
                 raise RpwWrongStorageType(self.type, value)
 
         param = self._revit_object.Set(value)
+        self._invalidate_type_value()
         return param
 
+    def _invalidate_type_value(self):
+        """ Removes cached value of a type parameter. See :any:`ParameterSet.get_value` """
+        element = self._revit_object.Element
+        if element is None:
+            return
+        cache = type_parameter_cache.get(element.Document)
+        cache.pop((element.Id.IntegerValue, self._revit_object.Definition.Name),
+                  None)
+
     @property
     def value_string(self):
         """ Ensure Human Readable String Value """
@@ -296,8 +362,9 @@ class Parameter(BaseObjectWrapper):
             * value: Uses best parameter method based on StorageType
             * value_string: Parameter.AsValueString
         """
-        value = self.value if not isinstance(self.value, DB.ElementId) \
-                           else self.value.IntegerValue
+        value = self.value
+        if isinstance(value, DB.ElementId):
+            value = value.IntegerValue
         return {
                 'name': self.name,
                 'type': self.type.__name__,
@@ -0,0 +1,391 @@
+"""
+Spatial Index
+
+In-memory uniform grid of element bounding boxes. Boxes are read from the
+document once when the index is built, and queries run in python without
+further API calls.
+
+>>> from rpw import db
+>>> index = db.SpatialIndex.build(db.Collector(of_category='Furniture',
+...                                            is_not_type=True))
+>>> index.within(((0, 0, 0), (10, 10, 10)))
+[<ElementId>, <ElementId>]
+>>> index.nearest(some_point, k=3)
+[(<ElementId>, 1.5), (<ElementId>, 2.0), (<ElementId>, 4.2)]
+>>> walls_index = db.SpatialIndex.build(db.Collector(of_class='Wall'))
+>>> index.overlaps(walls_index)
+[(<ElementId>, <ElementId>), ...]
+
+Indexes built with a ``name`` are cached per document. They are kept when
+a :any:`Transaction` ends, and indexed elements that are modified or
+deleted are updated when the document's ``DocumentChanged`` event is raised.
+Later calls with the same name return the cached index, unless the
+elements, cell size or view are different, in which case it is rebuilt:
+
+>>> index = db.SpatialIndex.build(furniture, name='furniture')
+
+Added elements are only indexed when the index is rebuilt, or updated
+manually with their ids:
+
+>>> index.update(added_ids)
+
+"""  #
+
+import math
+
+from rpw import revit, DB
+from rpw.base import BaseObject
+from rpw.db.cache import DocumentCache
+from rpw.utils.coerce import to_element_id, to_xyz_tuple, resolve_elements
+from rpw.utils.logger import logger
+from rpw.exceptions import RpwCoerceError
+
+
+def _update_indexes(args, cache):
+    """ Updates cached indexes with elements changed by DocumentChanged.
+    Returns ``False``, so the cache is not cleared """
+    deleted_ids = list(args.GetDeletedElementIds())
+    modified_ids = list(args.GetModifiedElementIds())
+    for index in cache.values():
+        index.update([element_id for element_id in modified_ids
+                      if element_id.IntegerValue in index._source_ids],
+                     deleted_ids=deleted_ids)
+    return False
+
+
+spatial_index_cache = DocumentCache('spatial_indexes',
+                                    clear_on_transaction=False,
+                                    clear_on_change=_update_indexes)
+
+
+class SpatialIndex(BaseObject):
+    """
+    Uniform grid of element bounding boxes.
+
+    Boxes that span more than ``max_cells`` cells (ie. large floors) are
+    kept in a separate list that is checked by every query, so they do not
+    fill the grid.
+
+    Args:
+        cell_size (``float``, optional): Size of grid cells in feet. If not
+            provided, it is computed from the median box size when the
+            index is built.
+        doc (``DB.Document``, optional): Document [default: revit.doc]
+        view (``DB.View``, optional): View used to read bounding boxes
+            [default: None, model bounding boxes]
+    """
+
+    max_cells = 64
+
+    def __init__(self, cell_size=None, doc=None, view=None):
+        self.doc = doc or revit.doc
+        self.view = getattr(view, '_revit_object', view)
+        self.cell_size = cell_size
+        # {id_int: (min_x, min_y, min_z, max_x, max_y, max_z)}
+        self._boxes = {}
+        # {(i, j, k): set(id_int)}
+        self._cells = {}
+        # {id_int: [cell keys]}, or None for large boxes
+        self._box_cells = {}
+        self._large = set()
+        # Ids of all indexed elements, including those without a box
+        self._source_ids = set()
+
+    @classmethod
+    def build(cls, elements, cell_size=None, view=None, doc=None, name=None):
+        """
+        Builds an index from elements.
+
+        Args:
+            elements (``Collector``, ``[DB.Element]``, ``[DB.ElementId]``):
+                Elements to index. Elements without bounding box, and ids
+                not found in the document are skipped.
+            cell_size (``float``, optional): See :any:`SpatialIndex`
+            view (``DB.View``, optional): See :any:`SpatialIndex`
+            doc (``DB.Document``, optional): Document [default: revit.doc]
+            name (``str``, optional): If provided, the index is cached for
+                the document, and returned by later calls with the same
+                name, elements, cell size and view. If any of them is
+                different, the index is rebuilt.
+
+        Returns:
+            (:any:`SpatialIndex`): Index
+        """
+        doc = doc or revit.doc
+        # Collectors are only iterated once, ids are resolved to elements
+        elements, _ = resolve_elements(elements, doc=doc)
+        source_ids = set([element.Id.IntegerValue for element in elements])
+        if name is not None:
+            cached = spatial_index_cache.get(doc).get(name)
+            if cached is not None and cached._matches(source_ids, cell_size, view):
+                return cached
+
+        index = cls(cell_size=cell_size, doc=doc, view=view)
+        index._source_ids = source_ids
+        boxes = {}
+        skipped = 0
+        for element in elements:
+            box = index._read_box(element)
+            if box is None:
+                skipped += 1
+                continue
+            boxes[element.Id.IntegerValue] = box
+        if index.cell_size is None:
+            index.cell_size = _get_cell_size(boxes.values())
+        for id_int, box in boxes.items():
+            index._insert(id_int, box)
+        logger.debug('SpatialIndex: {} boxes, {} skipped'.format(len(boxes),
+                                                                  skipped))
+        if name is not None:
+            spatial_index_cache.get(doc)[name] = index
+        return index
+
+    def update(self, element_ids, deleted_ids=None):
+        """
+        Re-reads bounding boxes of changed elements.
+
+        Args:
+            element_ids (``[DB.ElementId]``): Added or modified elements
+            deleted_ids (``[DB.ElementId]``, optional): Deleted elements
+        """
+        for element_id in deleted_ids or []:
+            id_int = to_element_id(element_id).IntegerValue
+            self._remove(id_int)
+            self._source_ids.discard(id_int)
+        for element_id in element_ids:
+            element_id = to_element_id(element_id)
+            id_int = element_id.IntegerValue
+            self._remove(id_int)
+            self._source_ids.add(id_int)
+            element = self.doc.GetElement(element_id)
+            box = self._read_box(element) if element is not None else None
+            if box is not None:
+                self._insert(id_int, box)
+
+    def within(self, box, inside=False):
+        """
+        Elements with bounding boxes that intersect a box.
+
+        Args:
+            box (:any:`BoundingBox`, ``DB.BoundingBoxXYZ``, ``tuple``): Box,
+                or tuple of min and max points
+            inside (``bool``): Only return elements completely inside the box
+                [default: False]
+
+        Returns:
+            (``[DB.ElementId]``): Element Ids
+        """
+        box = _to_box(box)
+        if inside:
+            test = _contains
+        else:
+            test = _intersects
+        return [DB.ElementId(id_int) for id_int in self._query(box)
+                if test(box, self._boxes[id_int])]
+
+    def nearest(self, point, k=1):
+        """
+        Elements nearest to a point, by distance to their bounding boxes.
+
+        Args:
+            point (``point-like``): Point
+            k (``int``): Number of elements to return [default: 1]
+
+        Returns:
+            (``[(DB.ElementId, float)]``): Element Ids and distances, nearest
+            first.
+        """
+        if not self._boxes:
+            return []
+        x, y, z = to_xyz_tuple(point)
+        k = min(k, len(self._boxes))
+        bounds = self.bounds
+        max_radius = max([abs(x - bounds[0]), abs(x - bounds[3]),
+                          abs(y - bounds[1]), abs(y - bounds[4]),
+                          abs(z - bounds[2]), abs(z - bounds[5])])
+        radius = self.cell_size
+        while True:
+            search_box = (x - radius, y - radius, z - radius,
+                          x + radius, y + radius, z + radius)
+            distances = [(_distance_to_box(x, y, z, self._boxes[id_int]), id_int)
+                         for id_int in self._query(search_box)]
+            # Boxes outside the radius can be closer than ones in the
+            # search box corners, so only distances <= radius are final
+            found = sorted([d for d in distances if d[0] <= radius])
+            if len(found) >= k or radius >= max_radius:
+                found = found if len(found) >= k else sorted(distances)
+                return [(DB.ElementId(id_int), distance)
+                        for distance, id_int in found[:k]]
+            radius *= 2
+
+    def overlaps(self, other_index, tolerance=0.0):
+        """
+        Pairs of elements of two indexes with intersecting bounding boxes.
+
+        Args:
+            other_index (:any:`SpatialIndex`): Index
+            tolerance (``float``): Distance boxes are expanded by before
+                testing [default: 0]
+
+        Returns:
+            (``[(DB.ElementId, DB.ElementId)]``): Pairs of Element Ids of
+            this index and other index.
+        """
+        pairs = []
+        for id_int, box in self._boxes.items():
+            box = _expand(box, tolerance)
+            for other_id in other_index._query(box):
+                if other_id == id_int and other_index is self:
+                    continue
+                if _intersects(box, other_index._boxes[other_id]):
+                    pairs.append((DB.ElementId(id_int), DB.ElementId(other_id)))
+        return pairs
+
+    def get_box(self, element_reference):
+        """
+        Returns:
+            (``tuple``): Indexed box (min_x, min_y, min_z, max_x, max_y, max_z)
+        """
+        return self._boxes[to_element_id(element_reference).IntegerValue]
+
+    @property
+    def bounds(self):
+        """ Box containing all indexed boxes, or None if empty """
+        if not self._boxes:
+            return None
+        boxes = list(self._boxes.values())
+        return tuple([min([box[n] for box in boxes]) for n in range(3)] +
+                     [max([box[n] for box in boxes]) for n in range(3, 6)])
+
+    def _matches(self, source_ids, cell_size, view):
+        """ True if index was built with the same elements and options """
+        view = getattr(view, '_revit_object', view)
+        view_id = view.Id.IntegerValue if view is not None else None
+        own_view_id = self.view.Id.IntegerValue if self.view is not None else None
+        return (source_ids == self._source_ids and view_id == own_view_id and
+                (cell_size is None or cell_size == self.cell_size))
+
+    def _read_box(self, element):
+        bbox = element.get_BoundingBox(self.view)
+        if bbox is None:
+            return None
+        bbox_min, bbox_max = bbox.Min, bbox.Max
+        return (bbox_min.X, bbox_min.Y, bbox_min.Z,
+                bbox_max.X, bbox_max.Y, bbox_max.Z)
+
+    def _cell_range(self, box):
+        size = self.cell_size
+        return [range(int(math.floor(box[n] / size)),
+                      int(math.floor(box[n + 3] / size)) + 1)
+                for n in range(3)]
+
+    def _insert(self, id_int, box):
+        self._boxes[id_int] = box
+        x_range, y_range, z_range = self._cell_range(box)
+        if len(x_range) * len(y_range) * len(z_range) > self.max_cells:
+            self._large.add(id_int)
+            self._box_cells[id_int] = None
+            return
+        cells = self._cells
+        keys = [(i, j, k) for i in x_range for j in y_range for k in z_range]
+        for key in keys:
+            if key in cells:
+                cells[key].add(id_int)
+            else:
+                cells[key] = set([id_int])
+        self._box_cells[id_int] = keys
+
+    def _remove(self, id_int):
+        if id_int not in self._boxes:
+            return
+        del self._boxes[id_int]
+        keys = self._box_cells.pop(id_int)
+        if keys is None:
+            self._large.discard(id_int)
+            return
+        for key in keys:
+            cell = self._cells[key]
+            cell.discard(id_int)
+            if not cell:
+                del self._cells[key]
+
+    def _query(self, box):
+        """ Returns set of ids in cells overlapping box, and large boxes """
+        x_range, y_range, z_range = self._cell_range(box)
+        ids = set(self._large)
+        cells = self._cells
+        if len(x_range) * len(y_range) * len(z_range) > len(cells):
+            # Query is larger than the grid. Check occupied cells instead.
+            x_min, x_max = x_range[0], x_range[-1]
+            y_min, y_max = y_range[0], y_range[-1]
+            z_min, z_max = z_range[0], z_range[-1]
+            for (i, j, k), cell in cells.items():
+                if (x_min <= i <= x_max and y_min <= j <= y_max and
+                        z_min <= k <= z_max):
+                    ids.update(cell)
+            return ids
+        for i in x_range:
+            for j in y_range:
+                for k in z_range:
+                    cell = cells.get((i, j, k))
+                    if cell:
+                        ids.update(cell)
+        return ids
+
+    def __contains__(self, element_reference):
+        return to_element_id(element_reference).IntegerValue in self._boxes
+
+    def __len__(self):
+        return len(self._boxes)
+
+    def __repr__(self):
+        return super(SpatialIndex, self).__repr__(data={'count': len(self),
+                                                        'cell_size': self.cell_size})
+
+
+def _get_cell_size(boxes):
+    """ Median of the largest dimension of each box, or 1.0.
+    Median is used so a few very large boxes do not set the size """
+    sizes = sorted([max(box[3] - box[0], box[4] - box[1], box[5] - box[2])
+                    for box in boxes])
+    size = sizes[len(sizes) // 2] if sizes else 0.0
+    return size if size > 0 else 1.0
+
+
+def _to_box(box):
+    """ Returns (min_x, min_y, min_z, max_x, max_y, max_z) of box-like object """
+    box = getattr(box, '_revit_object', box)
+    if hasattr(box, 'Min'):
+        return to_xyz_tuple(box.Min) + to_xyz_tuple(box.Max)
+    if len(box) == 2:
+        return to_xyz_tuple(box[0]) + to_xyz_tuple(box[1])
+    if len(box) == 6:
+        return tuple(box)
+    raise RpwCoerceError(box, 'box-like object')
+
+
+def _expand(box, distance):
+    if not distance:
+        return box
+    return (box[0] - distance, box[1] - distance, box[2] - distance,
+            box[3] + distance, box[4] + distance, box[5] + distance)
+
+
+def _intersects(box, other):
+    return (box[0] <= other[3] and other[0] <= box[3] and
+            box[1] <= other[4] and other[1] <= box[4] and
+            box[2] <= other[5] and other[2] <= box[5])
+
+
+def _contains(box, other):
+    """ True if other is inside box """
+    return (box[0] <= other[0] and other[3] <= box[3] and
+            box[1] <= other[1] and other[4] <= box[4] and
+            box[2] <= other[2] and other[5] <= box[5])
+
+
+def _distance_to_box(x, y, z, box):
+    dx = max(box[0] - x, 0.0, x - box[3])
+    dy = max(box[1] - y, 0.0, y - box[4])
+    dz = max(box[2] - z, 0.0, z - box[5])
+    return math.sqrt(dx * dx + dy * dy + dz * dz)
@@ -1,6 +1,9 @@
+import time
 import traceback
 from rpw import revit, DB
-from rpw.base import BaseObjectWrapper
+from rpw.base import BaseObject, BaseObjectWrapper
+from rpw.db import cache, metrics as transaction_metrics
+from rpw.db.failures import FailureReport, FailuresPreprocessor
 from rpw.exceptions import RpwException
 from rpw.utils.logger import logger
 
@@ -20,6 +23,32 @@ class Transaction(BaseObjectWrapper):
     >>>     assert t.HasStarted() is True
     >>> assert t.HasEnded() is True
 
+    Warnings and errors can be handled without dialogs by passing a
+    failure mode. See :doc:`failures` for the available modes.
+
+    >>> with db.Transaction('Join', failures='suppress_warnings') as t:
+    >>>     join_walls(walls)
+    >>> t.failure_report
+    <rpw:FailureReport | warnings:12 errors:0>
+
+    With ``deferred=True``, writes added to ``t.queue`` are applied
+    grouped before the Transaction commits. See :any:`WriteQueue`
+
+    Open Transactions are tracked in a stack per document, which is used by
+    :func:`ensure` to join a Transaction that is already open:
+
+    >>> with db.Transaction('Outer'):
+    >>>     db.Transaction.depth()
+    1
+
+    Timing and changed element counts can be recorded with ``metrics``.
+    See :doc:`metrics`
+
+    >>> with db.Transaction('Renumber', metrics=True) as t:
+    >>>     renumber(doors)
+    >>> t.metrics
+    <rpw:TransactionMetrics | name:Renumber status:Committed ...>
+
     Wrapped Element:
         self._revit_object = `Revit.DB.Transaction`
 
@@ -27,40 +56,115 @@ class Transaction(BaseObjectWrapper):
 
     _revit_object_class = DB.Transaction
 
-    def __init__(self, name=None, doc=revit.doc):
+    # Active Transactions per document: {doc: [Transaction, ...]}
+    _stacks = {}
+
+    def __init__(self, name=None, doc=revit.doc, failures=None, deferred=False,
+                 metrics=None):
         if name is None:
             name = 'RPW Transaction'
         super(Transaction, self).__init__(DB.Transaction(doc, name))
         self.transaction = self._revit_object
+        self.doc = doc
+        self.name = name
+        self.start_time = None
+        self.failure_report = FailureReport()
+        self._preprocessor = None
+        if failures is not None:
+            self._preprocessor = FailuresPreprocessor(failures,
+                                                      self.failure_report,
+                                                      name=name)
+        self.queue = None
+        if deferred:
+            from rpw.db.write_queue import WriteQueue
+            self.queue = WriteQueue(name, doc=doc)
+        self.metrics = None
+        self._recorder = transaction_metrics.create_recorder(
+                                        metrics, name, 'Transaction', doc)
 
     def __enter__(self):
         self.transaction.Start()
+        if self._preprocessor:
+            self._preprocessor.install(self.transaction)
+        self.start_time = time.time()
+        Transaction._push(self.doc, self)
+        if self._recorder:
+            self._recorder.block_started()
         return self
 
     def __exit__(self, exception, exception_msg, tb):
-        if exception:
+        Transaction._pop(self.doc, self)
+        if self._recorder:
+            self._recorder.block_ended()
+        try:
+            self._end(exception)
+        finally:
+            if self._recorder:
+                self.metrics = self._recorder.finish(
+                            self.transaction.GetStatus(), self.failure_report)
+
+    def _end(self, exception):
+        """ Commits, or rolls back if exception was raised in context """
+        queue_error = None
+        if self.queue is not None and not exception:
+            try:
+                self.queue.flush()
+            except Exception as exc:
+                queue_error = exc
+                logger.error('Error applying deferred writes: {}'.format(exc))
+        # Values cached during or before the transaction might be stale
+        cache.clear_all(self.doc, transaction=True)
+        if exception or queue_error:
+            if self.queue is not None:
+                # Writes queued in a rolled back Transaction are discarded
+                self.queue.clear()
             self.transaction.RollBack()
             logger.error('Error in Transaction Context: has rolled back.')
             # traceback.print_tb(tb)
             # raise exception # Let exception through
+            if queue_error:
+                raise queue_error
         else:
+            if self._recorder:
+                self._recorder.commit_started()
             try:
-                self.transaction.Commit()
+                status = self.transaction.Commit()
+                if self._recorder:
+                    self._recorder.commit_ended()
             except Exception as exc:
                 self.transaction.RollBack()
                 logger.error('Error in Transaction Commit: has rolled back.')
                 logger.error(exc)
                 raise
+            if status == DB.TransactionStatus.RolledBack:
+                logger.warning('Transaction rolled back by failures: {}'.format(
+                                                        self.failure_report))
+
+    @property
+    def elapsed(self):
+        """ Seconds since the Transaction was started """
+        if self.start_time is None:
+            return 0.0
+        return time.time() - self.start_time
 
     @staticmethod
-    def ensure(name):
+    def ensure(name, doc=revit.doc, sub_transaction=False):
         """ Transaction Manager Decorator
 
         Decorate any function with ``@Transaction.ensure('Transaction Name')``
         and the funciton will run within a Transaction Context.
 
+        If a Transaction is already open on the document, the function joins
+        it instead of starting a new one, so decorated functions can call
+        each other, or be called from inside a Transaction.
+        The outermost Transaction commits all changes.
+
         Args:
             name (str): Name of the Transaction
+            doc (``DB.Document``, optional): Document [default: revit.doc]
+            sub_transaction (bool): If joining an open Transaction, run the
+                function in a ``DB.SubTransaction``, so its changes are
+                rolled back on its own if it raises [default: False]
 
         >>> from rpw import db
         >>> @db.Transaction.ensure('Do Something')
@@ -68,24 +172,129 @@ class Transaction(BaseObjectWrapper):
         >>>     wall.parameters['Comments'].value = value
         >>>
         >>> set_some_parameter(wall, value)
+        >>> with db.Transaction('Set Many'):
+        >>>     for wall in walls:
+        >>>         set_some_parameter(wall, value)  # Joins 'Set Many'
         """
         from functools import wraps
 
         def wrap(f):
             @wraps(f)
             def wrapped_f(*args, **kwargs):
-                with Transaction(name):
+                if Transaction.depth(doc) or doc.IsModifiable:
+                    context = _JoinedTransaction(name, doc, sub_transaction)
+                else:
+                    context = Transaction(name, doc=doc)
+                with context:
                     return_value = f(*args, **kwargs)
                 return return_value
             return wrapped_f
         return wrap
 
+    @staticmethod
+    def depth(doc=revit.doc):
+        """
+        Returns the number of rpw Transactions open on a document, including
+        functions decorated with :func:`ensure` that joined one.
+        """
+        return len(Transaction._stacks.get(doc, []))
+
+    @staticmethod
+    def outermost(doc=revit.doc):
+        """
+        Returns the outermost open Transaction of a document,
+        which owns the commit, or ``None``.
+        """
+        stack = Transaction._stacks.get(doc)
+        return stack[0] if stack else None
+
+    @staticmethod
+    def elapsed_time(doc=revit.doc):
+        """ Seconds since the outermost open Transaction was started """
+        transaction = Transaction.outermost(doc)
+        return transaction.elapsed if transaction else 0.0
+
+    @staticmethod
+    def _push(doc, transaction):
+        Transaction._stacks.setdefault(doc, []).append(transaction)
+
+    @staticmethod
+    def _pop(doc, transaction):
+        stack = Transaction._stacks.get(doc, [])
+        if transaction in stack:
+            stack.remove(transaction)
+        if not stack:
+            Transaction._stacks.pop(doc, None)
+
+    @staticmethod
+    def batched(name=None, chunk_size=1000, seconds=None, doc=revit.doc,
+                failures=None, metrics=None):
+        """
+        Batched Transaction Context. See :any:`BatchedTransaction`
+
+        >>> from rpw import db
+        >>> with db.Transaction.batched('Set Comments', chunk_size=500) as batch:
+        ...     for wall in batch.iterate(walls):
+        ...         wall.parameters['Comments'].value = 'Checked'
+        >>> batch.chunk_times
+        [{'chunk': 1, 'operations': 500, 'seconds': 0.8}, ...]
+
+        Args:
+            name (str): Name of the Transaction Group
+            chunk_size (int): Operations per Transaction [default: 1000]
+            seconds (float, optional): Commit when a Transaction has been
+                open for this many seconds.
+            failures (str, callable, optional): Failure mode used by each
+                Transaction. See :doc:`failures`
+            metrics (bool, callable, optional): Record metrics of the group
+                and each Transaction. See :doc:`metrics`
+        """
+        return BatchedTransaction(name, chunk_size=chunk_size,
+                                  seconds=seconds, doc=doc, failures=failures,
+                                  metrics=metrics)
+
     # TODO: Add  __repr__ with Transaction Status
     # TODO: Merge Transaction Status
-    # TODO: add check for if transaction is in progress, especially for ensure
     # TODO: add ensure to TransactionGroup
 
 
+class _JoinedTransaction(object):
+    """
+    Context used by :func:`Transaction.ensure` when a Transaction
+    is already open. Changes are committed by the outermost Transaction.
+    """
+
+    def __init__(self, name, doc, sub_transaction=False):
+        self.name = name
+        self.doc = doc
+        self.start_time = None
+        self.sub_transaction = None
+        if sub_transaction:
+            self.sub_transaction = DB.SubTransaction(doc)
+
+    @property
+    def elapsed(self):
+        return time.time() - self.start_time
+
+    def __enter__(self):
+        if self.sub_transaction:
+            self.sub_transaction.Start()
+        self.start_time = time.time()
+        Transaction._push(self.doc, self)
+        return self
+
+    def __exit__(self, exception, exception_msg, tb):
+        Transaction._pop(self.doc, self)
+        if not self.sub_transaction:
+            return
+        if exception:
+            self.sub_transaction.RollBack()
+            logger.error('Error in SubTransaction {}: has rolled back.'.format(
+                                                                    self.name))
+        else:
+            self.sub_transaction.Commit()
+
+
 class TransactionGroup(BaseObjectWrapper):
     """
     Similar to Transaction, but for ``DB.Transaction Group``
@@ -99,37 +308,70 @@ class TransactionGroup(BaseObjectWrapper):
     >>> with db.TransacationGroup('Do Major Task', assimilate=False):
     >>>     with db.Transaction('Do Task'):
     >>>         # Do Stuff
+
+    >>> with db.TransactionGroup('Do Major Task', metrics=True) as tg:
+    >>>     with db.Transaction('Do Task'):
+    >>>         # Do Stuff
+    >>> tg.metrics
+    <rpw:TransactionMetrics | name:Do Major Task status:Committed ...>
+
+    Wrapped Element:
+        self._revit_object = `Revit.DB.TransactionGroup`
     """
 
     _revit_object_class = DB.TransactionGroup
 
-    def __init__(self, name=None, assimilate=True, doc=revit.doc):
+    def __init__(self, name=None, assimilate=True, doc=revit.doc,
+                 metrics=None):
         """
             Args:
                 name (str): Name of the Transaction
                 assimilate (bool): If assimilates is ``True``,
                     transaction history is `squashed`.
+                metrics (bool, callable, optional): Record metrics.
+                    Changed elements of all Transactions in the group
+                    are counted. See :doc:`metrics`
         """
         if name is None:
             name = 'RPW Transaction Group'
         super(TransactionGroup, self).__init__(DB.TransactionGroup(doc, name))
         self.transaction_group = self._revit_object
         self.assimilate = assimilate
+        self.metrics = None
+        self._recorder = transaction_metrics.create_recorder(
+                                        metrics, name, 'TransactionGroup', doc)
 
     def __enter__(self):
         self.transaction_group.Start()
-        return self.transaction_group
+        if self._recorder:
+            self._recorder.block_started(count_changes=True)
+        return self
 
     def __exit__(self, exception, exception_msg, tb):
+        if self._recorder:
+            self._recorder.block_ended()
+        try:
+            self._end(exception)
+        finally:
+            if self._recorder:
+                self.metrics = self._recorder.finish(
+                                        self.transaction_group.GetStatus())
+
+    def _end(self, exception):
+        """ Assimilates or commits, or rolls back if exception was raised """
         if exception:
             self.transaction_group.RollBack()
             logger.error('Error in TransactionGroup Context: has rolled back.')
         else:
+            if self._recorder:
+                self._recorder.commit_started()
             try:
                 if self.assimilate:
                     self.transaction_group.Assimilate()
                 else:
                     self.transaction_group.Commit()
+                if self._recorder:
+                    self._recorder.commit_ended()
             except Exception as exc:
                 self.transaction_group.RollBack()
                 logger.error('Error in TransactionGroup Commit: \
@@ -138,6 +380,121 @@ class TransactionGroup(BaseObjectWrapper):
                 raise exc
 
 
+class BatchedTransaction(BaseObject):
+    """
+    Splits a large edit into several Transactions.
+    A new Transaction is committed and started every ``chunk_size``
+    operations, or after ``seconds``, whichever comes first.
+    All Transactions are grouped in a ``DB.TransactionGroup`` that is
+    assimilated when the context exits, so the edit has a single undo entry.
+
+    Operations are counted with :func:`step`, or by iterating with
+    :func:`iterate`.
+
+    >>> from rpw import db
+    >>> with db.Transaction.batched('Renumber', chunk_size=2000) as batch:
+    ...     for n, door in enumerate(doors):
+    ...         door.parameters['Mark'].value = str(n)
+    ...         batch.step()
+
+    If an exception is raised, the current Transaction and the group are
+    rolled back, including chunks that were already committed.
+
+    Attributes:
+        chunk_times (list): One dict per committed Transaction with
+            ``chunk``, ``operations`` and ``seconds``
+        failure_report (:any:`FailureReport`): Failures of all Transactions
+        metrics (:any:`TransactionMetrics`): Metrics of the group,
+            if created with ``metrics``. See :doc:`metrics`
+    """
+
+    def __init__(self, name=None, chunk_size=1000, seconds=None,
+                 doc=revit.doc, assimilate=True, failures=None, metrics=None):
+        self.name = name or 'RPW Batched Transaction'
+        self.chunk_size = chunk_size
+        self.seconds = seconds
+        self.doc = doc
+        self.assimilate = assimilate
+        self.failures = failures
+        self.metrics = None
+        self._metrics = metrics
+        self.failure_report = FailureReport()
+        self.chunk_times = []
+        self.transaction = None
+        self._group = None
+        self._operations = 0
+        self._chunk_start = None
+
+    def __enter__(self):
+        self._group = TransactionGroup(self.name, assimilate=self.assimilate,
+                                       doc=self.doc, metrics=self._metrics)
+        self._group.__enter__()
+        self._start_chunk()
+        return self
+
+    def __exit__(self, exception, exception_msg, tb):
+        # Chunk has already ended if a commit in step() failed
+        if self.transaction.HasStarted() and not self.transaction.HasEnded():
+            try:
+                self.transaction.__exit__(exception, exception_msg, tb)
+            except Exception as exc:
+                self._group.__exit__(type(exc), exc, None)
+                raise
+        if not exception:
+            self._record_chunk()
+        self._group.__exit__(exception, exception_msg, tb)
+        self.metrics = self._group.metrics
+        if not exception:
+            total = sum([chunk['seconds'] for chunk in self.chunk_times])
+            logger.debug('{}: {} transactions in {:.2f}s'.format(
+                                    self.name, len(self.chunk_times), total))
+
+    def step(self, count=1):
+        """
+        Counts operations done in the current Transaction.
+        Commits and starts a new Transaction if the chunk is complete.
+
+        Args:
+            count (int): Number of operations [default: 1]
+        """
+        self._operations += count
+        if self._operations >= self.chunk_size or (
+                self.seconds and time.time() - self._chunk_start >= self.seconds):
+            self.commit_chunk()
+
+    def iterate(self, iterable):
+        """ Yields items of iterable, calling :func:`step` after each one """
+        for item in iterable:
+            yield item
+            self.step()
+
+    def commit_chunk(self):
+        """ Commits current Transaction and starts a new one """
+        self.transaction.__exit__(None, None, None)
+        self._record_chunk()
+        self._start_chunk()
+
+    def _start_chunk(self):
+        name = '{} [{}]'.format(self.name, len(self.chunk_times) + 1)
+        self.transaction = Transaction(name, doc=self.doc,
+                                       failures=self.failures,
+                                       metrics=self._metrics)
+        self.transaction.__enter__()
+        self._operations = 0
+        self._chunk_start = time.time()
+
+    def _record_chunk(self):
+        self.failure_report.extend(self.transaction.failure_report)
+        self.chunk_times.append({'chunk': len(self.chunk_times) + 1,
+                                 'operations': self._operations,
+                                 'seconds': time.time() - self._chunk_start})
+
+    def __repr__(self):
+        return super(BatchedTransaction, self).__repr__(
+                                data={'name': self.name,
+                                      'chunks': len(self.chunk_times)})
+
+
 class DynamoTransaction(object):
 
     # TODO: Use Dynamo Transaction when HOST is 'Dynamo'
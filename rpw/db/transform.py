@@ -1,9 +1,19 @@
 """ Transform Wrappers """
 
 import math
+from array import array
+
 import rpw
 from rpw import DB
-from rpw.base import BaseObjectWrapper
+from rpw.base import BaseObject, BaseObjectWrapper
+from rpw.exceptions import RpwValueError
+from rpw.utils.coerce import to_xyz_tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 class Transform(BaseObjectWrapper):
     """
@@ -33,25 +43,270 @@ class Transform(BaseObjectWrapper):
         Returns:
             ``point-like``: Rotate Vector
             """
-        XYZ = rpw.db.XYZ
-        vector = XYZ(vector)
-        if radians:
-            angle_rad = rotation
-        else:
-            angle_rad = math.radians(rotation)
-        axis =  XYZ(DB.XYZ(0,0,1)) if not axis else XYZ(axis)
-        center =  XYZ(DB.XYZ(0,0,0)) if not center else XYZ(center)
-        transform = cls._revit_object_class.CreateRotationAtPoint(
-                                                        axis.unwrap(),
-                                                        angle_rad,
-                                                        center.unwrap())
-
-        return XYZ(transform.OfVector(vector.unwrap()))
+        # Vectors are not affected by center, same as DB.Transform.OfVector
+        matrix = TransformMatrix.rotation(rotation, axis=axis, radians=radians)
+        return rpw.db.XYZ(matrix.apply_vector(vector))
 
     @classmethod
     def move(cls, vector, object):
-        """ Rotate a Vector by Degrees """
+        """ Moves a point by a vector
+
+        >>> db.Transform.move((0, 0, 10), SomePoint)
+
+        Args:
+            vector (``point-like``): Translation vector
+            object (``point-like``): Point to move
+
+        Returns:
+            (:any:`XYZ`): Moved Point
+        """
+        matrix = TransformMatrix.translation(vector)
+        return rpw.db.XYZ(matrix.apply(object))
+
+
+class TransformMatrix(BaseObject):
+    """
+    Pure-python affine transform for applying the same transform to many
+    points without creating a ``DB.Transform`` or ``DB.XYZ`` per point.
+
+    Rotations, translations and scales are composed into a single matrix.
+    Each operation returns a new matrix that applies the operation
+    after the existing ones.
+
+    >>> from rpw.db.transform import TransformMatrix
+    >>> matrix = TransformMatrix().rotate(90).move((10, 0, 0))
+    >>> matrix.apply((1, 0, 0))
+    Vec3(10.0, 1.0, 0.0)
+    >>> matrix.apply_many(points)
+    [Vec3(...), Vec3(...), ...]
+    >>> matrix.apply_to_curves(curves)
+    [DB.Curve, DB.Curve, ...]
+
+    Matrices can be created from and converted to ``DB.Transform``.
+    The native transform is only created once, when requested:
+
+    >>> link_matrix = TransformMatrix.from_transform(link.GetTotalTransform())
+    >>> link_matrix.to_transform()
+    <Autodesk.Revit.DB.Transform>
+
+    Args:
+        values (``iterable``, optional): 12 values of a row major 3x4 matrix:
+            ``(m00, m01, m02, tx, m10, m11, m12, ty, m20, m21, m22, tz)``
+            [default: Identity]
+    """
+
+    IDENTITY = (1.0, 0.0, 0.0, 0.0,
+                0.0, 1.0, 0.0, 0.0,
+                0.0, 0.0, 1.0, 0.0)
+
+    def __init__(self, values=None):
+        values = TransformMatrix.IDENTITY if values is None else tuple(values)
+        if len(values) != 12:
+            raise RpwValueError('12 matrix values', len(values))
+        self.values = values
+        self._transform = None
+
+    @classmethod
+    def translation(cls, vector):
+        """ Creates a translation matrix """
+        x, y, z = to_xyz_tuple(vector)
+        return cls((1.0, 0.0, 0.0, x,
+                    0.0, 1.0, 0.0, y,
+                    0.0, 0.0, 1.0, z))
+
+    @classmethod
+    def rotation(cls, rotation, axis=None, center=None, radians=False):
+        """
+        Creates a rotation matrix
+
+        Args:
+            rotation (``float``): Rotation in degrees.
+            axis (``point-like``, optional): Axis of rotation [default: 0,0,1]
+            center (``point-like``, optional): Center of rotation [default: 0,0,0]
+            radians (``bool``, optional): True for rotation angle is in radians [default: False]
+        """
+        angle = rotation if radians else math.radians(rotation)
+        ux, uy, uz = to_xyz_tuple(axis) if axis is not None else (0.0, 0.0, 1.0)
+        length = math.sqrt(ux * ux + uy * uy + uz * uz)
+        ux, uy, uz = ux / length, uy / length, uz / length
+        c = math.cos(angle)
+        s = math.sin(angle)
+        t = 1.0 - c
+        matrix = cls((t * ux * ux + c, t * ux * uy - s * uz, t * ux * uz + s * uy, 0.0,
+                      t * ux * uy + s * uz, t * uy * uy + c, t * uy * uz - s * ux, 0.0,
+                      t * ux * uz - s * uy, t * uy * uz + s * ux, t * uz * uz + c, 0.0))
+        if center is None:
+            return matrix
+        return matrix._about_point(center)
+
+    @classmethod
+    def scaling(cls, factor, center=None):
+        """
+        Creates a uniform scale matrix
+
+        Args:
+            factor (``float``): Scale factor
+            center (``point-like``, optional): Center of scale [default: 0,0,0]
+        """
+        matrix = cls((factor, 0.0, 0.0, 0.0,
+                      0.0, factor, 0.0, 0.0,
+                      0.0, 0.0, factor, 0.0))
+        if center is None:
+            return matrix
+        return matrix._about_point(center)
+
+    @classmethod
+    def from_transform(cls, transform):
+        """ Creates matrix from a ``DB.Transform`` or :any:`Transform` """
+        transform = getattr(transform, '_revit_object', transform)
+        bx, by, bz = transform.BasisX, transform.BasisY, transform.BasisZ
+        origin = transform.Origin
+        matrix = cls((bx.X, by.X, bz.X, origin.X,
+                      bx.Y, by.Y, bz.Y, origin.Y,
+                      bx.Z, by.Z, bz.Z, origin.Z))
+        matrix._transform = transform
+        return matrix
+
+    def _about_point(self, center):
+        """ Returns matrix that applies self around center """
+        x, y, z = to_xyz_tuple(center)
+        return (TransformMatrix.translation((x, y, z)) * self *
+                TransformMatrix.translation((-x, -y, -z)))
+
+    def rotate(self, rotation, axis=None, center=None, radians=False):
+        """ Returns new matrix with a rotation applied after this one.
+        See :func:`rotation` """
+        return TransformMatrix.rotation(rotation, axis=axis, center=center,
+                                        radians=radians) * self
+
+    def move(self, vector):
+        """ Returns new matrix with a translation applied after this one """
+        return TransformMatrix.translation(vector) * self
+
+    def scale(self, factor, center=None):
+        """ Returns new matrix with a scale applied after this one """
+        return TransformMatrix.scaling(factor, center=center) * self
+
+    def inverse(self):
+        """ Returns the inverse matrix """
+        a, b, c, tx, d, e, f, ty, g, h, i, tz = self.values
+        det = a * (e * i - f * h) - b * (d * i - f * g) + c * (d * h - e * g)
+        if abs(det) < 1e-12:
+            raise RpwValueError('invertible transform', 'determinant 0')
+        r = ((e * i - f * h) / det, (c * h - b * i) / det, (b * f - c * e) / det,
+             (f * g - d * i) / det, (a * i - c * g) / det, (c * d - a * f) / det,
+             (d * h - e * g) / det, (b * g - a * h) / det, (a * e - b * d) / det)
+        return TransformMatrix((r[0], r[1], r[2], -(r[0] * tx + r[1] * ty + r[2] * tz),
+                                r[3], r[4], r[5], -(r[3] * tx + r[4] * ty + r[5] * tz),
+                                r[6], r[7], r[8], -(r[6] * tx + r[7] * ty + r[8] * tz)))
+
+    def apply(self, point):
+        """ Applies transform to a point. Returns :any:`Vec3` """
+        x, y, z = to_xyz_tuple(point)
+        m = self.values
+        return rpw.db.Vec3(m[0] * x + m[1] * y + m[2] * z + m[3],
+                           m[4] * x + m[5] * y + m[6] * z + m[7],
+                           m[8] * x + m[9] * y + m[10] * z + m[11])
+
+    def apply_vector(self, vector):
+        """ Applies transform to a vector, ignoring translation.
+        Returns :any:`Vec3` """
+        x, y, z = to_xyz_tuple(vector)
+        m = self.values
+        return rpw.db.Vec3(m[0] * x + m[1] * y + m[2] * z,
+                           m[4] * x + m[5] * y + m[6] * z,
+                           m[8] * x + m[9] * y + m[10] * z)
+
+    def apply_many(self, points):
+        """
+        Applies transform to many points.
+
+        Args:
+            points (``[point-like]``, :any:`XyzCollection`, ``numpy.ndarray``):
+                Points. numpy arrays must have shape (n, 3).
+
+        Returns:
+            ``[Vec3]`` for lists of points, :any:`XyzCollection` for
+            collections, and ``numpy.ndarray`` for numpy arrays.
+        """
+        if np is not None and isinstance(points, np.ndarray):
+            m = np.array(self.values).reshape(3, 4)
+            return points.dot(m[:, :3].T) + m[:, 3]
+        if hasattr(points, 'from_coords'):
+            return points.from_coords(self.apply_coords(points.coords))
+        m00, m01, m02, tx, m10, m11, m12, ty, m20, m21, m22, tz = self.values
+        Vec3 = rpw.db.Vec3
+        transformed = []
+        for point in points:
+            x, y, z = to_xyz_tuple(point)
+            transformed.append(Vec3(m00 * x + m01 * y + m02 * z + tx,
+                                    m10 * x + m11 * y + m12 * z + ty,
+                                    m20 * x + m21 * y + m22 * z + tz))
+        return transformed
+
+    def apply_coords(self, coords):
+        """
+        Applies transform to flat coordinates ``[x0, y0, z0, x1, ...]``
+
+        Returns:
+            ``array('d')``: Transformed coordinates
+        """
+        m00, m01, m02, tx, m10, m11, m12, ty, m20, m21, m22, tz = self.values
+        transformed = array('d', coords)
+        for i in range(0, len(transformed), 3):
+            x, y, z = transformed[i], transformed[i + 1], transformed[i + 2]
+            transformed[i] = m00 * x + m01 * y + m02 * z + tx
+            transformed[i + 1] = m10 * x + m11 * y + m12 * z + ty
+            transformed[i + 2] = m20 * x + m21 * y + m22 * z + tz
+        return transformed
+
+    def apply_to_curves(self, curves):
+        """
+        Transforms curves using a single ``DB.Transform``
+
+        Args:
+            curves (``[DB.Curve]``): Curves or wrapped curves
+
+        Returns:
+            ``[DB.Curve]``: Transformed curves
+        """
+        transform = self.to_transform()
+        return [getattr(curve, '_revit_object', curve).CreateTransformed(transform)
+                for curve in curves]
+
+    def to_transform(self):
+        """ Returns ``DB.Transform``. Created once and cached """
+        if self._transform is None:
+            m = self.values
+            transform = DB.Transform(DB.Transform.Identity)
+            transform.BasisX = DB.XYZ(m[0], m[4], m[8])
+            transform.BasisY = DB.XYZ(m[1], m[5], m[9])
+            transform.BasisZ = DB.XYZ(m[2], m[6], m[10])
+            transform.Origin = DB.XYZ(m[3], m[7], m[11])
+            self._transform = transform
+        return self._transform
+
+    def __mul__(self, other):
+        """ Composition: ``(a * b).apply(p) == a.apply(b.apply(p))`` """
+        a, b = self.values, other.values
+        values = []
+        for row in (0, 4, 8):
+            for col in range(4):
+                value = (a[row] * b[col] + a[row + 1] * b[col + 4] +
+                         a[row + 2] * b[col + 8])
+                if col == 3:
+                    value += a[row + 3]
+                values.append(value)
+        return TransformMatrix(values)
+
+    def __eq__(self, other):
+        return (isinstance(other, TransformMatrix) and
+                all([abs(a - b) < 1e-9 for a, b in zip(self.values, other.values)]))
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
 
-        raise NotImplemented
-        # vector = XYZ(vector)
-        # transform = cls._revit_object_class.CreateTranslation(vector)
+    def __repr__(self):
+        m = self.values
+        return super(TransformMatrix, self).__repr__(
+                        data={'origin': (m[3], m[7], m[11])})
@@ -0,0 +1,228 @@
+"""
+Unit Conversion
+
+Parameter values are stored and returned in Revit's internal units
+(decimal feet, radians, etc). :any:`UnitConverter` converts them into the
+document's display units without calling ``AsValueString()`` per value.
+
+The display unit of each parameter is resolved once per definition from the
+document's ``Units`` / ``FormatOptions``, and values are then converted
+as whole columns.
+
+>>> from rpw.db.units import UnitConverter
+>>> converter = UnitConverter()
+>>> converter.to_display(wall.parameters['Length'], [1.0, 10.0])
+array('d', [304.8, 3048.0])
+>>> converter.get_unit_label(wall.parameters['Length'])
+'Millimeters'
+>>> converter.read_column(walls, 'Length')
+[3048.0, 6096.0, None, ...]
+
+Note:
+    If numpy is available, numpy arrays can be passed in and are converted
+    using numpy. All other inputs are converted in pure python.
+
+"""  #
+
+from array import array
+
+from rpw import revit, DB
+from rpw.base import BaseObject
+from rpw.utils.logger import logger
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# (factor, offset) used for values that have no units
+_NO_CONVERSION = (1.0, 0.0)
+
+
+class UnitConverter(BaseObject):
+    """
+    Converts parameter values between internal and display units.
+
+    Conversion factors are cached per definition, so the Revit API is only
+    queried the first time a parameter definition is seen.
+
+    Args:
+        doc (``DB.Document``, optional): Document [default: revit.doc]
+    """
+
+    def __init__(self, doc=None):
+        self.doc = doc or revit.doc
+        self._units = self.doc.GetUnits()
+        self._definition_specs = {}
+        self._conversions = {}
+        self._labels = {}
+
+    def get_conversion(self, parameter):
+        """
+        Returns the linear conversion from internal to display units:
+        ``display = internal * factor + offset``
+
+        Args:
+            parameter (``DB.Parameter``, :any:`Parameter`): Parameter
+
+        Returns:
+            (``tuple``): (factor, offset)
+        """
+        spec_key, spec = self._get_spec(parameter)
+        try:
+            return self._conversions[spec_key]
+        except KeyError:
+            pass
+
+        display_unit = self._get_display_unit(spec)
+        if display_unit is None:
+            conversion = _NO_CONVERSION
+        else:
+            convert = DB.UnitUtils.ConvertFromInternalUnits
+            offset = convert(0.0, display_unit)
+            conversion = (convert(1.0, display_unit) - offset, offset)
+        self._conversions[spec_key] = conversion
+        return conversion
+
+    def get_unit_label(self, parameter):
+        """
+        Returns the label of the display unit of a parameter.
+
+        Returns:
+            (``str``): Unit label, ie. 'Millimeters', or ``None``
+        """
+        spec_key, spec = self._get_spec(parameter)
+        try:
+            return self._labels[spec_key]
+        except KeyError:
+            pass
+
+        display_unit = self._get_display_unit(spec)
+        label = None
+        if display_unit is not None:
+            if hasattr(DB.LabelUtils, 'GetLabelForUnit'):
+                label = DB.LabelUtils.GetLabelForUnit(display_unit)
+            else:
+                label = DB.LabelUtils.GetLabelFor(display_unit)
+        self._labels[spec_key] = label
+        return label
+
+    def to_display(self, parameter, values):
+        """
+        Converts a column of values from internal to display units.
+
+        Args:
+            parameter (``DB.Parameter``, :any:`Parameter`): Parameter used to
+                resolve the display unit.
+            values (``iterable``): Values in internal units. ``None`` values
+                are kept as ``None``.
+
+        Returns:
+            (``array``, ``list``, ``numpy.ndarray``): Converted values.
+            numpy arrays are returned for numpy inputs, ``array('d')`` for
+            inputs without ``None`` values, and a ``list`` otherwise.
+        """
+        factor, offset = self.get_conversion(parameter)
+        return _convert(values, factor, offset)
+
+    def from_display(self, parameter, values):
+        """
+        Converts a column of values from display to internal units.
+        Same as :func:`to_display`, but reversed.
+        """
+        factor, offset = self.get_conversion(parameter)
+        return _convert(values, 1.0 / factor, -offset / factor)
+
+    def read_column(self, elements, param_name, display_units=True):
+        """
+        Reads a parameter from a list of elements. Double values are
+        converted to display units in bulk after all values are read.
+
+        >>> converter.read_column(walls, 'Length')
+        [3048.0, 6096.0, None]
+
+        Args:
+            elements (``[DB.Element]``): Elements or wrapped elements
+            param_name (``str``): Name of Parameter
+            display_units (``bool``): Converts doubles to display units
+                [default: True]
+
+        Returns:
+            (``list``): Values in the same order as elements. ``None`` is
+            used for elements that do not have the parameter.
+        """
+        values = []
+        # Indexes of doubles grouped by definition: {id: (parameter, [i])}
+        doubles = {}
+        for element in elements:
+            element = getattr(element, '_revit_object', element)
+            parameter = element.LookupParameter(param_name)
+            if parameter is None or not parameter.HasValue:
+                values.append(None)
+                continue
+            storage_type = parameter.StorageType
+            if storage_type == DB.StorageType.Double:
+                definition_id = parameter.Id.IntegerValue
+                if definition_id not in doubles:
+                    doubles[definition_id] = (parameter, [])
+                doubles[definition_id][1].append(len(values))
+                values.append(parameter.AsDouble())
+            elif storage_type == DB.StorageType.String:
+                values.append(parameter.AsString())
+            elif storage_type == DB.StorageType.Integer:
+                values.append(parameter.AsInteger())
+            elif storage_type == DB.StorageType.ElementId:
+                values.append(parameter.AsElementId())
+            else:
+                values.append(None)
+
+        if display_units:
+            for parameter, indexes in doubles.values():
+                column = self.to_display(parameter, [values[i] for i in indexes])
+                for index, value in zip(indexes, column):
+                    values[index] = value
+        return values
+
+    def _get_spec(self, parameter):
+        """ Returns (key, spec) for a parameter. Cached by definition """
+        parameter = getattr(parameter, '_revit_object', parameter)
+        definition_id = parameter.Id.IntegerValue
+        try:
+            return self._definition_specs[definition_id]
+        except KeyError:
+            pass
+        definition = parameter.Definition
+        if hasattr(definition, 'GetDataType'):
+            spec = definition.GetDataType()        # Revit 2022+
+        elif hasattr(definition, 'GetSpecTypeId'):
+            spec = definition.GetSpecTypeId()      # Revit 2021
+        else:
+            spec = definition.UnitType
+        # ForgeTypeId is keyed by its string TypeId, UnitType by its enum
+        spec_key = getattr(spec, 'TypeId', spec)
+        self._definition_specs[definition_id] = (spec_key, spec)
+        return spec_key, spec
+
+    def _get_display_unit(self, spec):
+        """ Returns display unit of spec, or None if spec has no units """
+        try:
+            format_options = self._units.GetFormatOptions(spec)
+        except Exception:
+            # Spec is not measurable: Text, Integer, Yes/No, etc.
+            logger.debug('Spec has no display units: {}'.format(spec))
+            return None
+        if hasattr(format_options, 'GetUnitTypeId'):
+            return format_options.GetUnitTypeId()  # Revit 2021+
+        return format_options.DisplayUnits
+
+
+def _convert(values, factor, offset):
+    """ Applies ``value * factor + offset`` to a column of values """
+    if np is not None and isinstance(values, np.ndarray):
+        return values * factor + offset
+    values = list(values)
+    if None in values:
+        return [v * factor + offset if v is not None else None for v in values]
+    if offset:
+        return array('d', [v * factor + offset for v in values])
+    return array('d', [v * factor for v in values])
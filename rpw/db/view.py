@@ -3,15 +3,20 @@ View Wrappers
 
 """  #
 
+from collections import OrderedDict
+
 import rpw
 from rpw import revit, DB
 from rpw.db.element import Element
 from rpw.db.pattern import LinePatternElement, FillPatternElement
-from rpw.db.collector import Collector
-from rpw.base import BaseObjectWrapper
+from rpw.db.bulk import change_types
+from rpw.db.cache import DocumentCache
+from rpw.db.transaction import Transaction
+from rpw.base import BaseObject, BaseObjectWrapper
 from rpw.utils.coerce import to_element_ids, to_element_id, to_element
-from rpw.utils.coerce import to_category_id, to_iterable
-from rpw.exceptions import RpwTypeError, RpwCoerceError
+from rpw.utils.coerce import to_category_id, to_iterable, as_element_ids
+from rpw.utils.coerce import to_pascal_case
+from rpw.exceptions import RpwTypeError, RpwCoerceError, RpwValueError
 from rpw.utils.logger import logger
 
 
@@ -62,7 +67,7 @@ class View(Element):
     @property
     def view_type(self):
         """ ViewType attribute """
-        return ViewType(self._revit_object.ViewType)
+        return ViewType(self._revit_object.ViewType, doc=self.doc)
 
     @property
     def view_family_type(self):
@@ -81,8 +86,9 @@ class View(Element):
 
     @property
     def siblings(self):
-        """ Collect all views of the same ``ViewType`` """
-        return self.view_type.views
+        """ Collect all views of the same ``ViewType``. See :any:`ViewIndex` """
+        view_type = self._revit_object.ViewType
+        return ViewIndex.get(self.doc).get_views(view_type=view_type)
 
     @property
     def override(self):
@@ -99,15 +105,27 @@ class View(Element):
         return OverrideGraphicSettings(self)
 
     def change_type(self, type_reference):
-        raise NotImplemented
-        # self._revit_object.ChangeTypeId(type_reference)
+        """
+        Change View Type. See :func:`rpw.db.change_types`
+
+        Args:
+            type_reference (``ElementId``, ``ViewFamilyType``, ``str``): View Type Reference
+        """
+        change_types([self._revit_object], type_reference, doc=self.doc)
 
     def __repr__(self):
+        if self.rich_repr:
+            return self.full_repr()
+        return self._lightweight_repr()
+
+    def _build_full_repr(self):
+        view_family_type = self.view_family_type
+        view_family = getattr(view_family_type, 'view_family', None)
         return super(View, self).__repr__(data={
                                 'view_name': self.name,
-                                'view_family_type': getattr(self.view_family_type, 'name', None),
+                                'view_family_type': getattr(view_family_type, 'name', None),
                                 'view_type': self.view_type.name,
-                                'view_family': getattr(self.view_family, 'name', None)
+                                'view_family': getattr(view_family, 'name', None)
                                                 })
 
 
@@ -159,14 +177,12 @@ class ViewFamilyType(Element):
     def view_family(self):
         """ Returns ViewFamily Enumerator """
         # Autodesk.Revit.DB.ViewFamily.FloorPlan
-        return ViewFamily(self._revit_object.ViewFamily)
+        return ViewFamily(self._revit_object.ViewFamily, doc=self.doc)
 
     @property
     def views(self):
         """ Collect All Views of the same ViewFamilyType """
-        views = Collector(of_class='View').get_elements(wrapped=True)
-        return [view for view in views if
-                getattr(view.view_family_type, '_revit_object', None) == self.unwrap()]
+        return ViewIndex.get(self.doc).get_views(family_type=self._revit_object)
 
     def __repr__(self):
         return super(ViewFamilyType, self).__repr__(data={'name': self.name,
@@ -189,6 +205,16 @@ class ViewFamily(BaseObjectWrapper):
     """
     _revit_object_class = DB.ViewFamily
 
+    def __init__(self, view_family, doc=None):
+        """
+        Args:
+            view_family (``DB.ViewFamily``): View Family
+            doc (``DB.Document``, optional): Document used to collect
+                views [default: revit.doc]
+        """
+        super(ViewFamily, self).__init__(view_family)
+        self.doc = doc or revit.doc
+
     @property
     def name(self):
         """ ToString() of View Family Enumerator """
@@ -197,9 +223,7 @@ class ViewFamily(BaseObjectWrapper):
     @property
     def views(self):
         """ Collect All Views of the same ViewFamily """
-        views = Collector(of_class='View').get_elements(wrapped=True)
-        return [view for view in views if
-                getattr(view.view_family, '_revit_object', None) == self.unwrap()]
+        return ViewIndex.get(self.doc).get_views(view_family=self._revit_object)
 
     def __repr__(self):
         return super(ViewFamily, self).__repr__(data={'family': self.name})
@@ -221,6 +245,16 @@ class ViewType(BaseObjectWrapper):
     """
     _revit_object_class = DB.ViewType
 
+    def __init__(self, view_type, doc=None):
+        """
+        Args:
+            view_type (``DB.ViewType``): View Type
+            doc (``DB.Document``, optional): Document used to collect
+                views [default: revit.doc]
+        """
+        super(ViewType, self).__init__(view_type)
+        self.doc = doc or revit.doc
+
     @property
     def name(self):
         """ ToString() of View Family Enumerator """
@@ -229,8 +263,7 @@ class ViewType(BaseObjectWrapper):
     @property
     def views(self):
         """ Collect All Views of the same ViewType """
-        views = Collector(of_class='View').get_elements(wrapped=True)
-        return [view for view in views if view.view_type.unwrap() == self.unwrap()]
+        return ViewIndex.get(self.doc).get_views(view_type=self._revit_object)
 
     def __repr__(self):
         return super(ViewType, self).__repr__(data={'view_type': self.name})
@@ -244,6 +277,181 @@ class ViewPlanType(BaseObjectWrapper):
     """
 
 
+def _has_view_changes(args, cache):
+    """ True if DocumentChanged added a view or viewport, or deleted or
+    modified an indexed view or sheet """
+    index = cache.get('index')
+    if index is None:
+        return False
+    doc = args.GetDocument()
+    for element_id in args.GetAddedElementIds():
+        if isinstance(doc.GetElement(element_id), (DB.View, DB.Viewport)):
+            return True
+    for element_ids in (args.GetDeletedElementIds(),
+                        args.GetModifiedElementIds()):
+        for element_id in element_ids:
+            if element_id.IntegerValue in index._views:
+                return True
+    return False
+
+
+view_index_cache = DocumentCache('view_indexes',
+                                 clear_on_change=_has_view_changes)
+
+
+class ViewIndex(BaseObject):
+    """
+    Index of all views of a document, built with a single collector pass.
+    Views are indexed by view type, view family, view family type, level,
+    sheet and view template.
+
+    Indexes are cached per document, and rebuilt after any rpw
+    :any:`Transaction` ends, or after views or sheets are added, deleted
+    or changed by the UI or other tools (``DocumentChanged``).
+    Use :func:`ViewIndex.get` to get the cached index.
+
+    >>> from rpw import db
+    >>> index = db.ViewIndex.get()
+    >>> index.get_views(view_type='FloorPlan', level=level)
+    [<rpw:ViewPlan ...>, ...]
+    >>> index.get_view_ids(sheet=sheet)
+    [<ElementId>, ...]
+    >>> index.get_sheet_id(view)
+    <ElementId>
+
+    Filters:
+        * view_type (``DB.ViewType``, :any:`ViewType`, ``str``)
+        * view_family (``DB.ViewFamily``, :any:`ViewFamily`, ``str``)
+        * family_type (``DB.ViewFamilyType``, ``DB.ElementId``)
+        * level (``DB.Level``, ``DB.ElementId``): Views with ``GenLevel``
+        * sheet (``DB.ViewSheet``, ``DB.ElementId``): Views placed on sheet
+        * template (``DB.View``, ``DB.ElementId``): Views using template
+
+    Args:
+        doc (``DB.Document``, optional): Document [default: revit.doc]
+    """
+
+    FILTERS = ('view_type', 'view_family', 'family_type', 'level', 'sheet',
+               'template')
+
+    def __init__(self, doc=revit.doc):
+        self.doc = doc
+        # {view id int: DB.View}
+        self._views = OrderedDict()
+        # {sheet id int: [view id int]}
+        self._sheet_ids = {}
+        # {filter: {key: [view id int]}}
+        self._maps = dict([(name, {}) for name in self.FILTERS])
+        self._build()
+
+    @classmethod
+    def get(cls, doc=revit.doc):
+        """ Returns cached index of document, building it if needed """
+        cache = view_index_cache.get(doc)
+        try:
+            return cache['index']
+        except KeyError:
+            index = cache['index'] = cls(doc)
+            return index
+
+    def _build(self):
+        views = DB.FilteredElementCollector(self.doc).OfClass(DB.View)
+        # ViewFamily of each ViewFamilyType, looked up once per type
+        view_families = {}
+        for view in views:
+            view_id = view.Id.IntegerValue
+            self._views[view_id] = view
+            self._add('view_type', str(view.ViewType), view_id)
+            type_id = view.GetTypeId().IntegerValue
+            if type_id > 0:
+                self._add('family_type', type_id, view_id)
+                if type_id not in view_families:
+                    view_type = self.doc.GetElement(view.GetTypeId())
+                    view_families[type_id] = str(view_type.ViewFamily)
+                self._add('view_family', view_families[type_id], view_id)
+            level = view.GenLevel
+            if level is not None:
+                self._add('level', level.Id.IntegerValue, view_id)
+            template_id = view.ViewTemplateId.IntegerValue
+            if template_id > 0:
+                self._add('template', template_id, view_id)
+            if isinstance(view, DB.ViewSheet):
+                for placed_id in view.GetAllPlacedViews():
+                    self._add('sheet', view_id, placed_id.IntegerValue)
+                    self._sheet_ids[placed_id.IntegerValue] = view_id
+
+    def _add(self, name, key, view_id):
+        self._maps[name].setdefault(key, []).append(view_id)
+
+    @staticmethod
+    def _get_key(name, value):
+        """ Enums are indexed by name, elements by int id """
+        value = getattr(value, '_revit_object', value)
+        if name in ('view_type', 'view_family'):
+            return str(value)
+        if isinstance(value, int):
+            return value
+        return to_element_id(value).IntegerValue
+
+    def _get_ints(self, filters):
+        for name in filters:
+            if name not in self.FILTERS:
+                raise RpwValueError(' or '.join(self.FILTERS), name)
+        view_ids = None
+        for name, value in filters.items():
+            key = self._get_key(name, value)
+            matches = self._maps[name].get(key, [])
+            if view_ids is None:
+                view_ids = list(matches)
+            else:
+                matches = set(matches)
+                view_ids = [view_id for view_id in view_ids if view_id in matches]
+        if view_ids is None:
+            return list(self._views)
+        return view_ids
+
+    def get_view_ids(self, **filters):
+        """
+        Returns ids of views that match all filters.
+        All views are returned if no filter is provided.
+
+        Returns:
+            (``list``): ``[DB.ElementId]``
+        """
+        return [DB.ElementId(view_id) for view_id in self._get_ints(filters)]
+
+    def get_views(self, wrapped=True, **filters):
+        """
+        Returns views that match all filters.
+        All views are returned if no filter is provided.
+
+        Args:
+            wrapped (``bool``): Return wrapped views [default: True]
+
+        Returns:
+            (``list``): Views
+        """
+        views = [self._views[view_id] for view_id in self._get_ints(filters)]
+        return [Element(view) for view in views] if wrapped else views
+
+    def get_sheet_id(self, view):
+        """
+        Returns id of the sheet a view is placed on, or ``None``
+
+        Args:
+            view (``DB.View``, ``DB.ElementId``): View
+        """
+        sheet_id = self._sheet_ids.get(to_element_id(
+                                getattr(view, '_revit_object', view)).IntegerValue)
+        return DB.ElementId(sheet_id) if sheet_id is not None else None
+
+    def __len__(self):
+        return len(self._views)
+
+    def __repr__(self):
+        return super(ViewIndex, self).__repr__(data={'views': len(self)})
+
+
 class OverrideGraphicSettings(BaseObjectWrapper):
 
     """ Internal Wrapper for OverrideGraphicSettings - view.override
@@ -260,6 +468,8 @@ class OverrideGraphicSettings(BaseObjectWrapper):
     >>> wrapped_view.override.halftone(target, True)
     >>> wrapped_view.override.detail_level(target, 'Coarse')
 
+    Many overrides can be applied at once with :func:`apply_map`.
+
     Note:
         Target can be any of the following:
 
@@ -283,17 +493,56 @@ class OverrideGraphicSettings(BaseObjectWrapper):
     def __init__(self, wrapped_view):
         super(OverrideGraphicSettings, self).__init__(DB.OverrideGraphicSettings())
         self.view = wrapped_view.unwrap()
+        self._builder = _OverrideSettingsBuilder()
 
     def _set_overrides(self, target):
-        targets = to_iterable(target)
-        for target in targets:
-            try:
-                category_id = to_category_id(target)
-                self._set_category_overrides(category_id)
-            except (RpwTypeError, RpwCoerceError) as errmsg:
-                logger.debug('Not Category, Trying Element Override')
-                element_id = to_element_id(target)
-                self._set_element_overrides(element_id)
+        element_ids, category_ids = self._get_target_ids(target)
+        for element_id in element_ids:
+            self._set_element_overrides(element_id)
+        for category_id in category_ids:
+            self._set_category_overrides(category_id)
+
+    @classmethod
+    def _get_target_ids(cls, target, category_cache=None):
+        """ Sorts targets into Element Ids and Category Ids in one pass.
+        Returns ``(element_ids, category_ids)`` """
+        element_ids = as_element_ids(target)
+        # Lists of Ids can also hold Built In Category Ids (negative)
+        if element_ids is not None and not any(element_id.IntegerValue < -1
+                                               for element_id in element_ids):
+            return element_ids, []
+        element_ids = []
+        category_ids = []
+        if category_cache is None:
+            category_cache = {}
+        for target in to_iterable(target):
+            if isinstance(target, str):
+                try:
+                    category_id = category_cache[target]
+                except KeyError:
+                    category_id = category_cache[target] = to_category_id(target)
+            else:
+                category_id = cls._get_category_id(target)
+            if category_id is not None:
+                category_ids.append(category_id)
+            else:
+                element_ids.append(to_element_id(target))
+        return element_ids, category_ids
+
+    @staticmethod
+    def _get_category_id(target):
+        """ Returns Category Id if target is a Category reference,
+        or ``None`` if it should be treated as an element """
+        if hasattr(target, 'unwrap'):
+            target = target.unwrap()
+        if isinstance(target, (str, DB.BuiltInCategory)):
+            return to_category_id(target)
+        if isinstance(target, DB.Category):
+            return target.Id
+        # Built In Category Ids are negative, Element Ids are positive
+        if isinstance(target, DB.ElementId) and target.IntegerValue < -1:
+            return target
+        return None
 
     def _set_element_overrides(self, element_id):
         self.view.SetElementOverrides(element_id, self._revit_object)
@@ -301,6 +550,74 @@ class OverrideGraphicSettings(BaseObjectWrapper):
     def _set_category_overrides(self, category_id):
         self.view.SetCategoryOverrides(category_id, self._revit_object)
 
+    def apply_map(self, override_map, views=None):
+        """
+        Applies many overrides at once, in a single :any:`Transaction`.
+        If a Transaction is already open, it is used instead.
+
+        Identical settings are only built once and shared by all their
+        targets, and each pattern and color is only resolved once.
+
+        >>> colors = {'Exterior': (255, 0, 0), 'Interior': (0, 0, 255)}
+        >>> override_map = {}
+        >>> for wall in walls:
+        ...     color = colors[wall.parameters['Function'].value]
+        ...     override_map[wall] = {'projection_fill': {'color': color,
+        ...                                               'pattern': 'Solid'}}
+        >>> override_map['Doors'] = {'halftone': True}
+        >>> wrapped_view.override.apply_map(override_map)
+        >>> wrapped_view.override.apply_map(override_map, views=sheet_views)
+
+        Settings are either a ``DB.OverrideGraphicSettings``, or a
+        dictionary with any of these keys:
+
+            * ``projection_line``, ``cut_line``: ``{'color', 'pattern', 'weight'}``
+            * ``projection_fill``, ``cut_fill``: ``{'color', 'pattern', 'visible'}``
+            * ``transparency``: ``int``
+            * ``halftone``: ``bool``
+            * ``detail_level``: ``DB.ViewDetailLevel`` or name
+
+        Args:
+            override_map (``dict``): ``{target: settings}``. Targets can be
+                any target accepted by the other override methods. Since
+                dictionary keys must be hashable, multiple targets can be
+                grouped in a ``tuple``.
+            views (``[DB.View]``, optional): Views to apply overrides to
+                [default: this view]
+        """
+        doc = self.view.Document
+        views = [getattr(view, '_revit_object', view) for view
+                 in to_iterable(views)] if views is not None else [self.view]
+
+        category_cache = {}
+        # Last settings assigned to each target: {int: (ElementId, settings)}
+        element_settings = OrderedDict()
+        category_settings = OrderedDict()
+        for target, spec in override_map.items():
+            settings = self._builder.get_settings(spec)
+            element_ids, category_ids = self._get_target_ids(target,
+                                                             category_cache)
+            for element_id in element_ids:
+                element_settings[element_id.IntegerValue] = (element_id, settings)
+            for category_id in category_ids:
+                category_settings[category_id.IntegerValue] = (category_id, settings)
+
+        def apply_overrides():
+            for view in views:
+                set_element_overrides = view.SetElementOverrides
+                for element_id, settings in element_settings.values():
+                    set_element_overrides(element_id, settings)
+                set_category_overrides = view.SetCategoryOverrides
+                for category_id, settings in category_settings.values():
+                    set_category_overrides(category_id, settings)
+
+        Transaction.ensure('Apply Overrides', doc=doc)(apply_overrides)()
+        logger.debug('Applied {} settings to {} elements and {} categories '
+                     'in {} views'.format(self._builder.settings_count,
+                                          len(element_settings),
+                                          len(category_settings),
+                                          len(views)))
+
     def match_element(self, target, element_to_match):
         """
         Matches the settings of another element
@@ -329,15 +646,8 @@ class OverrideGraphicSettings(BaseObjectWrapper):
                 less than 17 or None(sets invalidPenNumber)
 
         """
-        if color:
-            Color = DB.Color(*color)
-            self._revit_object.SetProjectionLineColor(Color)
-        if pattern:
-            line_pattern = LinePatternElement.by_name_or_element_ref(pattern)
-            self._revit_object.SetProjectionLinePatternId(line_pattern.Id)
-        if weight:
-            self._revit_object.SetProjectionLineWeight(weight)
-
+        self._builder.set_graphics(self._revit_object, 'projection_line',
+                                   color=color, pattern=pattern, weight=weight)
         self._set_overrides(target)
 
     def cut_line(self, target, color=None, pattern=None, weight=None):
@@ -352,15 +662,8 @@ class OverrideGraphicSettings(BaseObjectWrapper):
             weight (``int``,``None``): Line weight must be a positive integer
                 less than 17 or None(sets invalidPenNumber)
         """
-        if color:
-            Color = DB.Color(*color)
-            self._revit_object.SetCutLineColor(Color)
-        if pattern:
-            line_pattern = LinePatternElement.by_name_or_element_ref(pattern)
-            self._revit_object.SetCutLinePatternId(line_pattern.Id)
-        if weight:
-            self._revit_object.SetCutLineWeight(weight)
-
+        self._builder.set_graphics(self._revit_object, 'cut_line',
+                                   color=color, pattern=pattern, weight=weight)
         self._set_overrides(target)
 
     def projection_fill(self, target, color=None, pattern=None, visible=None):
@@ -374,15 +677,8 @@ class OverrideGraphicSettings(BaseObjectWrapper):
             pattern (``DB.ElementId``): ElementId of Pattern
             visible (``bool``): Cut Fill Visibility
         """
-        if color:
-            Color = DB.Color(*color)
-            self._revit_object.SetProjectionFillColor(Color)
-        if pattern:
-            fill_pattern = FillPatternElement.by_name_or_element_ref(pattern)
-            self._revit_object.SetProjectionFillPatternId(fill_pattern.Id)
-        if visible is not None:
-            self._revit_object.SetProjectionFillPatternVisible(visible)
-
+        self._builder.set_graphics(self._revit_object, 'projection_fill',
+                                   color=color, pattern=pattern, visible=visible)
         self._set_overrides(target)
 
     def cut_fill(self, target, color=None, pattern=None, visible=None):
@@ -396,16 +692,8 @@ class OverrideGraphicSettings(BaseObjectWrapper):
             pattern (``DB.ElementId``): ElementId of Pattern
             visible (``bool``): Cut Fill Visibility
         """
-
-        if color:
-            Color = DB.Color(*color)
-            self._revit_object.SetCutFillColor(Color)
-        if pattern:
-            fill_pattern = FillPatternElement.by_name_or_element_ref(pattern)
-            self._revit_object.SetCutFillPatternId(fill_pattern.Id)
-        if visible is not None:
-            self._revit_object.SetCutFillPatternVisible(visible)
-
+        self._builder.set_graphics(self._revit_object, 'cut_fill',
+                                   color=color, pattern=pattern, visible=visible)
         self._set_overrides(target)
 
     def transparency(self, target, transparency):
@@ -454,3 +742,103 @@ class OverrideGraphicSettings(BaseObjectWrapper):
 
         self._revit_object.SetDetailLevel(detail_level)
         self._set_overrides(target)
+
+
+class _OverrideSettingsBuilder(object):
+    """
+    Builds ``DB.OverrideGraphicSettings`` used by :any:`OverrideGraphicSettings`.
+    Colors, patterns and settings are cached, so each one is only
+    resolved once.
+    """
+
+    GRAPHICS = {'projection_line': ('color', 'pattern', 'weight'),
+                'cut_line': ('color', 'pattern', 'weight'),
+                'projection_fill': ('color', 'pattern', 'visible'),
+                'cut_fill': ('color', 'pattern', 'visible')}
+    OPTIONS = ('transparency', 'halftone', 'detail_level')
+
+    def __init__(self):
+        self._colors = {}
+        self._patterns = {}
+        self._settings = {}
+
+    @property
+    def settings_count(self):
+        """ Number of distinct settings built """
+        return len(self._settings)
+
+    def get_settings(self, spec):
+        """ Returns ``DB.OverrideGraphicSettings`` for a settings dictionary.
+        Identical dictionaries return the same settings object """
+        if isinstance(spec, DB.OverrideGraphicSettings):
+            return spec
+        key = self._freeze(spec)
+        try:
+            return self._settings[key]
+        except KeyError:
+            settings = self._settings[key] = self._build(spec)
+            return settings
+
+    def _freeze(self, value):
+        """ Returns hashable version of a settings dictionary """
+        if isinstance(value, dict):
+            return tuple(sorted([(k, self._freeze(v)) for k, v in value.items()]))
+        if isinstance(value, list):
+            return tuple(value)
+        return value
+
+    def _build(self, spec):
+        settings = DB.OverrideGraphicSettings()
+        for name, value in spec.items():
+            if name in self.GRAPHICS:
+                unknown = set(value) - set(self.GRAPHICS[name])
+                if unknown:
+                    raise RpwValueError(', '.join(self.GRAPHICS[name]),
+                                        ', '.join(unknown))
+                self.set_graphics(settings, name, **value)
+            elif name == 'transparency':
+                settings.SetSurfaceTransparency(value)
+            elif name == 'halftone':
+                settings.SetHalftone(value)
+            elif name == 'detail_level':
+                if isinstance(value, str):
+                    value = getattr(DB.ViewDetailLevel, value)
+                settings.SetDetailLevel(value)
+            else:
+                options = sorted(self.GRAPHICS) + list(self.OPTIONS)
+                raise RpwValueError(', '.join(options), name)
+        return settings
+
+    def set_graphics(self, settings, name, color=None, pattern=None,
+                     weight=None, visible=None):
+        """ Sets line or fill overrides, ie. ``projection_line`` """
+        prefix = 'Set' + to_pascal_case(name)
+        if color:
+            getattr(settings, prefix + 'Color')(self.get_color(color))
+        if pattern:
+            pattern_class = FillPatternElement if name.endswith('fill') \
+                else LinePatternElement
+            getattr(settings, prefix + 'PatternId')(
+                                self.get_pattern_id(pattern_class, pattern))
+        if weight:
+            getattr(settings, prefix + 'Weight')(weight)
+        if visible is not None:
+            getattr(settings, prefix + 'PatternVisible')(visible)
+
+    def get_color(self, color):
+        color = tuple(color)
+        try:
+            return self._colors[color]
+        except KeyError:
+            db_color = self._colors[color] = DB.Color(*color)
+            return db_color
+
+    def get_pattern_id(self, pattern_class, pattern):
+        if not isinstance(pattern, str):
+            return to_element_id(pattern)
+        key = (pattern_class, pattern)
+        try:
+            return self._patterns[key]
+        except KeyError:
+            pattern_id = self._patterns[key] = pattern_class.by_name(pattern).Id
+            return pattern_id
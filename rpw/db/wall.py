@@ -7,9 +7,9 @@ import rpw
 from rpw import revit, DB
 from rpw.db import Element
 from rpw.db import FamilyInstance, FamilySymbol, Family, Category
+from rpw.db.bulk import change_types
 from rpw.base import BaseObjectWrapper
 from rpw.utils.logger import logger, deprecate_warning
-from rpw.utils.coerce import to_element_id
 from rpw.db.builtins import BipEnum
 from rpw.exceptions import RpwTypeError, RpwCoerceError
 from rpw.utils.mixins import ByNameCollectMixin
@@ -27,14 +27,12 @@ class Wall(FamilyInstance):
 
     def change_type(self, wall_type_reference):
         """
-        Change Wall Type
+        Change Wall Type. See :func:`rpw.db.change_types`
 
         Args:
             wall_type_reference (``ElementId``, ``WallType``, ``str``): Wall Type Reference
         """
-        wall_type = WallType.by_name_or_element_ref(wall_type_reference)
-        wall_type_id = to_element_id(wall_type)
-        self._revit_object.ChangeTypeId(wall_type_id)
+        change_types([self._revit_object], wall_type_reference, doc=self.doc)
 
     def get_symbol(self, wrapped=True):
         """ Get Wall Type Alias """
@@ -0,0 +1,247 @@
+"""
+Write Queue
+
+Scripts often read and write element by element. Every write invalidates
+the document, so the next read inside the same loop can trigger a
+regeneration. :any:`WriteQueue` records writes while the loop runs, and
+applies them grouped when the context exits:
+
+>>> from rpw import db
+>>> with db.WriteQueue('Update Walls') as queue:
+...     for wall in walls:
+...         if wall.parameters['Length'].value > 10:
+...             queue.set_parameter(wall, 'Comments', 'Long')
+...             queue.move(wall, (0, 1, 0))
+...         else:
+...             queue.delete(wall)
+>>> queue.summary
+{'types_changed': 0, 'parameters_set': 120, 'moved': 120, 'deleted': 12, ...}
+
+Writes are applied in this order:
+
+    * Type changes, grouped by target type. See :func:`rpw.db.change_types`
+    * Parameter values, in a single pass
+    * Moves, one ``ElementTransformUtils.MoveElements()`` call per vector
+    * Deletes, in a single ``doc.Delete()`` call
+
+Writes to elements that are also queued for deletion are skipped.
+If a :any:`Transaction` is already open, the writes are applied in it,
+otherwise a new Transaction is used.
+A :any:`Transaction` created with ``deferred=True`` has a queue
+that is applied before it commits:
+
+>>> with db.Transaction('Update Walls', deferred=True) as t:
+...     for wall in walls:
+...         t.queue.set_parameter(wall, 'Comments', 'Checked')
+
+"""  #
+
+import time
+from collections import OrderedDict
+
+from rpw import revit, DB
+from rpw.base import BaseObject
+from rpw.db.parameter import ParameterSet
+from rpw.db.transaction import Transaction
+from rpw.db.bulk import change_types
+from rpw.utils.coerce import to_element_id, resolve_elements, to_xyz_tuple
+from rpw.utils.dotnet import List
+from rpw.utils.logger import logger
+
+
+class WriteQueue(BaseObject):
+    """
+    Records element writes, and applies them grouped.
+
+    Args:
+        name (``str``): Name of the Transaction used by :func:`apply`
+        doc (``DB.Document``, optional): Document [default: revit.doc]
+
+    Attributes:
+        summary (``dict``): Number of writes applied by the last
+            :func:`apply` or :func:`flush`, and ``seconds``
+    """
+
+    def __init__(self, name=None, doc=revit.doc):
+        self.name = name or 'RPW Write Queue'
+        self.doc = doc
+        self.summary = None
+        self.clear()
+
+    def clear(self):
+        """ Removes all queued writes """
+        # Element or ElementId of each queued element: {int: reference}
+        self._elements = {}
+        self._parameters = OrderedDict()
+        self._types = OrderedDict()
+        self._moves = OrderedDict()
+        self._deletes = OrderedDict()
+
+    def set_parameter(self, element, param_name, value):
+        """
+        Queues a parameter value. If the same parameter is queued more
+        than once for an element, the last value is used.
+
+        Args:
+            element (``DB.Element``, ``DB.ElementId``, ``int``): Element
+            param_name (``str``): Name of Parameter
+            value (``any``): Value, see :any:`Parameter.value`
+        """
+        key = self._add_element(element)
+        self._parameters[(key, param_name)] = value
+
+    def change_type(self, element, type_reference):
+        """
+        Queues a type change.
+
+        Args:
+            element (``DB.Element``, ``DB.ElementId``, ``int``): Element
+            type_reference (``DB.ElementType``, ``DB.ElementId``): New Type
+        """
+        key = self._add_element(element)
+        self._types[key] = to_element_id(type_reference)
+
+    def move(self, element, vector):
+        """
+        Queues a move. Moves queued for the same element are added together.
+
+        Args:
+            element (``DB.Element``, ``DB.ElementId``, ``int``): Element
+            vector (``DB.XYZ``, :any:`XYZ`, ``tuple``): Translation
+        """
+        key = self._add_element(element)
+        x, y, z = to_xyz_tuple(vector)
+        dx, dy, dz = self._moves.get(key, (0.0, 0.0, 0.0))
+        self._moves[key] = (dx + x, dy + y, dz + z)
+
+    def delete(self, element):
+        """
+        Queues a delete.
+
+        Args:
+            element (``DB.Element``, ``DB.ElementId``, ``int``): Element
+        """
+        key = self._add_element(element)
+        self._deletes[key] = to_element_id(element)
+
+    def apply(self):
+        """
+        Applies queued writes. If no Transaction is open on the document,
+        the writes are applied in a new Transaction.
+
+        Returns:
+            (``dict``): Summary. See :any:`WriteQueue.summary`
+        """
+        return Transaction.ensure(self.name, doc=self.doc)(self.flush)()
+
+    def flush(self):
+        """
+        Applies queued writes in the Transaction that is open.
+        The queue is cleared once all writes are applied.
+
+        Returns:
+            (``dict``): Summary. See :any:`WriteQueue.summary`
+        """
+        start = time.time()
+        id_map = self._apply_types()
+        parameters_set = self._apply_parameters(id_map)
+        moved = self._apply_moves(id_map)
+        if self._deletes:
+            self.doc.Delete(List[DB.ElementId](self._deletes.values()))
+
+        self.summary = {'types_changed': len(self._skip_deleted(self._types)),
+                        'parameters_set': parameters_set,
+                        'moved': moved,
+                        'deleted': len(self._deletes),
+                        'seconds': time.time() - start}
+        logger.debug('{}: {}'.format(self.name, self.summary))
+        self.clear()
+        return self.summary
+
+    def _add_element(self, element):
+        """ Stores reference of element and returns its int id """
+        element = getattr(element, '_revit_object', element)
+        element_id = to_element_id(element)
+        key = element_id.IntegerValue
+        if isinstance(element, DB.Element):
+            self._elements[key] = element
+        else:
+            self._elements.setdefault(key, element_id)
+        return key
+
+    def _skip_deleted(self, writes):
+        return [key for key in writes if key not in self._deletes]
+
+    def _apply_types(self):
+        """ Changes types grouped by type. Returns {int: new ElementId} """
+        groups = OrderedDict()
+        for key in self._skip_deleted(self._types):
+            type_id = self._types[key]
+            group = groups.setdefault(type_id.IntegerValue, (type_id, []))
+            group[1].append(to_element_id(self._elements[key]))
+        id_map = {}
+        for type_id, element_ids in groups.values():
+            changed = change_types(element_ids, type_id, doc=self.doc)
+            for old_id, new_id in changed.items():
+                id_map[old_id.IntegerValue] = new_id
+        return id_map
+
+    def _get_reference(self, key, id_map):
+        """ Returns element reference, using new id if element was replaced """
+        if key in id_map:
+            return id_map[key]
+        return self._elements[key]
+
+    def _apply_parameters(self, id_map):
+        writes = [(key, param_name) for key, param_name in self._parameters
+                  if key not in self._deletes]
+        keys = list(OrderedDict.fromkeys([key for key, _ in writes]))
+        references = dict([(key, self._get_reference(key, id_map))
+                           for key in keys])
+        elements, missing_ids = resolve_elements(
+                        [references[key] for key in keys], doc=self.doc)
+        if missing_ids:
+            logger.warning('Parameters not set, elements not found: {}'.format(
+                           [id_.IntegerValue for id_ in missing_ids]))
+        parameter_sets = dict([(element.Id.IntegerValue, ParameterSet(element))
+                               for element in elements])
+        parameters_set = 0
+        for key, param_name in writes:
+            element_id = to_element_id(references[key]).IntegerValue
+            if element_id in parameter_sets:
+                value = self._parameters[(key, param_name)]
+                parameter_sets[element_id][param_name] = value
+                parameters_set += 1
+        return parameters_set
+
+    def _apply_moves(self, id_map):
+        groups = OrderedDict()
+        for key in self._skip_deleted(self._moves):
+            vector = self._moves[key]
+            if vector == (0.0, 0.0, 0.0):
+                continue
+            element_id = to_element_id(self._get_reference(key, id_map))
+            groups.setdefault(vector, []).append(element_id)
+        for vector, element_ids in groups.items():
+            DB.ElementTransformUtils.MoveElements(self.doc,
+                                                  List[DB.ElementId](element_ids),
+                                                  DB.XYZ(*vector))
+        return sum([len(element_ids) for element_ids in groups.values()])
+
+    def __len__(self):
+        return (len(self._parameters) + len(self._types) +
+                len(self._moves) + len(self._deletes))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception, exception_msg, tb):
+        if exception:
+            logger.error('Error in WriteQueue Context: writes discarded.')
+            self.clear()
+        else:
+            self.apply()
+
+    def __repr__(self):
+        return super(WriteQueue, self).__repr__(data={'name': self.name,
+                                                      'writes': len(self)})
@@ -1,9 +1,171 @@
+from math import sqrt
+from operator import itemgetter
+
 from rpw import DB
 from rpw.base import BaseObjectWrapper
 from rpw.exceptions import RpwCoerceError
 from rpw.db.transform import Transform
 from collections import OrderedDict
 
+
+class Vec3(tuple):
+    """
+    Immutable pure-python vector for geometry math.
+
+    Operations on ``Vec3`` do not create any ``DB.XYZ`` objects.
+    Convert to ``DB.XYZ`` with :func:`to_xyz` when passing it into the API.
+    :any:`XYZ` accepts ``Vec3`` wherever it accepts a point.
+
+    >>> from rpw.db.xyz import Vec3
+    >>> v = Vec3(1, 2, 3)
+    >>> (v + Vec3(1, 0, 0)) * 2
+    Vec3(4.0, 4.0, 6.0)
+    >>> v.length
+    3.7416573867739413
+    >>> v.to_xyz()
+    <Autodesk.Revit.DB.XYZ>
+
+    Vectors are hashable. Coordinates are rounded to :attr:`TOLERANCE`
+    for hashing and equality, so points that are almost equal can be used
+    as dictionary keys:
+
+    >>> {Vec3(0, 0, 0): 'origin'}[Vec3(0, 0, 1e-12)]
+    'origin'
+    """
+
+    __slots__ = ()
+
+    #: Tolerance used for equality and hashing
+    TOLERANCE = 1e-9
+
+    def __new__(cls, x=0.0, y=0.0, z=0.0):
+        return tuple.__new__(cls, (float(x), float(y), float(z)))
+
+    x = property(itemgetter(0), doc='X Value')
+    y = property(itemgetter(1), doc='Y Value')
+    z = property(itemgetter(2), doc='Z Value')
+
+    @classmethod
+    def from_xyz(cls, point):
+        """ Creates Vec3 from ``DB.XYZ``, :any:`XYZ` or sequence """
+        point = getattr(point, '_revit_object', point)
+        if hasattr(point, 'X'):
+            return tuple.__new__(cls, (point.X, point.Y, point.Z))
+        return cls(*point)
+
+    def to_xyz(self):
+        """ Returns ``DB.XYZ`` """
+        return DB.XYZ(self[0], self[1], self[2])
+
+    @property
+    def length(self):
+        return sqrt(self[0] * self[0] + self[1] * self[1] + self[2] * self[2])
+
+    def normalize(self):
+        """ Returns vector of length 1 in the same direction """
+        length = self.length
+        return tuple.__new__(Vec3, (self[0] / length,
+                                    self[1] / length,
+                                    self[2] / length))
+
+    def dot(self, other):
+        return self[0] * other[0] + self[1] * other[1] + self[2] * other[2]
+
+    def cross(self, other):
+        ax, ay, az = self
+        bx, by, bz = other
+        return tuple.__new__(Vec3, (ay * bz - az * by,
+                                    az * bx - ax * bz,
+                                    ax * by - ay * bx))
+
+    def distance_to(self, other):
+        dx = self[0] - other[0]
+        dy = self[1] - other[1]
+        dz = self[2] - other[2]
+        return sqrt(dx * dx + dy * dy + dz * dz)
+
+    def at_z(self, z):
+        """ Returns a new vector at the passed Z value """
+        return tuple.__new__(Vec3, (self[0], self[1], float(z)))
+
+    def _quantized(self):
+        tolerance = Vec3.TOLERANCE
+        return (int(round(self[0] / tolerance)),
+                int(round(self[1] / tolerance)),
+                int(round(self[2] / tolerance)))
+
+    def __add__(self, other):
+        other = _as_vec3(other)
+        return tuple.__new__(Vec3, (self[0] + other[0],
+                                    self[1] + other[1],
+                                    self[2] + other[2]))
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        other = _as_vec3(other)
+        return tuple.__new__(Vec3, (self[0] - other[0],
+                                    self[1] - other[1],
+                                    self[2] - other[2]))
+
+    def __rsub__(self, other):
+        return _as_vec3(other) - self
+
+    def __mul__(self, value):
+        return tuple.__new__(Vec3, (self[0] * value,
+                                    self[1] * value,
+                                    self[2] * value))
+
+    __rmul__ = __mul__
+
+    def __div__(self, value):
+        return tuple.__new__(Vec3, (self[0] / value,
+                                    self[1] / value,
+                                    self[2] / value))
+
+    __truediv__ = __div__
+
+    def __neg__(self):
+        return tuple.__new__(Vec3, (-self[0], -self[1], -self[2]))
+
+    def __eq__(self, other):
+        try:
+            return self._quantized() == _as_vec3(other)._quantized()
+        except (TypeError, ValueError, RpwCoerceError):
+            return False
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash(self._quantized())
+
+    def __repr__(self):
+        return 'Vec3({}, {}, {})'.format(*self)
+
+
+def _as_vec3(point):
+    """ Returns point as Vec3. Vec3 instances are returned unchanged """
+    if isinstance(point, Vec3):
+        return point
+    if isinstance(point, (tuple, list)) and len(point) == 3:
+        return Vec3(*point)
+    try:
+        return Vec3.from_xyz(point)
+    except TypeError:
+        raise RpwCoerceError(point, 'point-like object')
+
+
+def _to_db_xyz(point):
+    """ Returns ``DB.XYZ`` of point without wrapping it """
+    if isinstance(point, Vec3):
+        return DB.XYZ(point[0], point[1], point[2])
+    if isinstance(point, XYZ):
+        return point._revit_object
+    if isinstance(point, DB.XYZ):
+        return point
+    return XYZ(point).unwrap()
+
 class XYZ(BaseObjectWrapper):
     """
     `DB.XYZ` Wrapper
@@ -36,6 +198,7 @@ class XYZ(BaseObjectWrapper):
         >>> XYZ([0,0])
         >>> XYZ([0,0,0])
         >>> XYZ(DB.XYZ(0,0,0))
+        >>> XYZ(Vec3(0,0,0))
 
         Args:
             point_reference (``DB.XYZ``,``iterable``, ``args``): Point like data
@@ -46,6 +209,9 @@ class XYZ(BaseObjectWrapper):
         # XYZ(0,0)
         elif len(point_reference) == 2:
             xyz = DB.XYZ(point_reference[0], point_reference[1], 0)
+        # XYZ(Vec3(0,0,0))
+        elif len(point_reference) == 1 and isinstance(point_reference[0], Vec3):
+            xyz = point_reference[0].to_xyz()
         # XYZ([0,0,0]) or # XYZ([0,0])
         elif len(point_reference) == 1 and isinstance(point_reference[0], (tuple, list)):
             # Assumes one arg, tuple
@@ -122,6 +288,16 @@ class XYZ(BaseObjectWrapper):
         """
         return OrderedDict([('x', self.x), ('y', self.y), ('z', self.z)])
 
+    @property
+    def as_vec3(self):
+        """
+        :any:`Vec3` of the Point, for geometry math without API calls
+
+        Returns:
+            (:any:`Vec3`): Vector
+        """
+        return Vec3.from_xyz(self._revit_object)
+
     def rotate(self, rotation, axis=None, radians=False):
         rotated_xyz = Transform.rotate_vector(self.unwrap(),
                                               rotation,
@@ -136,15 +312,15 @@ class XYZ(BaseObjectWrapper):
 
     def __add__(self, point):
         """ Addition Method """
-        return XYZ(self.unwrap() + XYZ(point).unwrap())
+        return XYZ(self._revit_object + _to_db_xyz(point))
 
     def __sub__(self, point):
         """ Subtraction Method """
-        return XYZ(self.unwrap() - XYZ(point).unwrap())
+        return XYZ(self._revit_object - _to_db_xyz(point))
 
     def __eq__(self, other):
         """ Equality Method """
-        return self._revit_object.IsAlmostEqualTo(XYZ(other).unwrap())
+        return self._revit_object.IsAlmostEqualTo(_to_db_xyz(other))
 
     def __repr__(self):
         return super(XYZ, self).__repr__(data=self.as_dict,
@@ -64,7 +64,7 @@ class Selection(BaseObjectWrapper, ElementSet):
 
         if not elements_or_ids:
             # Is List of elements is not provided, uses uidoc selection
-            elements_or_ids = [e for e in uidoc.Selection.GetElementIds()]
+            elements_or_ids = uidoc.Selection.GetElementIds()
 
         ElementSet.__init__(self, elements_or_ids, doc=self.uidoc.Document)
 
@@ -84,8 +84,15 @@ class Selection(BaseObjectWrapper, ElementSet):
         if select:
             self.update()
 
-    def update(self):
-        """ Forces UI selection to match the Selection() object """
+    def update(self, elements_or_ids=None):
+        """ Forces UI selection to match the Selection() object
+
+        Args:
+            elements_or_ids ([DB.Element or DB.ElementID], optional): Elements
+                to add to the selection before updating
+        """
+        if elements_or_ids is not None:
+            ElementSet.update(self, elements_or_ids)
         self._revit_object.SetElementIds(self.get_element_ids(as_list=True))
 
     def clear(self):
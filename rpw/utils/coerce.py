@@ -7,32 +7,86 @@ import rpw
 from rpw import revit, DB
 from rpw.base import BaseObjectWrapper
 from rpw.db.builtins import BicEnum
+from rpw.db.cache import element_cache
 from rpw.utils.dotnet import List
+from rpw.utils.logger import logger
 from rpw.exceptions import RpwTypeError
 
+# Number of uncached ids above which resolve_elements uses a single
+# FilteredElementCollector instead of one GetElement call per id
+BULK_RESOLVE_THRESHOLD = 100
 
-def to_element_id(element_reference):
-    """
-    Coerces Element References (Element, ElementId, ...) to Element Id
 
-    >>> from rpw.utils.coerce import to_element_id
-    >>> to_element_id(SomeElement)
-    <Element Id>
+# Cache of ``type -> function`` used by :func:`to_element_id`.
+# Populated the first time each type is seen.
+_element_id_converters = {}
 
-    """
+
+def _id_from_id_attr(element_reference):
+    return element_reference.Id
+
+
+def _id_from_reference(element_reference):
+    return element_reference.ElementId
+
+
+def _id_from_id(element_reference):
+    return element_reference
+
+
+def _get_element_id_converter(element_reference):
+    """ Resolves and caches the function that converts the type of
+    element_reference into an ElementId """
     if hasattr(element_reference, 'Id'):
-        element_id = element_reference.Id
+        converter = _id_from_id_attr
     elif isinstance(element_reference, DB.Reference):
-        element_id = element_reference.ElementId
+        converter = _id_from_reference
     elif isinstance(element_reference, int):
-        element_id = DB.ElementId(element_reference)
+        converter = DB.ElementId
     elif isinstance(element_reference, DB.ElementId):
-        element_id = element_reference
+        converter = _id_from_id
     elif element_reference == DB.ElementId.InvalidElementId:
-        element_id = element_reference
+        return _id_from_id
     else:
         raise RpwTypeError('Element, ElementId, or int', type(element_reference))
-    return element_id
+    _element_id_converters[type(element_reference)] = converter
+    return converter
+
+
+def to_element_id(element_reference):
+    """
+    Coerces Element References (Element, ElementId, ...) to Element Id
+
+    >>> from rpw.utils.coerce import to_element_id
+    >>> to_element_id(SomeElement)
+    <Element Id>
+
+    """
+    try:
+        converter = _element_id_converters[type(element_reference)]
+    except KeyError:
+        converter = _get_element_id_converter(element_reference)
+    return converter(element_reference)
+
+
+def as_element_ids(element_references):
+    """
+    Returns the Element Ids of collections that already hold Element Ids
+    without coercing each item: ``List[DB.ElementId]``, :any:`ElementSet`
+    and :any:`Collector`.
+
+    Args:
+        element_references: Any object
+
+    Returns:
+        (``List[DB.ElementId]``, ``list``): Element Ids, or ``None`` if
+        ``element_references`` is not one of the collections above.
+    """
+    if isinstance(element_references, List[DB.ElementId]):
+        return element_references
+    if hasattr(element_references, 'get_element_ids'):
+        return element_references.get_element_ids()
+    return None
 
 
 def to_element_ids(element_references):
@@ -49,6 +103,11 @@ def to_element_ids(element_references):
     >>> to_element_ids([20001, 20003])
     [ DB.ElementId, DB.ElementId ]
 
+    Note:
+        Collections returned by :func:`as_element_ids` are copied without
+        coercion. Lists with items of a single type (ie. all ``int``) are
+        converted with a single type lookup.
+
     Args:
         elements (``DB.Element``): Iterable list (``list`` or ``set``)
                                    or single of ``Element``, ``int``.
@@ -56,9 +115,42 @@ def to_element_ids(element_references):
     Returns:
         [``DB.ElementId``, ... ]: List of Element Ids.
     """
+    element_ids = as_element_ids(element_references)
+    if element_ids is not None:
+        return list(element_ids)
+
     element_references = to_iterable(element_references)
+    if isinstance(element_references, (list, tuple)) and element_references:
+        item_type = type(element_references[0])
+        if all(type(e_ref) is item_type for e_ref in element_references):
+            converter = _element_id_converters.get(item_type) or \
+                        _get_element_id_converter(element_references[0])
+            if converter is _id_from_id:
+                return list(element_references)
+            return [converter(e_ref) for e_ref in element_references]
     return [to_element_id(e_ref) for e_ref in element_references]
 
+
+def to_element_id_list(element_references):
+    """
+    Same as :func:`to_element_ids`, but returns a ``List[DB.ElementId]``
+    for use in Revit API calls. ``List[DB.ElementId]`` inputs are returned
+    unchanged.
+
+    >>> from rpw.utils.coerce import to_element_id_list
+    >>> to_element_id_list([20001, 20003])
+    List[ElementId]([<ElementId>, <ElementId>])
+
+    Returns:
+        ``List[DB.ElementId]``: List of Element Ids
+    """
+    element_ids = as_element_ids(element_references)
+    if element_ids is None:
+        element_ids = to_element_ids(element_references)
+    elif isinstance(element_ids, List[DB.ElementId]):
+        return element_ids
+    return List[DB.ElementId](element_ids)
+
 # TODO: Add case to unwrap rpw elements
 def to_element(element_reference, doc=revit.doc):
     """ Same as to_elements but for a single object """
@@ -99,7 +191,100 @@ def to_elements(element_references, doc=revit.doc):
         [``DB.Element``]: Elements
     """
     element_references = to_iterable(element_references)
-    return [to_element(e_ref) for e_ref in element_references]
+    return [to_element(e_ref, doc=doc) for e_ref in element_references]
+
+
+def resolve_elements(element_references, doc=None,
+                     bulk_threshold=BULK_RESOLVE_THRESHOLD):
+    """
+    Resolves mixed element references (``DB.Element``, wrapped elements,
+    ``DB.ElementId``, ``DB.Reference``, ``int``) into ``DB.Element`` in a
+    single pass.
+
+    Resolved elements are stored in a per-document cache of bounded size
+    (see :any:`DocumentCache`), so repeated lookups of the same ids are free.
+    When many ids are not cached, they are fetched with a single
+    ``FilteredElementCollector(doc, ids)`` instead of one
+    ``doc.GetElement()`` call per id.
+
+    >>> from rpw.utils.coerce import resolve_elements
+    >>> elements, missing_ids = resolve_elements([20001, wall, wall.Id])
+    >>> elements
+    [ DB.Element, DB.Wall, DB.Wall ]
+    >>> missing_ids
+    []
+
+    Args:
+        element_references (``list``): Element Reference, single or list
+        doc (``DB.Document``, optional): Document [default: revit.doc]
+        bulk_threshold (``int``): Minimum number of uncached ids to use
+            a collector [default: 100]
+
+    Returns:
+        (``tuple``): ``([DB.Element], [DB.ElementId])``: Elements in input
+        order, and ids that could not be found in the document.
+        Missing ids are not included in the elements list.
+    """
+    doc = doc or revit.doc
+    cache = element_cache.get(doc)
+    # Resolved elements, or int keys still to be fetched from the document
+    resolved = []
+    pending = {}
+    for element_reference in to_iterable(element_references):
+        if hasattr(element_reference, 'unwrap'):
+            element_reference = element_reference.unwrap()
+        if isinstance(element_reference, DB.Element):
+            resolved.append(element_reference)
+            continue
+        element_id = to_element_id(element_reference)
+        key = element_id.IntegerValue
+        element = cache.get(key)
+        if element is not None and element.IsValidObject:
+            resolved.append(element)
+        else:
+            pending[key] = element_id
+            resolved.append(key)
+
+    found = {}
+    if pending:
+        found = _get_elements(doc, pending, bulk_threshold)
+        element_cache.update(found, doc=doc)
+
+    elements = []
+    missing_ids = []
+    for element_or_key in resolved:
+        if isinstance(element_or_key, int):
+            element = found.get(element_or_key)
+            if element is None:
+                missing_ids.append(pending[element_or_key])
+                continue
+            element_or_key = element
+        elements.append(element_or_key)
+    if missing_ids:
+        logger.debug('Elements not found: {}'.format(
+                     [id_.IntegerValue for id_ in missing_ids]))
+    return elements, missing_ids
+
+
+def _get_elements(doc, pending, bulk_threshold):
+    """ Returns {int: DB.Element} for ids in pending found in document """
+    if len(pending) >= bulk_threshold:
+        element_ids = List[DB.ElementId](pending.values())
+        any_element = DB.LogicalOrFilter(DB.ElementIsElementTypeFilter(False),
+                                         DB.ElementIsElementTypeFilter(True))
+        try:
+            collector = DB.FilteredElementCollector(doc, element_ids)
+            elements = collector.WherePasses(any_element).ToElements()
+            return dict([(e.Id.IntegerValue, e) for e in elements])
+        except Exception:
+            # Collector raises if any id is not in the document
+            logger.debug('Bulk element lookup failed. Using GetElement')
+    found = {}
+    for key, element_id in pending.items():
+        element = doc.GetElement(element_id)
+        if element is not None:
+            found[key] = element
+    return found
 
 
 def to_class(class_reference):
@@ -174,7 +359,7 @@ def to_category_id(category_reference, fuzzy=True):
     Returns:
         [``DB.ElementId``]: ElementId of Category
     """
-    category_enum = to_category(category_reference)
+    category_enum = to_category(category_reference, fuzzy=fuzzy)
     return DB.ElementId(category_enum)
 
 
@@ -185,6 +370,8 @@ def to_iterable(item_or_iterable):
     >>> from rpw.utils.coerce import to_iterable
     >>> to_iterable(SomeElement)
     [SomeElement]
+    >>> to_iterable('Walls')
+    ['Walls']
 
     Args:
         any (iterable, non-iterable)
@@ -192,12 +379,39 @@ def to_iterable(item_or_iterable):
     Returns:
         (`iterable`): Same as input
     """
+    if isinstance(item_or_iterable, str):
+        # Strings are iterable, but are always treated as a single item
+        return [item_or_iterable]
     if hasattr(item_or_iterable, '__iter__'):
         return item_or_iterable
     else:
         return [item_or_iterable]
 
 
+def to_xyz_tuple(point_reference):
+    """
+    Coerces a point-like object into a tuple of 3 values
+
+    >>> from rpw.utils.coerce import to_xyz_tuple
+    >>> to_xyz_tuple(DB.XYZ(1,2,3))
+    (1.0, 2.0, 3.0)
+    >>> to_xyz_tuple((1,2))
+    (1, 2, 0.0)
+
+    Args:
+        point_reference (``DB.XYZ``, :any:`XYZ`, :any:`Vec3`, ``iterable``): Point
+
+    Returns:
+        (``tuple``): (x, y, z)
+    """
+    point_reference = getattr(point_reference, '_revit_object', point_reference)
+    if hasattr(point_reference, 'X'):
+        return (point_reference.X, point_reference.Y, point_reference.Z)
+    if len(point_reference) == 2:
+        return (point_reference[0], point_reference[1], 0.0)
+    return (point_reference[0], point_reference[1], point_reference[2])
+
+
 def to_pascal_case(snake_str):
     """ Converts Snake Case to Pascal Case
 
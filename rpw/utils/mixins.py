@@ -75,3 +75,40 @@ class CategoryMixin():
     def get_category(self, wrapped=True):
         """ Wrapped ``DB.Category``"""
         return rpw.db.Category(self._category) if wrapped else self._category
+
+
+class BulkEditMixin():
+
+    """ Adds delete(), copy(), move(), rotate() and mirror() methods
+    to collections of elements. Each method is one Revit API call
+    for all elements. See :doc:`/db/bulk`.
+    Requires ``self.doc``, and elements accepted by
+    :func:`rpw.utils.coerce.to_element_id_list`
+    """
+
+    def delete(self):
+        """ Deletes all elements. Returns ids of deleted elements """
+        return rpw.db.bulk.delete(self, doc=self.doc)
+
+    def copy(self, vector_or_transform, to_doc=None, map_ids=False):
+        """
+        Copies all elements. See :func:`rpw.db.bulk.copy`
+
+        Returns:
+            (``tuple``): ``([new ElementId], {source ElementId: new ElementId})``
+        """
+        return rpw.db.bulk.copy(self, vector_or_transform, to_doc=to_doc,
+                                doc=self.doc, map_ids=map_ids)
+
+    def move(self, vector):
+        """ Moves all elements by vector """
+        rpw.db.bulk.move(self, vector, doc=self.doc)
+
+    def rotate(self, axis, angle, radians=False):
+        """ Rotates all elements. See :func:`rpw.db.bulk.rotate` """
+        rpw.db.bulk.rotate(self, axis, angle, radians=radians, doc=self.doc)
+
+    def mirror(self, plane, copy=True, map_ids=False):
+        """ Mirrors all elements. See :func:`rpw.db.bulk.mirror` """
+        return rpw.db.bulk.mirror(self, plane, copy=copy, doc=self.doc,
+                                  map_ids=map_ids)
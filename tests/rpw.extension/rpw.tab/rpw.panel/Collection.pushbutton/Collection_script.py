@@ -139,12 +139,128 @@ class ElementSetTests(unittest.TestCase):
         self.assertEqual(poped.Id, id_)
         self.assertIsInstance(poped.unwrap(), DB.View)
 
+    def test_element_set_remove(self):
+        rv = rpw.db.ElementSet(self.views)
+        id_ = self.views[0].Id
+        rv.remove(id_)
+        self.assertNotIn(id_, rv)
+        with self.assertRaises(KeyError):
+            rv.remove(id_)
+        rv.discard(id_)
+
+    def test_element_set_update_order(self):
+        rv = rpw.db.ElementSet()
+        rv.update([self.views[1], self.views[0], self.views[1]])
+        self.assertEqual(rv.get_element_ids(as_list=False),
+                         [self.views[1].Id, self.views[0].Id])
+
+    def test_element_set_operators(self):
+        first = rpw.db.ElementSet(self.views[:2])
+        second = rpw.db.ElementSet(self.views[1:3])
+        self.assertEqual(len(first | second), 3)
+        self.assertEqual(len(first & second), 1)
+        self.assertIn(self.views[0], first - second)
+        self.assertEqual(len(first ^ second), 2)
+
     def test_element_set_wrapped_elements(self):
         rv = rpw.db.ElementSet(self.views).wrapped_elements
         self.assertIsInstance(rv[0], rpw.db.Element)
 
 
 
+######################
+# Bulk Edits
+######################
+
+class BulkEditTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        logger.title('TESTING BulkEditTests...')
+
+    def setUp(self):
+        test_utils.delete_all_walls()
+        self.wall = test_utils.make_wall()
+        self.walls = rpw.db.ElementSet([self.wall])
+
+    def tearDown(self):
+        test_utils.delete_all_walls()
+
+    def test_bulk_move(self):
+        start = self.wall.Location.Curve.GetEndPoint(0)
+        with rpw.db.Transaction('Move'):
+            self.walls.move((0, 10, 0))
+        end = self.wall.Location.Curve.GetEndPoint(0)
+        self.assertAlmostEqual(end.Y - start.Y, 10.0)
+
+    def test_bulk_copy(self):
+        with rpw.db.Transaction('Copy'):
+            new_ids, id_map = self.walls.copy((0, 30, 0))
+        self.assertEqual(len(new_ids), 1)
+        self.assertEqual(len(id_map), 0)
+        walls = rpw.db.Collector(of_class='Wall', is_not_type=True)
+        self.assertEqual(len(walls), 2)
+
+    def test_bulk_copy_map_ids(self):
+        wall_2 = test_utils.make_wall()
+        walls = rpw.db.ElementSet([self.wall, wall_2])
+        with rpw.db.Transaction('Copy'):
+            new_ids, id_map = walls.copy((0, 30, 0), map_ids=True)
+        self.assertEqual(len(new_ids), 2)
+        self.assertEqual(sorted(id_map.keys()), sorted([self.wall.Id, wall_2.Id]))
+        self.assertEqual(sorted(id_map.values()), sorted(new_ids))
+
+    def test_bulk_delete(self):
+        with rpw.db.Transaction('Delete'):
+            deleted_ids = self.walls.delete()
+        self.assertIn(self.wall.Id, deleted_ids)
+        self.assertEqual(len(self.walls), 0)
+
+    def test_bulk_collector_rotate(self):
+        walls = rpw.db.Collector(of_class='Wall', is_not_type=True)
+        with rpw.db.Transaction('Rotate'):
+            walls.rotate((0, 0, 0), 90)
+        end = self.wall.Location.Curve.GetEndPoint(1)
+        self.assertAlmostEqual(end.X, -20.0)
+
+######################
+# IdBitmap
+######################
+
+class IdBitmapTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        logger.title('TESTING IdBitmap...')
+        collector = DB.FilteredElementCollector(doc)
+        cls.views = collector.OfClass(DB.View).ToElements()
+
+    def test_id_bitmap_add(self):
+        rv = rpw.db.IdBitmap(self.views)
+        rv.update(self.views)
+        self.assertEqual(len(rv), len(self.views))
+        self.assertIn(self.views[0].Id, rv)
+
+    def test_id_bitmap_operators(self):
+        first = rpw.db.IdBitmap(self.views[:2])
+        second = rpw.db.IdBitmap(self.views[1:3])
+        self.assertEqual(len(first | second), 3)
+        self.assertEqual(len(first & second), 1)
+        self.assertEqual(len(first - second), 1)
+        self.assertEqual(len(first ^ second), 2)
+
+    def test_id_bitmap_bytes(self):
+        rv = rpw.db.IdBitmap(self.views)
+        self.assertEqual(rpw.db.IdBitmap.from_bytes(rv.to_bytes()), rv)
+
+    def test_id_bitmap_collector(self):
+        rv = rpw.db.IdBitmap(self.views)
+        collector = rpw.db.Collector(element_ids=rv, of_class='View')
+        self.assertEqual(len(collector), len(self.views))
+        collector = rpw.db.Collector(of_class='View', exclude=rv)
+        self.assertEqual(len(collector), 0)
+
+
 ######################
 # ElementCollection
 ######################
@@ -260,6 +376,21 @@ class XyzCollectionTests(unittest.TestCase):
         av = xyz_collection.average
         self.assertEqual(av, XYZ(5,5,0))
 
+    def test_xyz_nearest(self):
+        xyz_collection = rpw.db.XyzCollection(self.points)
+        self.assertEqual(xyz_collection.nearest(XYZ(6,6,0)), XYZ(5,5,0))
+        self.assertEqual(xyz_collection.nearest_index(XYZ(9,9,0)), 1)
+
+    def test_xyz_distances_to(self):
+        xyz_collection = rpw.db.XyzCollection(self.points)
+        distances = xyz_collection.distances_to(XYZ(0,0,0))
+        self.assertAlmostEqual(distances[2], (50 ** 0.5))
+
+    def test_xyz_from_coords(self):
+        xyz_collection = rpw.db.XyzCollection.from_coords([0,0,0, 4,4,2])
+        self.assertEqual(xyz_collection.average, XYZ(2,2,1))
+        self.assertIsInstance(xyz_collection.to_xyz_list()[0], DB.XYZ)
+
     def test_xyz_sorted_by(self):
         xyz_collection = rpw.db.XyzCollection(self.points)
         rv = xyz_collection.sorted_by('x')
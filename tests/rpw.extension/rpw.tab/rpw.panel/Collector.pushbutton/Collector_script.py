@@ -426,6 +426,155 @@ class FilteredCollectorCompareTests(unittest.TestCase):
 
     # TODO: Fo all FilteredElementCollector
 
+class ExportTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        logger.title('TESTING EXPORT...')
+
+    def setUp(self):
+        import tempfile
+        self.path = os.path.join(tempfile.gettempdir(), 'rpw_export_test')
+
+    def test_export_jsonl(self):
+        import json
+        collector = rpw.db.Collector(of_class='Wall', is_not_type=True)
+        stats = rpw.db.export.stream(collector, fields=['Comments'],
+                                     fmt='jsonl', path=self.path, buffer_size=1)
+        self.assertEqual(stats['rows'], len(collector))
+        with open(self.path) as fp:
+            rows = [json.loads(line) for line in fp]
+        self.assertEqual(rows[0]['id'], collector[0].Id.IntegerValue)
+        self.assertIn('Comments', rows[0])
+
+    def test_export_csv(self):
+        import csv
+        collector = rpw.db.Collector(of_class='Wall', is_not_type=True)
+        fields = ['Comments', ('level', lambda e: e.LevelId)]
+        stats = rpw.db.export.stream(collector, fields=fields,
+                                     fmt='csv', path=self.path)
+        with open(self.path, 'rb') as fp:
+            rows = [row for row in csv.reader(fp)]
+        self.assertEqual(rows[0], ['id', 'Comments', 'level'])
+        self.assertEqual(len(rows), stats['rows'] + 1)
+        self.assertEqual(rows[1][2], str(collector[0].LevelId.IntegerValue))
+
+    def test_export_type_parameter_display_units(self):
+        import json
+        wall = rpw.db.Collector(of_class='Wall', is_not_type=True).get_first(wrapped=False)
+        # Width is only defined on the Wall Type
+        self.assertIsNone(wall.LookupParameter('Width'))
+        parameter = revit.doc.GetElement(wall.GetTypeId()).LookupParameter('Width')
+        factor, offset = rpw.db.UnitConverter(revit.doc).get_conversion(parameter)
+        rpw.db.export.stream([wall], fields=['Width'], path=self.path,
+                             include_type=True, display_units=True)
+        with open(self.path) as fp:
+            row = json.loads(fp.readline())
+        self.assertAlmostEqual(row['Width'], parameter.AsDouble() * factor + offset)
+
+
+######################
+# SpatialIndex
+######################
+
+class SpatialIndexTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        logger.title('TESTING SpatialIndex...')
+
+    def setUp(self):
+        self.wall = rpw.db.Collector(of_class='Wall').get_first(wrapped=False)
+        self.index = rpw.db.SpatialIndex.build(rpw.db.Collector(of_class='Wall'))
+
+    def test_spatial_index_within(self):
+        rv = self.index.within(((-1,-1,-1), (1,1,1)))
+        self.assertEqual(rv, [self.wall.Id])
+        rv = self.index.within(((100,100,100), (101,101,101)))
+        self.assertEqual(rv, [])
+
+    def test_spatial_index_nearest(self):
+        element_id, distance = self.index.nearest((50,50,0))[0]
+        self.assertEqual(element_id, self.wall.Id)
+        self.assertGreater(distance, 0)
+
+    def test_spatial_index_overlaps(self):
+        pairs = self.index.overlaps(self.index)
+        self.assertEqual(pairs, [])
+
+    def test_spatial_index_cached(self):
+        collector = rpw.db.Collector(of_class='Wall')
+        index = rpw.db.SpatialIndex.build(collector, name='walls')
+        self.assertIs(rpw.db.SpatialIndex.build(collector, name='walls'), index)
+        index.update([], deleted_ids=[self.wall.Id])
+        self.assertNotIn(self.wall.Id, index)
+        from rpw.db.spatial_index import spatial_index_cache
+        spatial_index_cache.clear()
+
+    def test_spatial_index_element_ids(self):
+        wall_ids = rpw.db.Collector(of_class='Wall').get_element_ids()
+        index = rpw.db.SpatialIndex.build(wall_ids)
+        self.assertEqual(len(index), len(self.index))
+        self.assertIn(self.wall.Id, index)
+
+    def test_spatial_index_collector(self):
+        collector = rpw.db.Collector(of_class='Wall')
+        index = rpw.db.SpatialIndex.build(collector, name='walls')
+        self.assertIn(self.wall.Id, index)
+        self.assertIs(rpw.db.SpatialIndex.build(collector, name='walls'), index)
+        from rpw.db.spatial_index import spatial_index_cache
+        spatial_index_cache.clear()
+
+    def test_spatial_index_cached_rebuilt(self):
+        collector = rpw.db.Collector(of_class='Wall')
+        index = rpw.db.SpatialIndex.build(collector, name='walls')
+        rebuilt = rpw.db.SpatialIndex.build(collector, cell_size=1.0, name='walls')
+        self.assertIsNot(rebuilt, index)
+        self.assertEqual(rebuilt.cell_size, 1.0)
+        from rpw.db.spatial_index import spatial_index_cache
+        spatial_index_cache.clear()
+
+    def test_spatial_index_cached_document_changed(self):
+        collector = rpw.db.Collector(of_class='Wall')
+        index = rpw.db.SpatialIndex.build(collector, name='walls')
+        with rpw.db.Transaction('Move Wall'):
+            DB.ElementTransformUtils.MoveElement(revit.doc, self.wall.Id,
+                                                 DB.XYZ(100, 0, 0))
+        try:
+            self.assertEqual(index.within(((99,-1,-1), (101,1,1))), [self.wall.Id])
+            self.assertEqual(index.within(((-1,-1,-1), (1,1,1))), [])
+        finally:
+            with rpw.db.Transaction('Move Wall'):
+                DB.ElementTransformUtils.MoveElement(revit.doc, self.wall.Id,
+                                                     DB.XYZ(-100, 0, 0))
+            from rpw.db.spatial_index import spatial_index_cache
+            spatial_index_cache.clear()
+
+
+######################
+# Clash
+######################
+
+class ClashTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        logger.title('TESTING Clash...')
+
+    def test_clash_same_element(self):
+        walls = rpw.db.Collector(of_class='Wall')
+        clashes = rpw.db.clash(walls, walls)
+        self.assertEqual(list(clashes), [])
+        self.assertEqual(list(clashes.timings.keys()),
+                         ['extract', 'broad_phase', 'narrow_phase'])
+
+    def test_clash_broad_phase(self):
+        walls = rpw.db.Collector(of_class='Wall').get_elements(wrapped=False)
+        levels = rpw.db.Collector(of_class='Level').get_elements(wrapped=False)
+        clashes = rpw.db.clash(walls, levels, tolerance=100, exact=False)
+        self.assertTrue(all([isinstance(b, DB.Level) for a, b in clashes]))
+
+
 def run():
     logger.verbose(False)
     suite = unittest.TestLoader().discover(os.path.dirname(__file__))
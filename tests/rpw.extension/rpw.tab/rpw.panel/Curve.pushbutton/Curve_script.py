@@ -45,6 +45,7 @@ from rpw import revit, DB, UI, db
 
 doc, uidoc = revit.doc, revit.uidoc
 
+from rpw.utils.dotnet import List
 from rpw.db.xyz import XYZ
 from rpw.exceptions import RpwParameterNotFound, RpwWrongStorageType
 from rpw.utils.logger import logger
@@ -143,6 +144,53 @@ class CurveCreate(unittest.TestCase):
         self.assertTrue(curve.GetEndPoint(1).IsAlmostEqualTo(DB.XYZ(10,10,0)))
 
 
+class CurveCreateMany(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        logger.title('TESTING Curve Create Many...')
+
+    def test_detail_lines_many(self):
+        lines = [db.Line.new([0,n], [10,n]) for n in range(10)]
+        lines.append(db.Line.new([0,0,0], [0,0,10]))
+        with rpw.db.Transaction():
+            detail_curves, failures = db.Curve.create_detail_many(lines)
+        self.assertEqual(len(detail_curves), 10)
+        self.assertEqual(list(failures.keys()), [10])
+        with rpw.db.Transaction():
+            revit.doc.Delete(List[DB.ElementId]([c.Id for c in detail_curves]))
+
+    def test_model_lines_many(self):
+        lines = [db.Line.new([0,n], [10,n]) for n in range(10)]
+        with rpw.db.Transaction():
+            model_curves, failures = db.Curve.create_model_many(lines)
+        self.assertEqual(len(model_curves), 10)
+        self.assertIsInstance(model_curves[0], DB.ModelLine)
+        with rpw.db.Transaction():
+            revit.doc.Delete(List[DB.ElementId]([c.Id for c in model_curves]))
+
+    def test_model_curves_many_failures(self):
+        lines = [db.Line.new([0,n], [10,n]) for n in range(3)]
+        # End points are on the plane, but the arc is vertical
+        lines.append(DB.Arc.Create(DB.XYZ(0,0,0), DB.XYZ(10,0,0), DB.XYZ(5,0,5)))
+        lines.append(DB.Line.CreateUnbound(DB.XYZ(0,0,0), DB.XYZ.BasisX))
+        with rpw.db.Transaction():
+            model_curves, failures = db.Curve.create_model_many(lines)
+        self.assertEqual(len(model_curves), 3)
+        self.assertEqual(failures[3], 'not parallel to plane')
+        self.assertEqual(failures[4], 'unbound curve')
+        with rpw.db.Transaction():
+            revit.doc.Delete(List[DB.ElementId]([c.Id for c in model_curves]))
+
+    def test_model_line_reuses_sketch_plane(self):
+        with rpw.db.Transaction():
+            model_line_1 = db.Line.new([0,0], [10,0]).create_model()
+            model_line_2 = db.Line.new([0,5], [10,5]).create_model()
+        self.assertEqual(model_line_1.SketchPlane.Id, model_line_2.SketchPlane.Id)
+        with rpw.db.Transaction():
+            revit.doc.Delete(List[DB.ElementId]([model_line_1.Id, model_line_2.Id]))
+
+
 def run():
     logger.verbose(False)
     suite = unittest.TestLoader().discover(os.path.dirname(__file__))
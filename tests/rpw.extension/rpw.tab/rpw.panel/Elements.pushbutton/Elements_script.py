@@ -44,6 +44,7 @@ import rpw
 from rpw import revit, DB, UI
 from rpw.utils.dotnet import List
 from rpw.exceptions import RpwParameterNotFound, RpwWrongStorageType, RpwCoerceError
+from rpw.exceptions import RpwTypeError
 from rpw.utils.logger import logger
 
 import test_utils
@@ -103,6 +104,14 @@ class ElementTests(unittest.TestCase):
         element = rpw.db.Element.from_int(self.wall.Id.IntegerValue)
         self.assertIsInstance(element, rpw.db.Element)
 
+    def test_element_from_list_missing(self):
+        references = [self.wall.Id, DB.ElementId(99999999)]
+        with self.assertRaises(RpwTypeError):
+            rpw.db.Element.from_list(references)
+        elements = rpw.db.Element.from_list(references, skip_missing=True)
+        self.assertEqual(len(elements), 1)
+        self.assertEqual(elements[0].Id, self.wall.Id)
+
     def test_element_id(self):
         self.assertIsInstance(self.wrapped_wall, rpw.db.Element)
 
@@ -190,6 +199,44 @@ class ElementTests(unittest.TestCase):
         with self.assertRaises(RpwCoerceError) as context:
             self.wrapped_wall.parameters.builtins['PARAMETERD_DOES_NOT_EXIST']
 
+    def test_parameter_get_value_default(self):
+        rv = self.wrapped_wall.parameters.get_value('Parameter Name', 'Default')
+        self.assertEqual(rv, 'Default')
+
+    def test_parameter_get_value_include_type(self):
+        wall_type = self.wrapped_wall.type
+        width = wall_type.parameters['Width'].value
+        rv = self.wrapped_wall.parameters.get_value('Width', include_type=True)
+        self.assertEqual(rv, width)
+        rv = self.wrapped_wall.parameters.get_value('Width')
+        self.assertIsNone(rv)
+
+    def test_parameter_get_value_include_type_after_set(self):
+        wall_type = self.wrapped_wall.type
+        with rpw.db.Transaction('Set Type Comments'):
+            wall_type.parameters['Type Comments'] = 'Before'
+            rv = self.wrapped_wall.parameters.get_value('Type Comments', include_type=True)
+            self.assertEqual(rv, 'Before')
+            wall_type.parameters['Type Comments'] = 'After'
+            rv = self.wrapped_wall.parameters.get_value('Type Comments', include_type=True)
+            self.assertEqual(rv, 'After')
+
+    def test_unit_converter_round_trip(self):
+        converter = rpw.db.UnitConverter()
+        param = self.wrapped_wall.parameters['Unconnected Height']
+        internal = [param.value, 1.0]
+        display = converter.to_display(param, internal)
+        rv = converter.from_display(param, display)
+        self.assertAlmostEqual(rv[0], internal[0])
+        self.assertAlmostEqual(rv[1], internal[1])
+
+    def test_unit_converter_read_column(self):
+        converter = rpw.db.UnitConverter()
+        rv = converter.read_column([self.wall], 'Unconnected Height', display_units=False)
+        self.assertEqual(rv, [self.wrapped_wall.parameters['Unconnected Height'].value])
+        rv = converter.read_column([self.wall], 'Parameter Name')
+        self.assertEqual(rv, [None])
+
 
 #########################
 # Parameters / Isolated #
@@ -331,9 +378,41 @@ class WallTests(unittest.TestCase):
         wall = self.wall
         wall_type = rpw.db.Collector(of_class='WallType', where=lambda w: w.name == 'Wall 2').get_first(wrapped=False)
         with rpw.db.Transaction():
-            wall.change_type('Wall 2')
+            wall.change_type(wall_type)
         self.assertEqual(wall.wall_type.name, 'Wall 2')
 
+    def test_change_types_by_name(self):
+        with rpw.db.Transaction():
+            id_map = rpw.db.change_types([self.wall], 'Wall 2')
+        self.assertIsInstance(id_map, dict)
+        self.assertEqual(self.wall.get_wall_type().name, 'Wall 2')
+
+    def test_change_types_callable(self):
+        wall_type = rpw.db.WallType.by_name('Wall 2')
+        with rpw.db.Transaction():
+            rpw.db.change_types([self.wall.Id], lambda wall: wall_type)
+        self.assertEqual(self.wall.get_wall_type().name, 'Wall 2')
+
+    def test_change_types_by_name_many_categories(self):
+        """ Floor Type with the same name as the Wall Type """
+        floor_type = DB.FilteredElementCollector(revit.doc).OfClass(DB.FloorType).FirstElement()
+        level = DB.FilteredElementCollector(revit.doc).OfClass(DB.Level).FirstElement()
+        profile = DB.CurveArray()
+        points = [DB.XYZ(0, 0, 0), DB.XYZ(10, 0, 0), DB.XYZ(10, 10, 0), DB.XYZ(0, 10, 0)]
+        for pt1, pt2 in zip(points, points[1:] + points[:1]):
+            profile.Append(DB.Line.CreateBound(pt1, pt2))
+        with rpw.db.Transaction('Make Floor'):
+            new_floor_type = floor_type.Duplicate('Wall 2')
+            floor = revit.doc.Create.NewFloor(profile, floor_type, level, False)
+        try:
+            with rpw.db.Transaction():
+                rpw.db.change_types([self.wall, floor], 'Wall 2')
+            self.assertEqual(self.wall.get_wall_type().name, 'Wall 2')
+            self.assertEqual(floor.GetTypeId(), new_floor_type.Id)
+        finally:
+            with rpw.db.Transaction('Delete Floor'):
+                revit.doc.Delete(List[DB.ElementId]([floor.Id, new_floor_type.Id]))
+
 ##################
 # Rooms / Areas  #
 ##################
@@ -44,6 +44,7 @@ import rpw
 from rpw import revit, DB, UI
 from rpw.utils.dotnet import List
 from rpw.utils.logger import logger
+from rpw.exceptions import RpwValueError
 doc = rpw.revit.doc
 
 import test_utils
@@ -106,6 +107,7 @@ class TransactionsTest(unittest.TestCase):
 
     def test_transaction_group(self):
         with rpw.db.TransactionGroup('Multiple Transactions') as tg:
+            self.assertIsInstance(tg.unwrap(), DB.TransactionGroup)
             self.assertEqual(tg.GetStatus(), DB.TransactionStatus.Started)
             with rpw.db.Transaction('Set String') as t:
                 self.assertEqual(t.GetStatus(), DB.TransactionStatus.Started)
@@ -120,6 +122,150 @@ class TransactionsTest(unittest.TestCase):
             return param
         self.assertTrue(somefunction())
 
+    def test_transaction_decorator_nested(self):
+        @rpw.db.Transaction.ensure('Inner')
+        def inner():
+            self.wall.parameters['Comments'].value = 'Inner'
+            return rpw.db.Transaction.depth()
+
+        @rpw.db.Transaction.ensure('Outer')
+        def outer():
+            return inner()
+
+        self.assertEqual(outer(), 2)
+        self.assertEqual(rpw.db.Transaction.depth(), 0)
+        self.assertEqual(self.wall.parameters['Comments'].value, 'Inner')
+
+    def test_transaction_decorator_joins_context(self):
+        @rpw.db.Transaction.ensure('Inner', sub_transaction=True)
+        def inner():
+            self.wall.parameters['Comments'].value = 'Inner'
+
+        with rpw.db.Transaction('Outer') as t:
+            inner()
+            self.assertIs(rpw.db.Transaction.outermost(), t)
+            self.assertEqual(t.GetStatus(), DB.TransactionStatus.Started)
+        self.assertEqual(t.GetStatus(), DB.TransactionStatus.Committed)
+        self.assertIsNone(rpw.db.Transaction.outermost())
+
+    def test_write_queue(self):
+        with rpw.db.WriteQueue('Queued') as queue:
+            queue.set_parameter(self.wall, 'Comments', 'Queued')
+            queue.move(self.wall, (1, 0, 0))
+            queue.move(self.wall, (-1, 0, 0))
+            self.assertEqual(self.wall.parameters['Comments'].value, '')
+        self.assertEqual(self.wall.parameters['Comments'].value, 'Queued')
+        self.assertEqual(queue.summary['parameters_set'], 1)
+        self.assertEqual(queue.summary['moved'], 0)
+        self.assertEqual(len(queue), 0)
+
+    def test_transaction_deferred(self):
+        with rpw.db.Transaction('Deferred', deferred=True) as t:
+            t.queue.set_parameter(self.wall, 'Comments', 'Deferred')
+            self.assertEqual(self.wall.parameters['Comments'].value, '')
+        self.assertEqual(t.GetStatus(), DB.TransactionStatus.Committed)
+        self.assertEqual(self.wall.parameters['Comments'].value, 'Deferred')
+
+    def test_transaction_deferred_rollback(self):
+        with self.assertRaises(ZeroDivisionError):
+            with rpw.db.Transaction('Deferred', deferred=True) as t:
+                t.queue.set_parameter(self.wall, 'Comments', 'Deferred')
+                1 / 0
+        self.assertEqual(t.GetStatus(), DB.TransactionStatus.RolledBack)
+        self.assertEqual(len(t.queue), 0)
+        self.assertEqual(self.wall.parameters['Comments'].value, '')
+
+    def test_transaction_batched(self):
+        with rpw.db.Transaction.batched('Batched', chunk_size=2) as batch:
+            for n in batch.iterate(range(5)):
+                self.wall.parameters['Comments'].value = str(n)
+            self.assertEqual(batch.transaction.GetStatus(),
+                             DB.TransactionStatus.Started)
+        self.assertEqual(len(batch.chunk_times), 3)
+        self.assertEqual([c['operations'] for c in batch.chunk_times], [2, 2, 1])
+        self.assertEqual(self.wall.parameters['Comments'].value, '4')
+
+    def test_transaction_batched_rollback(self):
+        with self.assertRaises(ZeroDivisionError):
+            with rpw.db.Transaction.batched('Batched', chunk_size=1) as batch:
+                for n in batch.iterate(range(3)):
+                    self.wall.parameters['Comments'].value = 'Changed'
+                1 / 0
+        self.assertEqual(self.wall.parameters['Comments'].value, '')
+
+    def test_transaction_failures_report(self):
+        # Wall on top of the existing wall raises an overlap warning
+        wall_line = self.wall.Location.Curve
+        with rpw.db.Transaction('Failures', failures='suppress_warnings') as t:
+            overlapping_wall = DB.Wall.Create(doc, wall_line,
+                                              self.wall.LevelId, False)
+        try:
+            self.assertEqual(t.GetStatus(), DB.TransactionStatus.Committed)
+            self.assertIsInstance(t.failure_report, rpw.db.FailureReport)
+            self.assertEqual(len(t.failure_report.errors), 0)
+            self.assertGreater(len(t.failure_report.warnings), 0)
+            entry = t.failure_report.warnings[0]
+            self.assertEqual(entry['severity'], 'Warning')
+            self.assertEqual(entry['action'], 'deleted')
+            self.assertEqual(entry['transaction'], 'Failures')
+            self.assertIn(overlapping_wall.Id.IntegerValue, entry['element_ids'])
+            # Each failure is reported once
+            keys = [(e['description'], tuple(sorted(e['element_ids'])))
+                    for e in t.failure_report]
+            self.assertEqual(len(keys), len(set(keys)))
+        finally:
+            with rpw.db.Transaction('Delete Wall'):
+                doc.Delete(overlapping_wall.Id)
+
+    def test_transaction_failures_rollback_on_error(self):
+        failure = DB.BuiltInFailures.JoinElementsFailures.CannotJoinElementsError
+        with rpw.db.Transaction('Failures', failures='rollback_on_error') as t:
+            self.wall.parameters['Comments'].value = 'Failures'
+            message = DB.FailureMessage(failure)
+            message.SetFailingElement(self.wall.Id)
+            doc.PostFailure(message)
+        self.assertEqual(t.GetStatus(), DB.TransactionStatus.RolledBack)
+        self.assertEqual(len(t.failure_report.errors), 1)
+        entry = t.failure_report.errors[0]
+        self.assertEqual(entry['severity'], 'Error')
+        self.assertEqual(entry['action'], 'rolled_back')
+        self.assertEqual(entry['element_ids'], [self.wall.Id.IntegerValue])
+        self.assertEqual(self.wall.parameters['Comments'].value, '')
+
+    def test_transaction_failures_callable(self):
+        def handler(failures_accessor):
+            return DB.FailureProcessingResult.Continue
+        with rpw.db.Transaction('Failures', failures=handler) as t:
+            self.wall.parameters['Comments'].value = 'Failures'
+        self.assertEqual(t.GetStatus(), DB.TransactionStatus.Committed)
+
+    def test_transaction_failures_invalid_mode(self):
+        with self.assertRaises(RpwValueError):
+            rpw.db.Transaction('Failures', failures='ignore')
+
+    def test_transaction_metrics(self):
+        sink = rpw.db.metrics.RingBufferSink()
+        with rpw.db.Transaction('Metrics', metrics=sink) as t:
+            self.wall.parameters['Comments'].value = 'Metrics'
+        self.assertEqual(len(sink), 1)
+        self.assertIs(t.metrics, sink.records[0])
+        self.assertEqual(t.metrics.status, 'Committed')
+        self.assertEqual(t.metrics.modified, 1)
+        self.assertGreaterEqual(t.metrics.commit_seconds, 0.0)
+
+    def test_transaction_group_metrics(self):
+        with rpw.db.TransactionGroup('Group Metrics', metrics=True) as group:
+            for value in ('1', '2'):
+                with rpw.db.Transaction('Set String', metrics=False):
+                    self.wall.parameters['Comments'].value = value
+        self.assertEqual(group.metrics.kind, 'TransactionGroup')
+        self.assertEqual(group.metrics.modified, 1)
+
+    def test_transaction_metrics_disabled(self):
+        with rpw.db.Transaction('No Metrics') as t:
+            self.wall.parameters['Comments'].value = ''
+        self.assertIsNone(t.metrics)
+
 
 def run():
     # logger.verbose(False)
@@ -90,6 +90,56 @@ class CoerceTests(unittest.TestCase):
         elements = rpw.utils.coerce.to_elements([self.wall, self.wall.Id, self.wall.Id.IntegerValue])
         self.assertTrue(all([isinstance(e, DB.Element) for e in elements]))
 
+    def test_to_elements_doc(self):
+        elements = rpw.utils.coerce.to_elements([self.wall.Id], doc=revit.doc)
+        self.assertEqual(elements[0].Id, self.wall.Id)
+
+    def test_resolve_elements(self):
+        refs = [self.wall, self.wall.Id, self.wall.Id.IntegerValue, 99999999]
+        elements, missing_ids = rpw.utils.coerce.resolve_elements(refs)
+        self.assertEqual(len(elements), 3)
+        self.assertEqual(elements[2].Id, self.wall.Id)
+        self.assertEqual(missing_ids[0].IntegerValue, 99999999)
+
+    def test_resolve_elements_bulk(self):
+        wall_ids = rpw.db.Collector(of_class='Wall').get_element_ids()
+        elements, missing_ids = rpw.utils.coerce.resolve_elements(
+                                        wall_ids, bulk_threshold=1)
+        self.assertEqual([e.Id for e in elements], wall_ids)
+        self.assertEqual(missing_ids, [])
+
+    def test_document_cache_events_balanced(self):
+        from rpw.db import cache
+        calls = []
+        start, stop = cache._DocumentWatcher.start, cache._DocumentWatcher.stop
+        cache._DocumentWatcher.start = lambda watcher: calls.append('start')
+        cache._DocumentWatcher.stop = lambda watcher: calls.append('stop')
+        try:
+            cache.clear_all()
+            cache.element_cache.get(revit.doc)[1] = None
+            cache.element_type_cache.get(revit.doc)[1] = None
+            self.assertIn(revit.doc, cache._watchers)
+            cache.element_cache.clear(revit.doc)
+            self.assertIn(revit.doc, cache._watchers)
+            cache.clear_all(revit.doc)
+            self.assertNotIn(revit.doc, cache._watchers)
+            self.assertEqual(calls, ['start', 'stop'])
+        finally:
+            cache._DocumentWatcher.start, cache._DocumentWatcher.stop = start, stop
+
+    def test_resolve_elements_cache_bounded(self):
+        from rpw.db.cache import element_cache
+        max_size = element_cache.max_size
+        element_cache.max_size = 1
+        try:
+            element_cache.clear()
+            wall_ids = rpw.db.Collector(of_class='Wall').get_element_ids()
+            elements, _ = rpw.utils.coerce.resolve_elements(wall_ids)
+            self.assertEqual(len(elements), len(wall_ids))
+            self.assertLessEqual(len(element_cache.get()), 1)
+        finally:
+            element_cache.max_size = max_size
+
     def test_to_class_wall(self):
         self.assertIs(rpw.utils.coerce.to_class('Wall'), DB.Wall)
 
@@ -112,6 +162,47 @@ class CoerceTests(unittest.TestCase):
         self.assertIs(rpw.utils.coerce.to_category('stackedwalls'), DB.BuiltInCategory.OST_StackedWalls)
         self.assertIs(rpw.utils.coerce.to_category('stacked walls'), DB.BuiltInCategory.OST_StackedWalls)
 
+    def test_to_category_fuzzy_index(self):
+        BicEnum = rpw.db.BicEnum
+        self.assertEqual(BicEnum.fuzzy_index['walls'], 'OST_Walls')
+        self.assertIs(BicEnum.fuzzy_index, BicEnum.fuzzy_index)
+
+    def test_to_category_suggest(self):
+        suggestions = rpw.db.BicEnum.suggest('stackedwal')
+        self.assertEqual(suggestions[0], 'OST_StackedWalls')
+
+    def test_to_category_not_found(self):
+        from rpw.exceptions import RpwCoerceError
+        with self.assertRaises(RpwCoerceError):
+            rpw.utils.coerce.to_category('NotACategory')
+
+    def test_enum_table_category(self):
+        BicEnum = rpw.db.BicEnum
+        category_id = BicEnum.get_id('OST_Walls')
+        self.assertEqual(BicEnum.get_name(category_id), 'OST_Walls')
+        self.assertIs(BicEnum.from_category_id(category_id), DB.BuiltInCategory.OST_Walls)
+
+    def test_enum_table_parameter(self):
+        from rpw.db.builtins import bip_table
+        BipEnum = rpw.db.BipEnum
+        parameter_id = BipEnum.get_id('WALL_KEY_REF_PARAM')
+        self.assertEqual(BipEnum.get_name(parameter_id), 'WALL_KEY_REF_PARAM')
+        self.assertIs(BipEnum.from_id(parameter_id), DB.BuiltInParameter.WALL_KEY_REF_PARAM)
+        self.assertEqual(BipEnum.get_storage_type('WALL_KEY_REF_PARAM'), 'Integer')
+        self.assertTrue(os.path.exists(bip_table.path))
+
+    def test_to_element_ids_int_list(self):
+        element_ids = rpw.utils.coerce.to_element_ids([self.wall.Id.IntegerValue] * 3)
+        self.assertEqual(len(element_ids), 3)
+        self.assertIsInstance(element_ids[0], DB.ElementId)
+
+    def test_to_element_id_list_passthrough(self):
+        element_ids = List[DB.ElementId]([self.wall.Id])
+        self.assertIs(rpw.utils.coerce.to_element_id_list(element_ids), element_ids)
+
+    def test_to_iterable_string(self):
+        self.assertEqual(rpw.utils.coerce.to_iterable('Walls'), ['Walls'])
+
     def test_to_iterable(self):
         self.assertTrue([w for w in rpw.utils.coerce.to_iterable(self.wall)])
 
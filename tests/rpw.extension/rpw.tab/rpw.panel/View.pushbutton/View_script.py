@@ -48,6 +48,8 @@ from rpw.db import ViewSheet, ViewSchedule, View3D
 from rpw.db import ViewFamilyType
 from rpw.db import ViewType, ViewPlanType
 
+from rpw.exceptions import RpwValueError
+from rpw.utils.dotnet import List
 from rpw.utils.logger import logger
 
 # from rpw.utils.dotnet import List
@@ -151,6 +153,13 @@ class TestViewRelationships(unittest.TestCase):
         self.assertEqual(view_type.unwrap(), DB.ViewType.ThreeD)
         self.assertEqual(view_type.name, 'ThreeD')
 
+    def test_view_type_family_doc(self):
+        wrapped_view = Element(self.view_plan)
+        self.assertIs(wrapped_view.view_type.doc, wrapped_view.doc)
+        self.assertIs(wrapped_view.view_family.doc, wrapped_view.doc)
+        view_ids = [view.Id for view in wrapped_view.view_type.views]
+        self.assertIn(self.view_plan.Id, view_ids)
+
     def test_view_plan_level(self):
         wrapped_view = Element(self.view_plan)
         level = wrapped_view.level
@@ -188,6 +197,59 @@ class TestViewRelationships(unittest.TestCase):
         wrapped_view = rpw.db.ViewPlan.collect(where=lambda x: x.view_family_type.name == 'Floor Plan').wrapped_elements[0]
         self.assertEqual(wrapped_view.view_family_type.name, 'Floor Plan')
 
+    def test_view_index_cached(self):
+        index = rpw.db.ViewIndex.get()
+        self.assertIs(index, rpw.db.ViewIndex.get())
+        self.assertEqual(len(index), DB.FilteredElementCollector(revit.doc)
+                                       .OfClass(DB.View).GetElementCount())
+
+    def test_view_index_filters(self):
+        index = rpw.db.ViewIndex.get()
+        views = index.get_views(view_type=DB.ViewType.FloorPlan,
+                                level=self.view_plan.GenLevel)
+        self.assertIn(self.view_plan.Id, [view.Id for view in views])
+        for view in views:
+            self.assertEqual(view.view_type.unwrap(), DB.ViewType.FloorPlan)
+
+    def test_view_index_document_changed(self):
+        index = rpw.db.ViewIndex.get()
+        view_family_type = [vft for vft in DB.FilteredElementCollector(revit.doc)
+                            .OfClass(DB.ViewFamilyType)
+                            if vft.ViewFamily == DB.ViewFamily.ThreeDimensional][0]
+        # Raw API Transactions do not clear rpw caches on exit
+        t = DB.Transaction(revit.doc, 'Create View')
+        t.Start()
+        view = DB.View3D.CreateIsometric(revit.doc, view_family_type.Id)
+        t.Commit()
+        index = rpw.db.ViewIndex.get()
+        self.assertIn(view.Id, index.get_view_ids())
+        view_id = view.Id
+        t = DB.Transaction(revit.doc, 'Delete View')
+        t.Start()
+        revit.doc.Delete(view_id)
+        t.Commit()
+        self.assertNotIn(view_id, rpw.db.ViewIndex.get().get_view_ids())
+
+    def test_view_index_sheet(self):
+        index = rpw.db.ViewIndex.get()
+        for view_id in index.get_view_ids(sheet=self.view_sheet):
+            self.assertEqual(index.get_sheet_id(view_id), self.view_sheet.Id)
+
+    def test_view_repr(self):
+        wrapped_view_plan = Element(self.view_plan)
+        self.assertIn('name:{}'.format(self.view_plan.Name), repr(wrapped_view_plan))
+        self.assertNotIn('view_family_type', repr(wrapped_view_plan))
+        full_repr = wrapped_view_plan.full_repr()
+        self.assertIn('view_family_type', full_repr)
+        self.assertIs(full_repr, wrapped_view_plan.full_repr())
+        wrapped_view_plan.rich_repr = True
+        self.assertEqual(repr(wrapped_view_plan), full_repr)
+
+    def test_view_siblings(self):
+        wrapped_view_plan = Element(self.view_plan)
+        siblings = wrapped_view_plan.siblings
+        self.assertIn(self.view_plan.Id, [view.Id for view in siblings])
+
     # def test_view_family_type_name_get_setter(self):
     #     wrapped_view = rpw.db.ViewPlan.collect(where=lambda x: x.view_family_type.name == 'My Floor Plan').wrapped_elements[0]
     #     # self.assertEqual(wrapped_view.view_family_type.name, 'My Floor Plan')
@@ -356,6 +418,33 @@ class TestViewOverrides(unittest.TestCase):
         rv = self.view_plan.GetCategoryOverrides(DB.ElementId(DB.BuiltInCategory.OST_Furniture))
         self.assertTrue(rv.Halftone)
 
+    def test_halftone_id_list(self):
+        category_id = DB.ElementId(DB.BuiltInCategory.OST_Furniture)
+        target = List[DB.ElementId]([category_id, self.element.Id])
+        with rpw.db.Transaction():
+            self.wrapped_view.override.halftone(target, True)
+        self.assertTrue(self.view_plan.GetCategoryOverrides(category_id).Halftone)
+        self.assertTrue(self.view_plan.GetElementOverrides(self.element.Id).Halftone)
+
+    def test_apply_map(self):
+        override_map = {
+            self.element: {'projection_line': {'color': (0, 120, 255), 'weight': 5},
+                           'projection_fill': {'pattern': 'Horizontal'}},
+            'Furniture': {'halftone': True, 'detail_level': 'Fine'},
+            }
+        self.wrapped_view.override.apply_map(override_map)
+        rv = self.view_plan.GetElementOverrides(self.element.Id)
+        self.assertEqual(rv.ProjectionLineColor.Blue, 255)
+        self.assertEqual(rv.ProjectionLineWeight, 5)
+        self.assertEqual(rv.ProjectionFillPatternId, self.fillpattern_id)
+        rv = self.view_plan.GetCategoryOverrides(DB.ElementId(DB.BuiltInCategory.OST_Furniture))
+        self.assertTrue(rv.Halftone)
+        self.assertEqual(rv.DetailLevel, DB.ViewDetailLevel.Fine)
+
+    def test_apply_map_invalid_settings(self):
+        with self.assertRaises(RpwValueError):
+            self.wrapped_view.override.apply_map({self.element: {'colour': (0, 0, 0)}})
+
 
 def run():
     logger.verbose(False)
@@ -196,6 +196,70 @@ class XYZUsageTests(unittest.TestCase):
         self.assertEqual(pt.rotate(90, axis=axis), rotate_pt)
 
 
+######################
+# Vec3Tests
+######################
+
+class Vec3Tests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        logger.title('TESTING Vec3...')
+
+    def test_vec3_math(self):
+        from rpw.db.xyz import Vec3
+        v = (Vec3(1,2,3) + Vec3(1,0,0)) * 2
+        self.assertEqual(v, (4,4,6))
+        self.assertEqual(Vec3(1,0,0).cross(Vec3(0,1,0)), (0,0,1))
+        self.assertAlmostEqual(Vec3(3,4,0).length, 5.0)
+
+    def test_vec3_hash(self):
+        from rpw.db.xyz import Vec3
+        points = {Vec3(0,0,0): 'origin'}
+        self.assertEqual(points[Vec3(0,0,1e-12)], 'origin')
+
+    def test_vec3_xyz(self):
+        from rpw.db.xyz import Vec3
+        xyz = Vec3(1,2,3).to_xyz()
+        self.assertIsInstance(xyz, DB.XYZ)
+        self.assertEqual(XYZ(Vec3(1,2,3)), XYZ(1,2,3))
+        self.assertEqual(XYZ(1,2,3).as_vec3, Vec3(1,2,3))
+        self.assertEqual(XYZ(1,2,3) + Vec3(1,1,1), XYZ(2,3,4))
+
+
+######################
+# TransformMatrixTests
+######################
+
+class TransformMatrixTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        logger.title('TESTING TransformMatrix...')
+
+    def test_transform_matrix_compose(self):
+        from rpw.db.transform import TransformMatrix
+        matrix = TransformMatrix().rotate(90).move((10,0,0))
+        self.assertEqual(XYZ(matrix.apply((1,0,0))), XYZ(10,1,0))
+
+    def test_transform_matrix_apply_many(self):
+        from rpw.db.transform import TransformMatrix
+        matrix = TransformMatrix.translation((0,0,5))
+        points = matrix.apply_many([XYZ(0,0,0), DB.XYZ(1,1,1)])
+        self.assertEqual(points[1], (1,1,6))
+
+    def test_transform_matrix_native(self):
+        from rpw.db.transform import TransformMatrix
+        matrix = TransformMatrix.rotation(45, center=(1,1,0))
+        transform = matrix.to_transform()
+        native_point = transform.OfPoint(DB.XYZ(2,1,0))
+        self.assertEqual(XYZ(native_point), XYZ(matrix.apply((2,1,0))))
+        self.assertEqual(TransformMatrix.from_transform(transform), matrix)
+
+    def test_transform_move(self):
+        self.assertEqual(rpw.db.Transform.move((0,0,10), XYZ(1,1,1)), XYZ(1,1,11))
+
+
 def run():
     logger.verbose(False)
     suite = unittest.TestLoader().discover(os.path.dirname(__file__))